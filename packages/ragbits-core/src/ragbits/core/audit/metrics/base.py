@@ -36,6 +36,10 @@ class LLMMetric(Enum):
     INPUT_TOKENS = auto()
     TIME_TO_FIRST_TOKEN = auto()
 
+    # Counter metrics
+    CACHE_HITS = auto()
+    CACHE_MISSES = auto()
+
 
 # Global registry for all metrics by type
 METRICS_REGISTRY: dict[MetricType, dict[Any, Metric]] = {
@@ -70,6 +74,18 @@ METRICS_REGISTRY[MetricType.HISTOGRAM][LLMMetric.TIME_TO_FIRST_TOKEN] = Metric(
     unit="s",
     type=MetricType.HISTOGRAM,
 )
+METRICS_REGISTRY[MetricType.COUNTER][LLMMetric.CACHE_HITS] = Metric(
+    name="llm_cache_hits",
+    description="Counts the LLM responses served from the cache",
+    unit="responses",
+    type=MetricType.COUNTER,
+)
+METRICS_REGISTRY[MetricType.COUNTER][LLMMetric.CACHE_MISSES] = Metric(
+    name="llm_cache_misses",
+    description="Counts the LLM responses missing from the cache",
+    unit="responses",
+    type=MetricType.COUNTER,
+)
 
 
 def register_metric(key: str | Enum, metric: Metric) -> None:
@@ -1,14 +1,16 @@
 import asyncio
 import inspect
-from collections.abc import Callable, Iterator
+import sys
+from collections.abc import Callable, Iterator, Mapping
 from contextlib import ExitStack, contextmanager
-from functools import wraps
+from functools import lru_cache, wraps
 from types import SimpleNamespace
 from typing import Any, ParamSpec, TypeVar
 
-from ragbits.core.audit.traces.base import TraceHandler
+from ragbits.core.audit.traces.base import SpanExportQueue, TraceHandler
 
 __all__ = [
+    "SpanExportQueue",
     "TraceHandler",
     "clear_trace_handlers",
     "set_trace_handlers",
@@ -89,17 +91,19 @@ def trace(name: str | None = None, **inputs: Any) -> Iterator[SimpleNamespace]:
     Yields:
         The output data.
     """
-    # We need to go up 2 frames (trace() and __enter__()) to get the parent function.
-    parent_frame = inspect.stack()[2].frame
-    name = (
-        (
+    # Nothing is exported without handlers, so skip resolving the name and entering any spans.
+    if not _trace_handlers:
+        yield SimpleNamespace()
+        return
+
+    if name is None:
+        # We need to go up 2 frames (trace() and __enter__()) to get the parent function.
+        parent_frame = sys._getframe(2)
+        name = (
             f"{cls.__class__.__qualname__}.{parent_frame.f_code.co_name}"
             if (cls := parent_frame.f_locals.get("self"))
             else parent_frame.f_code.co_name
         )
-        if name is None
-        else name
-    )
 
     with ExitStack() as stack:
         outputs = [stack.enter_context(handler.trace(name, **inputs)) for handler in _trace_handlers]
@@ -121,6 +125,9 @@ def traceable(func: Callable[P, R]) -> Callable[P, R]:
 
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if not _trace_handlers:
+            return func(*args, **kwargs)
+
         inputs = _get_function_inputs(func, args, kwargs)
         with trace(name=func.__qualname__, **inputs) as outputs:
             returned = func(*args, **kwargs)
@@ -130,6 +137,9 @@ def traceable(func: Callable[P, R]) -> Callable[P, R]:
 
     @wraps(func)
     async def wrapper_async(*args: P.args, **kwargs: P.kwargs) -> R:
+        if not _trace_handlers:
+            return await func(*args, **kwargs)  # type: ignore
+
         inputs = _get_function_inputs(func, args, kwargs)
         with trace(name=func.__qualname__, **inputs) as outputs:
             returned = await func(*args, **kwargs)  # type: ignore
@@ -152,7 +162,7 @@ def _get_function_inputs(func: Callable, args: tuple, kwargs: dict) -> dict:
     Returns:
         The dictionary of inputs.
     """
-    sig_params = inspect.signature(func).parameters
+    sig_params = _get_signature_parameters(func)
     merged = {}
     pos_args_used = 0
 
@@ -169,3 +179,17 @@ def _get_function_inputs(func: Callable, args: tuple, kwargs: dict) -> dict:
     merged.update({k: v for k, v in kwargs.items() if k not in merged})
 
     return merged
+
+
+@lru_cache(maxsize=1024)
+def _get_signature_parameters(func: Callable) -> Mapping[str, inspect.Parameter]:
+    """
+    Get the parameters of the function signature, cached per function.
+
+    Args:
+        func: The function to get the parameters for.
+
+    Returns:
+        The mapping of parameter names to parameters.
+    """
+    return inspect.signature(func).parameters
@@ -1,25 +1,157 @@
+import atexit
+import logging
+import queue
+import random
+import threading
 from abc import ABC, abstractmethod
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
 from contextvars import ContextVar
 from types import SimpleNamespace
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, TypeVar, cast
 
 from ragbits.core.prompt.base import BasePrompt
 
+logger = logging.getLogger(__name__)
+
 SpanT = TypeVar("SpanT")
 
+# Marks spans skipped by sampling, so that the children of a skipped root span are skipped as well.
+_NOT_SAMPLED: Any = object()
+
+
+class SpanExportQueue:
+    """
+    Bounded queue of span export tasks (attribute formatting and span finalization) processed in batches
+    on a background thread, off the request path.
+
+    Tasks hold references to the span inputs and outputs rather than copies, so objects mutated by the caller
+    after the span ends (e.g. lists of entries or chat history) are exported in their mutated state, and
+    mutating them while the worker formats them may make the export of the span fail.
+    """
+
+    def __init__(self, max_size: int = 2048, max_batch_size: int = 512, block_on_full: bool = False) -> None:
+        """
+        Initialize the SpanExportQueue instance.
+
+        Args:
+            max_size: The maximum number of pending tasks.
+            max_batch_size: The maximum number of tasks processed by the worker at once.
+            block_on_full: Whether to block the caller when the queue is full. Otherwise new tasks are dropped.
+        """
+        self.max_batch_size = max_batch_size
+        self.block_on_full = block_on_full
+        self.dropped = 0
+        self._queue: queue.Queue[Callable[[], None] | threading.Event | None] = queue.Queue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+        atexit.register(self.shutdown)
+
+    def submit(self, task: Callable[[], None]) -> bool:
+        """
+        Schedule a task for the background worker. After shutdown, tasks are run in place.
+
+        Args:
+            task: The task to run.
+
+        Returns:
+            Whether the task was accepted, False if it was dropped because the queue was full.
+        """
+        if self._closed:
+            self._run(task)
+            return True
+
+        self._start_worker()
+        try:
+            self._queue.put(task, block=self.block_on_full)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until all tasks submitted so far are processed.
+
+        Args:
+            timeout: The maximum number of seconds to wait.
+
+        Returns:
+            Whether all tasks were processed before the timeout.
+        """
+        if self._worker is None or not self._worker.is_alive():
+            return True
+
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: float | None = 30.0) -> None:
+        """
+        Flush the pending tasks and stop the background worker.
+
+        Args:
+            timeout: The maximum number of seconds to wait for the pending tasks.
+        """
+        if self._closed:
+            return
+
+        self.flush(timeout)
+        self._closed = True
+        if self._worker is not None and self._worker.is_alive():
+            self._queue.put(None)
+            self._worker.join(timeout)
+        atexit.unregister(self.shutdown)
+
+    def _start_worker(self) -> None:
+        if self._worker is not None:
+            return
+
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._work, name="ragbits-span-export", daemon=True)
+                self._worker.start()
+
+    def _work(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for item in batch:
+                if item is None:
+                    return
+                if isinstance(item, threading.Event):
+                    item.set()
+                else:
+                    self._run(item)
+
+    @staticmethod
+    def _run(task: Callable[[], None]) -> None:
+        try:
+            task()
+        except Exception:
+            logger.exception("Failed to export span")
+
 
 class TraceHandler(Generic[SpanT], ABC):
     """
     Base class for all trace handlers.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, sample_rate: float = 1.0) -> None:
         """
         Initialize the TraceHandler instance.
+
+        Args:
+            sample_rate: The fraction of root spans to handle. The children of a skipped root span are skipped too.
         """
         super().__init__()
+        self.sample_rate = sample_rate
         self._spans = ContextVar[list[SpanT]]("_spans")
         self._spans.set([])
 
@@ -72,6 +204,14 @@ class TraceHandler(Generic[SpanT], ABC):
         self._spans.set(self._spans.get([])[:])
         current_span = self._spans.get()[-1] if self._spans.get() else None
 
+        if current_span is _NOT_SAMPLED or (current_span is None and not self._is_sampled()):
+            self._spans.get().append(cast(SpanT, _NOT_SAMPLED))
+            try:
+                yield SimpleNamespace()
+            finally:
+                self._spans.get().pop()
+            return
+
         span = self.start(
             name=name,
             inputs=inputs,
@@ -89,6 +229,9 @@ class TraceHandler(Generic[SpanT], ABC):
         span = self._spans.get().pop()
         self.stop(outputs=vars(outputs), current_span=span)
 
+    def _is_sampled(self) -> bool:
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate  # noqa: S311
+
 
 class AttributeFormatter:
     """
@@ -2,6 +2,7 @@ from typing import Any
 
 import logfire
 
+from ragbits.core.audit.traces.base import SpanExportQueue
 from ragbits.core.audit.traces.otel import OtelTraceHandler
 
 
@@ -10,9 +11,21 @@ class LogfireTraceHandler(OtelTraceHandler):
     Logfire trace handler.
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+    def __init__(
+        self,
+        *args: Any,  # noqa: ANN401
+        sample_rate: float = 1.0,
+        export_queue: SpanExportQueue | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
         """
         Initialize the LogfireTraceHandler instance.
+
+        Args:
+            args: The positional arguments passed to `logfire.configure`.
+            sample_rate: The fraction of root spans to export.
+            export_queue: The queue used to format attributes and end spans on a background worker.
+            kwargs: The keyword arguments passed to `logfire.configure`.
         """
         logfire.configure(*args, **kwargs)
-        super().__init__()
+        super().__init__(sample_rate=sample_rate, export_queue=export_queue)
@@ -1,6 +1,8 @@
+from time import time_ns
+
 from opentelemetry.trace import Span, StatusCode, TracerProvider, get_tracer, set_span_in_context
 
-from ragbits.core.audit.traces.base import TraceHandler, format_attributes
+from ragbits.core.audit.traces.base import SpanExportQueue, TraceHandler, format_attributes
 
 
 class OtelTraceHandler(TraceHandler[Span]):
@@ -8,15 +10,25 @@ class OtelTraceHandler(TraceHandler[Span]):
     OpenTelemetry trace handler.
     """
 
-    def __init__(self, provider: TracerProvider | None = None) -> None:
+    def __init__(
+        self,
+        provider: TracerProvider | None = None,
+        sample_rate: float = 1.0,
+        export_queue: SpanExportQueue | None = None,
+    ) -> None:
         """
         Initialize the OtelTraceHandler instance.
 
         Args:
             provider: The tracer provider to use.
+            sample_rate: The fraction of root spans to export.
+            export_queue: The queue used to format attributes and end spans on a background worker. If not provided,
+                this happens synchronously when the span ends. Span timings are captured in place either way.
         """
-        super().__init__()
+        super().__init__(sample_rate=sample_rate)
         self._tracer = get_tracer(instrumenting_module_name=__name__, tracer_provider=provider)
+        self._export_queue = export_queue
+        self._pending_inputs: dict[Span, dict] = {}
 
     def start(self, name: str, inputs: dict, current_span: Span | None = None) -> Span:
         """
@@ -31,12 +43,17 @@ class OtelTraceHandler(TraceHandler[Span]):
             The updated current trace span.
         """
         context = set_span_in_context(current_span) if current_span else None
-        with self._tracer.start_as_current_span(name, context=context, end_on_exit=False) as span:
-            attributes = format_attributes(inputs, prefix="inputs")
-            span.set_attributes(attributes)
+        span = self._tracer.start_span(name, context=context)
+        if not span.is_recording():
+            return span
+
+        if self._export_queue is not None:
+            self._pending_inputs[span] = inputs
+        else:
+            span.set_attributes(format_attributes(inputs, prefix="inputs"))
         return span
 
-    def stop(self, outputs: dict, current_span: Span) -> None:  # noqa: PLR6301
+    def stop(self, outputs: dict, current_span: Span) -> None:
         """
         Log output data at the end of the trace.
 
@@ -44,12 +61,9 @@ class OtelTraceHandler(TraceHandler[Span]):
             outputs: The output data.
             current_span: The current trace span.
         """
-        attributes = format_attributes(outputs, prefix="outputs")
-        current_span.set_attributes(attributes)
-        current_span.set_status(StatusCode.OK)
-        current_span.end()
+        self._end(current_span, outputs, prefix="outputs", status=StatusCode.OK)
 
-    def error(self, error: Exception, current_span: Span) -> None:  # noqa: PLR6301
+    def error(self, error: Exception, current_span: Span) -> None:
         """
         Log error during the trace.
 
@@ -57,7 +71,38 @@ class OtelTraceHandler(TraceHandler[Span]):
             error: The error that occurred.
             current_span: The current trace span.
         """
-        attributes = format_attributes({"message": str(error), **vars(error)}, prefix="error")
-        current_span.set_attributes(attributes)
-        current_span.set_status(StatusCode.ERROR)
-        current_span.end()
+        self._end(current_span, {"message": str(error), **vars(error)}, prefix="error", status=StatusCode.ERROR)
+
+    def _end(self, span: Span, data: dict, prefix: str, status: StatusCode) -> None:
+        """
+        Set the attributes and status of the span and end it, on the export queue if one is configured.
+
+        Args:
+            span: The span to end.
+            data: The output or error data.
+            prefix: The prefix of the data attributes.
+            status: The status of the span.
+        """
+        if not span.is_recording():
+            span.end()
+            return
+
+        if self._export_queue is None:
+            span.set_attributes(format_attributes(data, prefix=prefix))
+            span.set_status(status)
+            span.end()
+            return
+
+        inputs = self._pending_inputs.pop(span, {})
+        end_time = time_ns()
+
+        def export() -> None:
+            span.set_attributes(format_attributes(inputs, prefix="inputs"))
+            span.set_attributes(format_attributes(data, prefix=prefix))
+            span.set_status(status)
+            span.end(end_time=end_time)
+
+        if not self._export_queue.submit(export):
+            # The queue is full, so the attributes are dropped, but the span still ends to keep the trace consistent.
+            span.set_status(status)
+            span.end(end_time=end_time)
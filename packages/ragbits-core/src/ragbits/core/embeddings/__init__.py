@@ -1,10 +1,11 @@
 from .base import Embedder, EmbedderOptionsT, SparseVector, VectorSize
-from .dense import DenseEmbedder, LiteLLMEmbedder, NoopEmbedder
+from .dense import CachedEmbedder, DenseEmbedder, LiteLLMEmbedder, NoopEmbedder
 from .sparse import BagOfTokens, BagOfTokensOptions, SparseEmbedder, SparseEmbedderOptionsT
 
 __all__ = [
     "BagOfTokens",
     "BagOfTokensOptions",
+    "CachedEmbedder",
     "DenseEmbedder",
     "Embedder",
     "EmbedderOptionsT",
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import ClassVar, TypeVar
+from typing import Annotated, Any, ClassVar, TypeVar
 
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, BeforeValidator, ConfigDict, PlainSerializer, WithJsonSchema, model_validator
+from typing_extensions import Self
 
 from ragbits.core import embeddings
 from ragbits.core.options import Options
@@ -10,18 +12,73 @@ from ragbits.core.utils.config_handling import ConfigurableComponent
 EmbedderOptionsT = TypeVar("EmbedderOptionsT", bound=Options)
 
 
-class SparseVector(BaseModel):
-    """Sparse Vector representation"""
+def _array_field(dtype: type[np.generic], item_schema: dict[str, Any]) -> Any:  # noqa: ANN401
+    """
+    Creates the annotation of a field backed by a one-dimensional NumPy array, converted to a list when serialized.
+    """
+    return Annotated[
+        np.ndarray,
+        BeforeValidator(lambda value: np.asarray(value, dtype=dtype).reshape(-1)),
+        PlainSerializer(lambda value: value.tolist(), return_type=list),
+        WithJsonSchema({"type": "array", "items": item_schema}),
+    ]
+
+
+class SparseVector(BaseModel):  # noqa: PLW1641
+    """
+    Sparse Vector representation.
+
+    Non-zero positions are stored sorted and unique in an int32 array, with their values in a float32 array.
+    The arrays are converted to lists only when the vector is serialized.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    indices: _array_field(np.int32, {"type": "integer"})  # type: ignore[valid-type]
+    values: _array_field(np.float32, {"type": "number"})  # type: ignore[valid-type]
+
+    @model_validator(mode="after")
+    def validate_indices(self) -> Self:
+        """
+        Validates the lengths of the arrays and sorts the positions, summing up the values of repeated ones.
 
-    indices: list[int]
-    values: list[float]
+        Returns:
+            The validated vector.
 
-    def __post_init__(self) -> None:
+        Raises:
+            ValueError: If the numbers of positions and values differ.
+        """
         if len(self.indices) != len(self.values):
             raise ValueError("There should be the same number of non-zero values as non-zero positions")
 
+        if len(self.indices) > 1 and not np.all(self.indices[1:] > self.indices[:-1]):
+            indices, inverse = np.unique(self.indices, return_inverse=True)
+            self.indices = indices
+            self.values = np.bincount(inverse, weights=self.values, minlength=len(indices)).astype(np.float32)
+        return self
+
+    def dot(self, other: "SparseVector") -> float:
+        """
+        Computes the dot product with another sparse vector by intersecting their sorted positions.
+
+        Args:
+            other: The other sparse vector.
+
+        Returns:
+            The dot product of the vectors.
+        """
+        _, positions, other_positions = np.intersect1d(
+            self.indices, other.indices, assume_unique=True, return_indices=True
+        )
+        return float(np.dot(self.values[positions].astype(np.float64), other.values[other_positions]))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SparseVector):
+            return NotImplemented
+        return np.array_equal(self.indices, other.indices) and np.array_equal(self.values, other.values)
+
     def __repr__(self) -> str:
-        return f"SparseVector(indices={self.indices}, values={self.values})"
+        return f"SparseVector(indices={self.indices.tolist()}, values={self.values.tolist()})"
 
 
 class VectorSize(BaseModel):
@@ -1,8 +1,10 @@
 from .base import DenseEmbedder
+from .cached import CachedEmbedder
 from .litellm import LiteLLMEmbedder, LiteLLMEmbedderOptions
 from .noop import NoopEmbedder
 
 __all__ = [
+    "CachedEmbedder",
     "DenseEmbedder",
     "LiteLLMEmbedder",
     "LiteLLMEmbedderOptions",
@@ -0,0 +1,144 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+
+from ragbits.core.utils.batching import MicroBatcher
+
+EncodeFn = Callable[[Any, list[str], dict[str, Any]], np.ndarray]
+
+# The model loaded by the initializer of a process pool worker.
+_worker_model: Any = None
+
+
+def _init_worker(model_factory: Callable[[], Any]) -> None:
+    """
+    Loads the model once in a process pool worker.
+
+    Args:
+        model_factory: The function creating the model.
+    """
+    global _worker_model  # noqa: PLW0603
+    _worker_model = model_factory()
+
+
+def _encode_in_worker(encode: EncodeFn, data: list[str], kwargs: dict[str, Any]) -> np.ndarray:
+    """
+    Encodes the texts with the model loaded in the process pool worker.
+
+    Args:
+        encode: The function encoding texts with the model.
+        data: The texts to encode.
+        kwargs: The keyword arguments of the encode function.
+
+    Returns:
+        The float32 matrix of embeddings.
+    """
+    return encode(_worker_model, data, kwargs)
+
+
+class InferenceRunner:
+    """
+    Runs blocking model inference off the event loop, grouping concurrent calls into micro-batches.
+    """
+
+    def __init__(
+        self,
+        model: Any,  # noqa: ANN401
+        model_factory: Callable[[], Any],
+        encode: EncodeFn,
+        *,
+        max_workers: int | None = None,
+        use_process_pool: bool = False,
+        batch_window: float | None = None,
+    ) -> None:
+        """
+        Constructs a new InferenceRunner instance.
+
+        Args:
+            model: The model used by the thread pool.
+            model_factory: The picklable function creating the model in process pool workers.
+            encode: The picklable function encoding a list of texts with the model into a float32 matrix.
+            max_workers: The number of workers of the dedicated pool. If not set, threads run on the default executor
+                of the event loop and processes on as many workers as there are CPUs.
+            use_process_pool: Whether to run inference in a process pool with a copy of the model in each worker.
+            batch_window: The number of seconds to wait for concurrent calls with the same options, so that
+                their texts are encoded in a single forward pass. Disabled by default.
+        """
+        self.model = model
+        self.model_factory = model_factory
+        self.encode = encode
+        self.max_workers = max_workers
+        self.use_process_pool = use_process_pool
+        self.batch_window = batch_window
+        self._executor: Executor | None = None
+        self._batcher = MicroBatcher(self._encode, batch_window) if batch_window is not None else None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the dedicated pool, if it was created. A new pool is created if the runner is used again.
+
+        Args:
+            wait: Whether to wait for the running inference to finish.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _get_executor(self) -> Executor | None:
+        """
+        Returns the pool running inference, created on first use.
+
+        Returns:
+            The executor, or None to use the default executor of the event loop.
+        """
+        if self._executor is None:
+            if self.use_process_pool:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.model_factory,),
+                )
+            elif self.max_workers:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="embedder")
+        return self._executor
+
+    async def run(self, data: list[str], kwargs: dict[str, Any]) -> np.ndarray:
+        """
+        Encodes the texts off the event loop.
+
+        Args:
+            data: The texts to encode.
+            kwargs: The keyword arguments of the encode function.
+
+        Returns:
+            The float32 matrix of embeddings, one row per text.
+        """
+        if not data:
+            return np.empty((0, 0), dtype=np.float32)
+        if self._batcher is not None:
+            return await self._batcher.submit(data, kwargs)
+        return await self._encode(data, kwargs)
+
+    async def _encode(self, data: list[str], kwargs: dict[str, Any]) -> np.ndarray:
+        """
+        Encodes the texts in a single forward pass on the executor.
+
+        Args:
+            data: The texts to encode.
+            kwargs: The keyword arguments of the encode function.
+
+        Returns:
+            The float32 matrix of embeddings, one row per text.
+        """
+        loop = asyncio.get_running_loop()
+        if self.use_process_pool:
+            return await loop.run_in_executor(self._get_executor(), _encode_in_worker, self.encode, data, kwargs)
+        return await loop.run_in_executor(self._get_executor(), self.encode, self.model, data, kwargs)
@@ -0,0 +1,251 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from typing_extensions import Self
+
+from ragbits.core.audit.traces import trace
+from ragbits.core.embeddings.base import VectorSize
+from ragbits.core.embeddings.dense.base import DenseEmbedder
+from ragbits.core.options import Options
+from ragbits.core.utils.config_handling import ObjectConstructionConfig
+
+# SQLite limits the number of host parameters in a single statement.
+_SQLITE_BATCH_SIZE = 500
+
+
+class CachedEmbedder(DenseEmbedder[Options]):
+    """
+    Dense embedder wrapper caching embeddings by content, so unchanged texts and images are never embedded twice.
+
+    Embeddings are keyed on the wrapped model, the merged call options and the hash of the embedded content.
+    Hits are served from an in-process LRU cache backed by an optional on-disk SQLite store, while all misses
+    of a call are sent to the wrapped embedder in a single batch.
+
+    Only dense embedders can be wrapped, as the cache stores embeddings as float32 vectors.
+    """
+
+    options_cls = Options
+
+    def __init__(
+        self,
+        embedder: DenseEmbedder,
+        cache_path: str | Path | None = None,
+        max_memory_entries: int = 10_000,
+        namespace: str | None = None,
+        default_options: Options | None = None,
+    ) -> None:
+        """
+        Constructs a new CachedEmbedder instance.
+
+        Args:
+            embedder: The embedder to cache embeddings for.
+            cache_path: The path of the SQLite database persisting the embeddings. If not provided,
+                embeddings are cached in memory only.
+            max_memory_entries: The maximum number of embeddings kept in the in-process LRU cache.
+            namespace: The name identifying the wrapped model in cache keys. Defaults to the class and the model name
+                of the wrapped embedder.
+            default_options: The default options passed to the wrapped embedder, overridden by call options.
+        """
+        super().__init__(default_options=default_options)
+        self.embedder = embedder
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.max_memory_entries = max_memory_entries
+        self.namespace = namespace or ":".join(
+            filter(None, [type(embedder).__qualname__, getattr(embedder, "model_name", None)])
+        )
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict) -> Self:
+        """
+        Initializes the class with the provided configuration.
+
+        Args:
+            config: A dictionary containing configuration details for the class.
+
+        Returns:
+            An instance of the class initialized with the provided configuration.
+        """
+        default_options = config.pop("default_options", None)
+        options = cls.options_cls(**default_options) if default_options else None
+
+        embedder_config = config.pop("embedder")
+        embedder: DenseEmbedder = DenseEmbedder.subclass_from_config(
+            ObjectConstructionConfig.model_validate(embedder_config)
+        )
+
+        return cls(**config, default_options=options, embedder=embedder)
+
+    async def get_vector_size(self) -> VectorSize:
+        """
+        Get the vector size of the wrapped embedder.
+
+        Returns:
+            VectorSize object with the wrapped model's embedding dimension.
+        """
+        return await self.embedder.get_vector_size()
+
+    def image_support(self) -> bool:
+        """
+        Check if the wrapped embedder supports image embeddings.
+
+        Returns:
+            True if the wrapped embedder supports image embeddings, False otherwise.
+        """
+        return self.embedder.image_support()
+
+    async def embed_text(self, data: list[str], options: Options | None = None) -> list[list[float]]:
+        """
+        Creates embeddings for the given strings, embedding only the ones missing from the cache.
+
+        Args:
+            data: List of strings to get embeddings for.
+            options: Additional settings passed to the wrapped embedder.
+
+        Returns:
+            List of embeddings for the given strings.
+        """
+        call_options = self._call_options(options)
+        keys = [self._key("text", text.encode(), call_options) for text in data]
+        return await self._embed(keys, data, call_options, self.embedder.embed_text)
+
+    async def embed_image(self, images: list[bytes], options: Options | None = None) -> list[list[float]]:
+        """
+        Creates embeddings for the given images, embedding only the ones missing from the cache.
+
+        Args:
+            images: List of images to get embeddings for.
+            options: Additional settings passed to the wrapped embedder.
+
+        Returns:
+            List of embeddings for the given images.
+        """
+        call_options = self._call_options(options)
+        keys = [self._key("image", image, call_options) for image in images]
+        return await self._embed(keys, images, call_options, self.embedder.embed_image)
+
+    async def _embed(
+        self,
+        keys: list[str],
+        data: Sequence[Any],
+        options: Options,
+        embed: Callable[[Any, Any], Awaitable[list[list[float]]]],
+    ) -> list[list[float]]:
+        """
+        Serves the embeddings from the cache and embeds the missing ones in a single batch.
+
+        Args:
+            keys: The cache keys of the data.
+            data: The data to embed.
+            options: Additional settings passed to the wrapped embedder.
+            embed: The method of the wrapped embedder embedding the data.
+
+        Returns:
+            The embeddings of the data.
+        """
+        with trace(data_count=len(data), namespace=self.namespace, cache_path=self.cache_path) as outputs:
+            found = self._get_from_memory(keys)
+            missing = [key for key in dict.fromkeys(keys) if key not in found]
+            if missing and self.cache_path:
+                stored = await asyncio.to_thread(self._get_from_disk, missing)
+                self._put_in_memory(stored)
+                found.update(stored)
+                missing = [key for key in missing if key not in found]
+
+            if missing:
+                positions: dict[str, int] = {}
+                for position, key in enumerate(keys):
+                    positions.setdefault(key, position)
+                embeddings = await embed([data[positions[key]] for key in missing], options)
+                computed = {
+                    key: np.asarray(vector, dtype=np.float32) for key, vector in zip(missing, embeddings, strict=True)
+                }
+                if self.cache_path:
+                    await asyncio.to_thread(self._put_on_disk, computed)
+                self._put_in_memory(computed)
+                found.update(computed)
+
+            outputs.hits = len(keys) - len(missing)
+            outputs.misses = len(missing)
+            self.hits += outputs.hits
+            self.misses += outputs.misses
+            return [found[key].tolist() for key in keys]
+
+    def _call_options(self, options: Options | None) -> Options:
+        merged_options = (self.default_options | options) if options else self.default_options
+        return self.embedder.options_cls(**merged_options.model_dump())
+
+    def _key(self, kind: str, content: bytes, options: Options) -> str:
+        merged_options = self.embedder.default_options | options
+        digest = hashlib.sha256()
+        digest.update(self.namespace.encode())
+        digest.update(json.dumps(merged_options.dict(), sort_keys=True, default=str).encode())
+        digest.update(kind.encode())
+        digest.update(content)
+        return digest.hexdigest()
+
+    def _get_from_memory(self, keys: list[str]) -> dict[str, np.ndarray]:
+        found = {}
+        for key in keys:
+            if (vector := self._memory.get(key)) is not None:
+                self._memory.move_to_end(key)
+                found[key] = vector
+        return found
+
+    def _put_in_memory(self, vectors: dict[str, np.ndarray]) -> None:
+        for key, vector in vectors.items():
+            self._memory[key] = vector
+            self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)  # type: ignore[union-attr]
+            self._connection = sqlite3.connect(self.cache_path, check_same_thread=False)  # type: ignore[arg-type]
+            self._connection.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)")
+        return self._connection
+
+    def _get_from_disk(self, keys: list[str]) -> dict[str, np.ndarray]:
+        found = {}
+        with self._lock:
+            connection = self._get_connection()
+            for i in range(0, len(keys), _SQLITE_BATCH_SIZE):
+                batch = keys[i : i + _SQLITE_BATCH_SIZE]
+                rows = connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({', '.join('?' * len(batch))})",  # noqa: S608
+                    batch,
+                )
+                found.update({key: np.frombuffer(vector, dtype=np.float32) for key, vector in rows})
+        return found
+
+    def _put_on_disk(self, vectors: dict[str, np.ndarray]) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in vectors.items()],
+                )
@@ -1,9 +1,13 @@
 from collections.abc import Callable
+from functools import partial
+from typing import Any
 
+import numpy as np
 from fastembed import TextEmbedding
 
 from ragbits.core.audit.traces import trace
 from ragbits.core.embeddings.base import VectorSize
+from ragbits.core.embeddings.dense._inference import InferenceRunner
 from ragbits.core.embeddings.dense.base import DenseEmbedder, EmbedderOptionsT
 from ragbits.core.options import Options
 
@@ -17,6 +21,10 @@ class FastEmbedOptions(Options):
     parallel: int | None = None
 
 
+def _encode(model: TextEmbedding, data: list[str], kwargs: dict[str, Any]) -> np.ndarray:
+    return np.asarray(list(model.embed(data, **kwargs)), dtype=np.float32)
+
+
 class FastEmbedEmbedder(DenseEmbedder[FastEmbedOptions]):
     """
     Class for creating dense text embeddings using FastEmbed library.
@@ -26,23 +34,75 @@ class FastEmbedEmbedder(DenseEmbedder[FastEmbedOptions]):
     options_cls = FastEmbedOptions
     _model: TextEmbedding
 
-    def __init__(self, model_name: str, use_gpu: bool = False, default_options: FastEmbedOptions | None = None):
+    def __init__(
+        self,
+        model_name: str,
+        use_gpu: bool = False,
+        default_options: FastEmbedOptions | None = None,
+        *,
+        max_workers: int | None = None,
+        use_process_pool: bool = False,
+        batch_window: float | None = None,
+    ):
+        """
+        Constructs a new FastEmbedEmbedder instance.
+
+        Args:
+            model_name: Name of the FastEmbed model to use.
+            use_gpu: Whether to run the model with the CUDA execution provider.
+            default_options: Default options for the embedding model.
+            max_workers: The number of workers running inference. If not set, inference runs on the default
+                thread pool of the event loop.
+            use_process_pool: Whether to run inference in a process pool, loading the model in each worker.
+            batch_window: The number of seconds to wait for concurrent `embed_text` calls with the same options,
+                so that their texts are encoded in a single forward pass. Disabled by default.
+        """
         super().__init__(default_options=default_options)
         self.model_name = model_name
         self.use_gpu = use_gpu
-        if use_gpu:
-            self._model = TextEmbedding(model_name=model_name, providers=["CUDAExecutionProvider"])
-        else:
-            self._model = TextEmbedding(model_name=model_name)
-
-    def __reduce__(self) -> tuple[Callable, tuple[str, bool, FastEmbedOptions | None]]:
+        self.max_workers = max_workers
+        self.use_process_pool = use_process_pool
+        self.batch_window = batch_window
+        model_factory = (
+            partial(TextEmbedding, model_name=model_name, providers=["CUDAExecutionProvider"])
+            if use_gpu
+            else partial(TextEmbedding, model_name=model_name)
+        )
+        self._model = model_factory()
+        self._runner = InferenceRunner(
+            self._model,
+            model_factory,
+            _encode,
+            max_workers=max_workers,
+            use_process_pool=use_process_pool,
+            batch_window=batch_window,
+        )
+
+    def __reduce__(self) -> tuple[Callable, tuple]:
         """
         Makes the FastEmbedEmbedder class picklable by defining how it should be reconstructed.
 
         Returns:
             The tuple of function and its arguments that allows reconstruction of the FastEmbedEmbedder.
         """
-        return (self.__class__, (self.model_name, self.use_gpu, self.default_options))
+        return (
+            partial(
+                self.__class__,
+                max_workers=self.max_workers,
+                use_process_pool=self.use_process_pool,
+                batch_window=self.batch_window,
+            ),
+            (self.model_name, self.use_gpu, self.default_options),
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the dedicated inference pool, if one was created.
+
+        Args:
+            wait: Whether to wait for the running inference to finish.
+        """
+        self._runner.shutdown(wait=wait)
 
     async def get_vector_size(self) -> VectorSize:
         """
@@ -79,6 +139,6 @@ class FastEmbedEmbedder(DenseEmbedder[FastEmbedOptions]):
         with trace(
             data=data, model_name=self.model_name, model_obj=repr(self._model), options=merged_options.dict()
         ) as outputs:
-            embeddings = [[float(x) for x in result] for result in self._model.embed(data, **merged_options.dict())]
+            embeddings = (await self._runner.run(data, merged_options.dict())).tolist()
             outputs.embeddings = embeddings
         return embeddings
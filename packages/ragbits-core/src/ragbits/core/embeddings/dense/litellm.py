@@ -1,3 +1,6 @@
+import asyncio
+from collections.abc import Iterator
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, Any, cast
 
 from typing_extensions import Self
@@ -13,11 +16,15 @@ from ragbits.core.embeddings.exceptions import (
 )
 from ragbits.core.options import Options
 from ragbits.core.types import NOT_GIVEN, NotGiven
+from ragbits.core.utils.batching import MicroBatcher
 from ragbits.core.utils.lazy_litellm import LazyLiteLLM
 
 if TYPE_CHECKING:
     from litellm import Router
 
+# Rough number of characters per token, used to estimate the size of batches without running a tokenizer.
+_CHARS_PER_TOKEN = 4
+
 
 class LiteLLMEmbedderOptions(Options):
     """
@@ -48,6 +55,10 @@ class LiteLLMEmbedder(DenseEmbedder[LiteLLMEmbedderOptions], LazyLiteLLM):
         api_key: str | None = None,
         api_version: str | None = None,
         router: "Router | None" = None,
+        max_batch_size: int | None = None,
+        max_batch_tokens: int | None = None,
+        max_concurrency: int | None = None,
+        coalesce_window: float | None = None,
     ) -> None:
         """
         Constructs the LiteLLMEmbeddingClient.
@@ -63,6 +74,12 @@ class LiteLLMEmbedder(DenseEmbedder[LiteLLMEmbedderOptions], LazyLiteLLM):
                 [LiteLLM documentation](https://docs.litellm.ai/docs/embedding/supported_embedding).
             api_version: The API version for the call.
             router: Router to be used to [route requests](https://docs.litellm.ai/docs/routing) to different models.
+            max_batch_size: The maximum number of texts sent in a single request. Larger inputs are split
+                into multiple requests.
+            max_batch_tokens: The maximum estimated number of tokens sent in a single request.
+            max_concurrency: The maximum number of requests in flight at once, shared by all concurrent calls.
+            coalesce_window: The number of seconds to wait for concurrent `embed_text` calls with the same options,
+                so that their texts are embedded in a single request. Disabled by default.
         """
         super().__init__(default_options=default_options)
 
@@ -71,6 +88,21 @@ class LiteLLMEmbedder(DenseEmbedder[LiteLLMEmbedderOptions], LazyLiteLLM):
         self.api_key = api_key
         self.api_version = api_version
         self.router = router
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.max_concurrency = max_concurrency
+        self.coalesce_window = coalesce_window
+        self._semaphore: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
+        self._batcher = (
+            MicroBatcher(self._embed_batches, coalesce_window, key=LiteLLMEmbedderOptions.dict)
+            if coalesce_window
+            else None
+        )
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_semaphore"] = None
+        return state
 
     async def get_vector_size(self) -> VectorSize:
         """
@@ -114,40 +146,119 @@ class LiteLLMEmbedder(DenseEmbedder[LiteLLMEmbedderOptions], LazyLiteLLM):
         """
         merged_options = (self.default_options | options) if options else self.default_options
 
-        with trace(
-            data=data,
-            model=self.model_name,
-            api_base=self.api_base,
-            api_version=self.api_version,
-            options=merged_options.dict(),
-        ) as outputs:
-            try:
-                entrypoint = self.router or self._litellm
-                response = await entrypoint.aembedding(
-                    input=data,
-                    model=self.model_name,
-                    api_base=self.api_base,
-                    api_key=self.api_key,
-                    api_version=self.api_version,
-                    **merged_options.dict(),
-                )
-            except self._litellm.openai.APIConnectionError as exc:
-                raise EmbeddingConnectionError() from exc
-            except self._litellm.openai.APIStatusError as exc:
-                raise EmbeddingStatusError(exc.message, exc.status_code) from exc
-            except self._litellm.openai.APIResponseValidationError as exc:
-                raise EmbeddingResponseError() from exc
-
-            if not response.data:
-                raise EmbeddingEmptyResponseError()
-
-            outputs.embeddings = [embedding["embedding"] for embedding in response.data]
-            if response.usage:
-                outputs.completion_tokens = response.usage.completion_tokens
-                outputs.prompt_tokens = response.usage.prompt_tokens
-                outputs.total_tokens = response.usage.total_tokens
-
-        return outputs.embeddings
+        if self._batcher is not None:
+            return await self._batcher.submit(data, merged_options)
+        return await self._embed_batches(data, merged_options)
+
+    async def _embed_batches(self, data: list[str], options: LiteLLMEmbedderOptions) -> list[list[float]]:
+        """
+        Splits the texts into batches respecting the size limits and embeds them with limited concurrency.
+
+        Args:
+            data: List of strings to get embeddings for.
+            options: The merged options of the call.
+
+        Returns:
+            List of embeddings for the given strings.
+        """
+        batches = list(self._split_batches(data))
+        if len(batches) == 1:
+            return await self._embed_batch(batches[0], options)
+
+        results = await asyncio.gather(*(self._embed_batch(batch, options) for batch in batches))
+        return [embedding for result in results for embedding in result]
+
+    def _split_batches(self, data: list[str]) -> Iterator[list[str]]:
+        """
+        Splits the texts into consecutive batches within the item and estimated token limits.
+
+        Args:
+            data: List of strings to split.
+
+        Yields:
+            The batches of strings.
+        """
+        batch: list[str] = []
+        batch_tokens = 0
+        for text in data:
+            text_tokens = len(text) // _CHARS_PER_TOKEN + 1
+            if batch and (
+                (self.max_batch_size and len(batch) >= self.max_batch_size)
+                or (self.max_batch_tokens and batch_tokens + text_tokens > self.max_batch_tokens)
+            ):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += text_tokens
+        yield batch
+
+    def _get_semaphore(self) -> asyncio.Semaphore | None:
+        """
+        Returns the semaphore limiting the requests in flight, created once per event loop.
+
+        Returns:
+            The semaphore, or None if the concurrency is not limited.
+        """
+        if not self.max_concurrency:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore[0] is not loop:
+            self._semaphore = (loop, asyncio.Semaphore(self.max_concurrency))
+        return self._semaphore[1]
+
+    async def _embed_batch(self, data: list[str], merged_options: LiteLLMEmbedderOptions) -> list[list[float]]:
+        """
+        Creates embeddings for the given strings in a single request.
+
+        Args:
+            data: List of strings to get embeddings for.
+            merged_options: The merged options of the call.
+
+        Returns:
+            List of embeddings for the given strings.
+
+        Raises:
+            EmbeddingConnectionError: If there is a connection error with the embedding API.
+            EmbeddingEmptyResponseError: If the embedding API returns an empty response.
+            EmbeddingStatusError: If the embedding API returns an error status code.
+            EmbeddingResponseError: If the embedding API response is invalid.
+        """
+        async with self._get_semaphore() or nullcontext():
+            with trace(
+                data=data,
+                model=self.model_name,
+                api_base=self.api_base,
+                api_version=self.api_version,
+                options=merged_options.dict(),
+            ) as outputs:
+                try:
+                    entrypoint = self.router or self._litellm
+                    response = await entrypoint.aembedding(
+                        input=data,
+                        model=self.model_name,
+                        api_base=self.api_base,
+                        api_key=self.api_key,
+                        api_version=self.api_version,
+                        **merged_options.dict(),
+                    )
+                except self._litellm.openai.APIConnectionError as exc:
+                    raise EmbeddingConnectionError() from exc
+                except self._litellm.openai.APIStatusError as exc:
+                    raise EmbeddingStatusError(exc.message, exc.status_code) from exc
+                except self._litellm.openai.APIResponseValidationError as exc:
+                    raise EmbeddingResponseError() from exc
+
+                if not response.data:
+                    raise EmbeddingEmptyResponseError()
+
+                outputs.embeddings = [embedding["embedding"] for embedding in response.data]
+                if response.usage:
+                    outputs.completion_tokens = response.usage.completion_tokens
+                    outputs.prompt_tokens = response.usage.prompt_tokens
+                    outputs.total_tokens = response.usage.total_tokens
+
+            return outputs.embeddings
 
     @classmethod
     def from_config(cls, config: dict[str, Any]) -> Self:
@@ -1,8 +1,12 @@
 from dataclasses import field
+from functools import partial
 from typing import Any
 
+import numpy as np
+
 from ragbits.core.audit.traces import trace
 from ragbits.core.embeddings.base import VectorSize
+from ragbits.core.embeddings.dense._inference import InferenceRunner
 from ragbits.core.embeddings.dense.base import DenseEmbedder
 from ragbits.core.options import Options
 
@@ -22,6 +26,10 @@ class LocalEmbedderOptions(Options):
     encode_kwargs: dict = field(default_factory=dict)
 
 
+def _encode(model: "SentenceTransformer", data: list[str], kwargs: dict[str, Any]) -> np.ndarray:
+    return np.asarray(model.encode(data, **kwargs), dtype=np.float32)
+
+
 class LocalEmbedder(DenseEmbedder[LocalEmbedderOptions]):
     """
     Class for interaction with any encoder available in HuggingFace.
@@ -35,6 +43,10 @@ class LocalEmbedder(DenseEmbedder[LocalEmbedderOptions]):
         self,
         model_name: str,
         default_options: LocalEmbedderOptions | None = None,
+        *,
+        max_workers: int | None = None,
+        use_process_pool: bool = False,
+        batch_window: float | None = None,
         **model_kwargs: Any,  # noqa: ANN401
     ) -> None:
         """
@@ -43,6 +55,11 @@ class LocalEmbedder(DenseEmbedder[LocalEmbedderOptions]):
         Args:
             model_name: Name of the model to use.
             default_options: Default options for the embedding model.
+            max_workers: The number of workers running inference. If not set, inference runs on the default
+                thread pool of the event loop.
+            use_process_pool: Whether to run inference in a process pool, loading the model in each worker.
+            batch_window: The number of seconds to wait for concurrent `embed_text` calls with the same options,
+                so that their texts are encoded in a single forward pass. Disabled by default.
             model_kwargs: Additional arguments to pass to the SentenceTransformer.
 
         Raises:
@@ -55,6 +72,23 @@ class LocalEmbedder(DenseEmbedder[LocalEmbedderOptions]):
 
         self.model_name = model_name
         self.model = SentenceTransformer(self.model_name, **model_kwargs)
+        self._runner = InferenceRunner(
+            self.model,
+            partial(SentenceTransformer, self.model_name, **model_kwargs),
+            _encode,
+            max_workers=max_workers,
+            use_process_pool=use_process_pool,
+            batch_window=batch_window,
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the dedicated inference pool, if one was created.
+
+        Args:
+            wait: Whether to wait for the running inference to finish.
+        """
+        self._runner.shutdown(wait=wait)
 
     async def get_vector_size(self) -> VectorSize:
         """
@@ -87,5 +121,6 @@ class LocalEmbedder(DenseEmbedder[LocalEmbedderOptions]):
             model_obj=repr(self.model),
             options=merged_options.dict(),
         ) as outputs:
-            outputs.embeddings = self.model.encode(data, **merged_options.encode_kwargs).tolist()
+            embeddings = await self._runner.run(data, merged_options.encode_kwargs)
+            outputs.embeddings = embeddings.tolist()
         return outputs.embeddings
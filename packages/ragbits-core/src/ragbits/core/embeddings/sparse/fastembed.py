@@ -53,7 +53,9 @@ class FastEmbedSparseEmbedder(SparseEmbedder[FastEmbedOptions]):
         else:
             sample_embedding = await self.embed_text(["sample text with various tokens"])
             vocab_size = (
-                max(sample_embedding[0].indices) + 1 if sample_embedding and sample_embedding[0].indices else 30000
+                int(sample_embedding[0].indices.max()) + 1
+                if sample_embedding and len(sample_embedding[0].indices)
+                else 30000
             )
 
         return VectorSize(size=vocab_size, is_sparse=True)
@@ -74,7 +76,7 @@ class FastEmbedSparseEmbedder(SparseEmbedder[FastEmbedOptions]):
             data=data, model_name=self.model_name, model_obj=repr(self._model), options=merged_options.dict()
         ) as outputs:
             outputs.embeddings = [
-                SparseVector(values=[float(x) for x in result.values], indices=[int(x) for x in result.indices])
+                SparseVector(values=result.values, indices=result.indices)
                 for result in self._model.embed(data, **merged_options.dict())
             ]
         return outputs.embeddings
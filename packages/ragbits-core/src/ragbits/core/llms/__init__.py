@@ -1,5 +1,17 @@
 from .base import LLM, ToolCall, Usage
+from .cache import LLMCache
 from .litellm import LiteLLM, LiteLLMOptions
 from .local import LocalLLM, LocalLLMOptions
+from .scheduler import LLMScheduler
 
-__all__ = ["LLM", "LiteLLM", "LiteLLMOptions", "LocalLLM", "LocalLLMOptions", "ToolCall", "Usage"]
+__all__ = [
+    "LLM",
+    "LLMCache",
+    "LLMScheduler",
+    "LiteLLM",
+    "LiteLLMOptions",
+    "LocalLLM",
+    "LocalLLMOptions",
+    "ToolCall",
+    "Usage",
+]
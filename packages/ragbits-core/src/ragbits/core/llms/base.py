@@ -5,12 +5,13 @@ from collections.abc import AsyncGenerator, AsyncIterator, Callable, MutableSequ
 from typing import ClassVar, Generic, Literal, TypeVar, Union, cast, overload
 
 from pydantic import BaseModel, Field, field_validator
-from typing_extensions import deprecated
+from typing_extensions import Self, deprecated
 
 from ragbits.core import llms
 from ragbits.core.audit.metrics import record_metric
 from ragbits.core.audit.metrics.base import LLMMetric, MetricType
 from ragbits.core.audit.traces import trace
+from ragbits.core.llms.cache import LLMCache
 from ragbits.core.options import Options
 from ragbits.core.prompt.base import (
     BasePrompt,
@@ -268,24 +269,43 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
     default_module: ClassVar = llms
     configuration_key: ClassVar = "llm"
 
-    def __init__(self, model_name: str, default_options: LLMClientOptionsT | None = None) -> None:
+    def __init__(
+        self, model_name: str, default_options: LLMClientOptionsT | None = None, *, cache: LLMCache | None = None
+    ) -> None:
         """
         Constructs a new LLM instance.
 
         Args:
             model_name: Name of the model to be used.
             default_options: Default options to be used.
+            cache: Cache of the responses, serving the responses to identical requests without calling the model.
 
         Raises:
             TypeError: If the subclass is missing the 'options_cls' attribute.
         """
         super().__init__(default_options=default_options)
         self.model_name = model_name
+        self.cache = cache
 
     def __init_subclass__(cls) -> None:
         if not hasattr(cls, "options_cls"):
             raise TypeError(f"Class {cls.__name__} is missing the 'options_cls' attribute")
 
+    @classmethod
+    def from_config(cls, config: dict) -> Self:
+        """
+        Initializes the class with the provided configuration.
+
+        Args:
+            config: A dictionary containing configuration details for the class.
+
+        Returns:
+            An instance of the class initialized with the provided configuration.
+        """
+        if "cache" in config:
+            config["cache"] = LLMCache(**config["cache"])
+        return super().from_config(config)
+
     @abstractmethod
     def get_model_id(self) -> str:
         """
@@ -378,6 +398,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         *,
         tools: None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> PromptOutputT: ...
 
     @overload
@@ -388,6 +409,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: None = None,
         tool_choice: None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> PromptOutputT: ...
 
     @overload
@@ -398,6 +420,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: None = None,
         tool_choice: None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> list[PromptOutputT]: ...
 
     @overload
@@ -408,6 +431,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: list[Tool],
         tool_choice: ToolChoiceWithCallable | None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> PromptOutputT | list[ToolCall]: ...
 
     @overload
@@ -418,6 +442,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: list[Tool],
         tool_choice: ToolChoiceWithCallable | None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> list[PromptOutputT | list[ToolCall]]: ...
 
     @overload
@@ -428,6 +453,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: None = None,
         tool_choice: None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> str: ...
 
     @overload
@@ -438,6 +464,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: None = None,
         tool_choice: None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> list[str]: ...
 
     @overload
@@ -448,6 +475,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: list[Tool],
         tool_choice: ToolChoiceWithCallable | None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> str | list[ToolCall]: ...
 
     @overload
@@ -458,6 +486,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: list[Tool],
         tool_choice: ToolChoiceWithCallable | None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> list[str | list[ToolCall]]: ...
 
     async def generate(
@@ -472,6 +501,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: list[Tool] | None = None,
         tool_choice: ToolChoiceWithCallable | None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> str | PromptOutputT | list[ToolCall] | list[list[ToolCall] | str] | list[str | PromptOutputT | list[ToolCall]]:
         """
         Prepares and sends a prompt to the LLM and returns the parsed response.
@@ -490,11 +520,14 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
                 - dict: tool dict corresponding to one of provided tools
                 - Callable: one of provided tools
             options: Options to use for the LLM client.
+            use_cache: Whether to serve the response from the cache of the LLM and cache it, if the cache is set.
 
         Returns:
             Parsed response(s) from LLM or list of tool calls.
         """
-        response = await self.generate_with_metadata(prompt, tools=tools, tool_choice=tool_choice, options=options)
+        response = await self.generate_with_metadata(
+            prompt, tools=tools, tool_choice=tool_choice, options=options, use_cache=use_cache
+        )
         if isinstance(response, list):
             return [r.tool_calls if tools and r.tool_calls else r.content for r in response]
         else:
@@ -508,6 +541,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: list[Tool] | None = None,
         tool_choice: ToolChoiceWithCallable | None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> LLMResponseWithMetadata[PromptOutputT]: ...
 
     @overload
@@ -518,6 +552,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: list[Tool] | None = None,
         tool_choice: ToolChoiceWithCallable | None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> list[LLMResponseWithMetadata[PromptOutputT]]: ...
 
     @overload
@@ -528,6 +563,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: list[Tool] | None = None,
         tool_choice: ToolChoiceWithCallable | None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> LLMResponseWithMetadata[str]: ...
 
     @overload
@@ -538,6 +574,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: list[Tool] | None = None,
         tool_choice: ToolChoiceWithCallable | None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> list[LLMResponseWithMetadata[str]]: ...
 
     async def generate_with_metadata(
@@ -552,6 +589,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: list[Tool] | None = None,
         tool_choice: ToolChoiceWithCallable | None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> (
         LLMResponseWithMetadata[str]
         | list[LLMResponseWithMetadata[str]]
@@ -576,6 +614,8 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
                 - dict: tool dict corresponding to one of provided tools
                 - Callable: one of provided tools
             options: Options to use for the LLM client.
+            use_cache: Whether to serve the responses from the cache of the LLM and cache them, if the cache is set.
+                Responses served from the cache have the `cached` key set in their metadata.
 
         Returns:
             ResponseWithMetadata object(s) with text response, list of tool calls and metadata information.
@@ -595,11 +635,12 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         merged_options = (self.default_options | options) if options else self.default_options
 
         with trace(name="generate", model_name=self.model_name, prompt=prompts, options=repr(options)) as outputs:
-            results = await self._call(
-                prompt=prompts,
+            results = await self._call_with_cache(
+                prompts=prompts,
                 options=merged_options,
                 tools=parsed_tools,
                 tool_choice=parsed_tool_choice,
+                use_cache=use_cache,
             )
 
             parsed_responses = []
@@ -635,7 +676,11 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
                 parsed_responses.append(response_with_metadata)
             outputs.response = parsed_responses
 
-            prompt_tokens = sum(r.usage.prompt_tokens for r in parsed_responses if r.usage)
+            # Responses served from the cache are left out of the metrics of the requests sent to the LLM
+            sent_responses = [
+                r for r, result in zip(parsed_responses, results, strict=True) if not result.get("cached")
+            ]
+            prompt_tokens = sum(r.usage.prompt_tokens for r in sent_responses if r.usage)
             outputs.prompt_tokens_batch = prompt_tokens
             record_metric(
                 metric=LLMMetric.INPUT_TOKENS,
@@ -644,7 +689,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
                 model=self.model_name,
             )
 
-            total_throughput = sum(r["throughput"] for r in results if "throughput" in r)
+            total_throughput = sum(r["throughput"] for r in results if "throughput" in r and not r.get("cached"))
             outputs.throughput_batch = total_throughput
             record_metric(
                 metric=LLMMetric.PROMPT_THROUGHPUT,
@@ -653,14 +698,15 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
                 model=self.model_name,
             )
 
-            total_tokens = sum(r.usage.total_tokens for r in parsed_responses if r.usage)
+            total_tokens = sum(r.usage.total_tokens for r in sent_responses if r.usage)
             outputs.total_tokens_batch = total_tokens
-            record_metric(
-                metric=LLMMetric.TOKEN_THROUGHPUT,
-                value=total_tokens / total_throughput,
-                metric_type=MetricType.HISTOGRAM,
-                model=self.model_name,
-            )
+            if total_throughput:
+                record_metric(
+                    metric=LLMMetric.TOKEN_THROUGHPUT,
+                    value=total_tokens / total_throughput,
+                    metric_type=MetricType.HISTOGRAM,
+                    model=self.model_name,
+                )
 
         if single_prompt:
             return parsed_responses[0]
@@ -675,6 +721,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: None = None,
         tool_choice: None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> LLMResultStreaming[str | Reasoning]: ...
 
     @overload
@@ -685,6 +732,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: list[Tool],
         tool_choice: ToolChoiceWithCallable | None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> LLMResultStreaming[str | Reasoning | ToolCall]: ...
 
     def generate_streaming(
@@ -694,6 +742,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: list[Tool] | None = None,
         tool_choice: ToolChoiceWithCallable | None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> LLMResultStreaming:
         """
         This method returns an `LLMResultStreaming` object that can be asynchronously
@@ -709,11 +758,15 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
                 - dict: tool dict corresponding to one of provided tools
                 - Callable: one of provided tools
             options: Options to use for the LLM.
+            use_cache: Whether to replay the response stream from the cache of the LLM and cache it,
+                if the cache is set.
 
         Returns:
             Response stream from LLM or list of tool calls.
         """
-        return LLMResultStreaming(self._stream_internal(prompt, tools=tools, tool_choice=tool_choice, options=options))
+        return LLMResultStreaming(
+            self._stream_internal(prompt, tools=tools, tool_choice=tool_choice, options=options, use_cache=use_cache)
+        )
 
     async def _stream_internal(
         self,
@@ -722,6 +775,7 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
         tools: list[Tool] | None = None,
         tool_choice: ToolChoiceWithCallable | None = None,
         options: LLMClientOptionsT | None = None,
+        use_cache: bool = True,
     ) -> AsyncGenerator[str | Reasoning | ToolCall | LLMResponseWithMetadata, None]:
         with trace(model_name=self.model_name, prompt=prompt, options=repr(options)) as outputs:
             merged_options = (self.default_options | options) if options else self.default_options
@@ -736,11 +790,12 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
             parsed_tool_choice = (
                 convert_function_to_function_schema(tool_choice) if callable(tool_choice) else tool_choice
             )
-            response = await self._call_streaming(
+            response = await self._call_streaming_with_cache(
                 prompt=prompt,
                 options=merged_options,
                 tools=parsed_tools,
                 tool_choice=parsed_tool_choice,
+                use_cache=use_cache,
             )
 
             content = ""
@@ -783,6 +838,134 @@ class LLM(ConfigurableComponent[LLMClientOptionsT], ABC):
 
             yield outputs.response
 
+    def _get_cache_key(
+        self,
+        kind: str,
+        prompt: BasePrompt,
+        options: LLMClientOptionsT,
+        tools: list[dict] | None,
+        tool_choice: ToolChoice | None,
+    ) -> str:
+        """
+        Creates the cache key of the request.
+
+        Args:
+            kind: The kind of the cached response, as streamed responses are cached as chunks.
+            prompt: Formatted prompt template with conversation.
+            options: The merged options of the call.
+            tools: Functions to be used as tools by the LLM.
+            tool_choice: Parameter that allows to control what tool is used.
+
+        Returns:
+            The cache key of the request.
+        """
+        output_schema = prompt.output_schema()
+        if isinstance(output_schema, type) and issubclass(output_schema, BaseModel):
+            output_schema = output_schema.model_json_schema()
+        return LLMCache.key(
+            kind,
+            self.get_model_id(),
+            prompt.chat,
+            output_schema,
+            prompt.json_mode,
+            tools,
+            tool_choice,
+            options.dict(),
+        )
+
+    async def _call_with_cache(
+        self,
+        prompts: list[BasePrompt],
+        options: LLMClientOptionsT,
+        tools: list[dict] | None,
+        tool_choice: ToolChoice | None,
+        use_cache: bool,
+    ) -> list[dict]:
+        """
+        Serves the responses from the cache and calls LLM inference API for the missing ones in a single batch.
+
+        Args:
+            prompts: Formatted prompt templates with conversations.
+            options: Additional settings used by the LLM.
+            tools: Functions to be used as tools by the LLM.
+            tool_choice: Parameter that allows to control what tool is used.
+            use_cache: Whether to use the cache of the LLM.
+
+        Returns:
+            Response dicts from LLM.
+        """
+        if not use_cache or self.cache is None or not self.cache.is_cacheable(options):
+            return await self._call(prompt=prompts, options=options, tools=tools, tool_choice=tool_choice)
+
+        keys = [self._get_cache_key("response", prompt, options, tools, tool_choice) for prompt in prompts]
+        found = await self.cache.get(keys, model=self.model_name)
+        for response in found.values():
+            response["cached"] = True
+
+        missing: dict[str, BasePrompt] = {}
+        for key, prompt in zip(keys, prompts, strict=True):
+            if key not in found:
+                missing.setdefault(key, prompt)
+
+        if missing:
+            responses = await self._call(
+                prompt=list(missing.values()), options=options, tools=tools, tool_choice=tool_choice
+            )
+            computed = dict(zip(missing, responses, strict=True))
+            await self.cache.put(computed)
+            found.update(computed)
+
+        # Responses are copied, as the same response may be returned for identical prompts of the batch
+        return [dict(found[key]) for key in keys]
+
+    async def _call_streaming_with_cache(
+        self,
+        prompt: BasePrompt,
+        options: LLMClientOptionsT,
+        tools: list[dict] | None,
+        tool_choice: ToolChoice | None,
+        use_cache: bool,
+    ) -> AsyncGenerator[dict, None]:
+        """
+        Replays the response stream from the cache, or calls LLM inference API with output streaming
+        and caches the stream once it's fully consumed.
+
+        Args:
+            prompt: Formatted prompt template with conversation.
+            options: Additional settings used by the LLM.
+            tools: Functions to be used as tools by the LLM.
+            tool_choice: Parameter that allows to control what tool is used.
+            use_cache: Whether to use the cache of the LLM.
+
+        Returns:
+            Response dict stream from LLM.
+        """
+        if not use_cache or self.cache is None or not self.cache.is_cacheable(options):
+            return await self._call_streaming(prompt=prompt, options=options, tools=tools, tool_choice=tool_choice)
+
+        cache = self.cache
+        key = self._get_cache_key("stream", prompt, options, tools, tool_choice)
+        cached_chunks = (await cache.get([key], model=self.model_name)).get(key)
+
+        if cached_chunks is not None:
+
+            async def replay_chunks() -> AsyncGenerator[dict, None]:
+                for chunk in cached_chunks:
+                    yield chunk
+
+            return replay_chunks()
+
+        response = await self._call_streaming(prompt=prompt, options=options, tools=tools, tool_choice=tool_choice)
+
+        async def record_chunks() -> AsyncGenerator[dict, None]:
+            chunks = []
+            async for chunk in response:
+                chunks.append(chunk)
+                yield chunk
+            await cache.put({key: chunks})
+
+        return record_chunks()
+
     @abstractmethod
     async def _call(
         self,
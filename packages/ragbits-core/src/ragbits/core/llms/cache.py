@@ -0,0 +1,188 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from ragbits.core.audit.metrics import record_metric
+from ragbits.core.audit.metrics.base import LLMMetric, MetricType
+from ragbits.core.options import Options
+
+# SQLite limits the number of host parameters in a single statement.
+_SQLITE_BATCH_SIZE = 500
+
+
+class LLMCache:
+    """
+    Cache of LLM responses, so that identical requests, such as prompts replayed by evaluation runs, are answered once.
+
+    Responses are keyed on the model, the rendered conversation, the tools and output schema, and the merged call
+    options. Hits are served from an in-process LRU cache backed by an optional on-disk SQLite store.
+
+    By default, only the responses generated with deterministic settings (`temperature=0` and a single choice)
+    are cached, as replaying a sampled response would change the behavior of the application.
+    """
+
+    def __init__(
+        self,
+        cache_path: str | Path | None = None,
+        max_memory_entries: int = 1024,
+        deterministic_only: bool = True,
+    ) -> None:
+        """
+        Constructs a new LLMCache instance.
+
+        Args:
+            cache_path: The path of the SQLite database persisting the responses. If not provided,
+                responses are cached in memory only.
+            max_memory_entries: The maximum number of responses kept in the in-process LRU cache.
+            deterministic_only: Whether to cache only the responses generated with `temperature=0` and a single
+                choice. If False, the responses are cached regardless of the sampling options.
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.max_memory_entries = max_memory_entries
+        self.deterministic_only = deterministic_only
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of the looked up responses served from the cache.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def is_cacheable(self, options: Options) -> bool:
+        """
+        Checks whether the responses generated with the options can be cached.
+
+        Args:
+            options: The merged options of the call.
+
+        Returns:
+            True if the responses can be cached, False otherwise.
+        """
+        if not self.deterministic_only:
+            return True
+        n = getattr(options, "n", None)
+        return getattr(options, "temperature", None) == 0 and not (isinstance(n, int) and n > 1)
+
+    @staticmethod
+    def key(*parts: Any) -> str:  # noqa: ANN401
+        """
+        Creates the cache key of the request.
+
+        Args:
+            parts: The JSON-serializable parts identifying the request.
+
+        Returns:
+            The cache key.
+        """
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+    async def get(self, keys: list[str], model: str | None = None) -> dict[str, Any]:
+        """
+        Gets the cached responses, counting the hits and misses and recording them in the cache metrics.
+        Identical keys are counted once, as identical requests of a batch are answered once.
+
+        Args:
+            keys: The cache keys of the requests.
+            model: The name of the model of the requests, attached to the cache metrics.
+
+        Returns:
+            The cached responses by the cache keys, fresh copies on every call.
+        """
+        found = self._get_from_memory(keys)
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing and self.cache_path:
+            stored = await asyncio.to_thread(self._get_from_disk, missing)
+            self._put_in_memory(stored)
+            found.update(stored)
+
+        self._record_lookups(hits=len(found), misses=len(dict.fromkeys(keys)) - len(found), model=model)
+        return {key: json.loads(value) for key, value in found.items()}
+
+    async def put(self, responses: dict[str, Any]) -> None:
+        """
+        Caches the responses. Responses which can't be serialized to JSON are not cached.
+
+        Args:
+            responses: The responses by the cache keys.
+        """
+        serialized = {}
+        for key, response in responses.items():
+            try:
+                serialized[key] = json.dumps(response)
+            except (TypeError, ValueError):
+                continue
+        if self.cache_path and serialized:
+            await asyncio.to_thread(self._put_on_disk, serialized)
+        self._put_in_memory(serialized)
+
+    def _record_lookups(self, hits: int, misses: int, model: str | None) -> None:
+        self.hits += hits
+        self.misses += misses
+        attributes = {"model": model} if model else {}
+        record_metric(metric=LLMMetric.CACHE_HITS, value=hits, metric_type=MetricType.COUNTER, **attributes)
+        record_metric(metric=LLMMetric.CACHE_MISSES, value=misses, metric_type=MetricType.COUNTER, **attributes)
+
+    def _get_from_memory(self, keys: list[str]) -> dict[str, str]:
+        found = {}
+        for key in keys:
+            if (value := self._memory.get(key)) is not None:
+                self._memory.move_to_end(key)
+                found[key] = value
+        return found
+
+    def _put_in_memory(self, values: dict[str, str]) -> None:
+        for key, value in values.items():
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)  # type: ignore[union-attr]
+            self._connection = sqlite3.connect(self.cache_path, check_same_thread=False)  # type: ignore[arg-type]
+            self._connection.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT)")
+        return self._connection
+
+    def _get_from_disk(self, keys: list[str]) -> dict[str, str]:
+        found = {}
+        with self._lock:
+            connection = self._get_connection()
+            for i in range(0, len(keys), _SQLITE_BATCH_SIZE):
+                batch = keys[i : i + _SQLITE_BATCH_SIZE]
+                rows = connection.execute(
+                    f"SELECT key, value FROM responses WHERE key IN ({', '.join('?' * len(batch))})",  # noqa: S608
+                    batch,
+                )
+                found.update(dict(rows))
+        return found
+
+    def _put_on_disk(self, values: dict[str, str]) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)",
+                    list(values.items()),
+                )
@@ -27,6 +27,16 @@ class LLMStatusError(LLMError):
         self.status_code = status_code
 
 
+class LLMRateLimitError(LLMStatusError):
+    """
+    Raised when an API response has a status code of 429, because the rate limits were exceeded.
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message, 429)
+        self.retry_after = retry_after
+
+
 class LLMResponseError(LLMError):
     """
     Raised when an API response has an invalid schema.
@@ -1,6 +1,8 @@
 import asyncio
 import time
 from collections.abc import AsyncGenerator, Callable, Iterable
+from email.utils import parsedate_to_datetime
+from functools import partial
 from typing import TYPE_CHECKING, Any, Literal
 
 import tiktoken
@@ -10,6 +12,7 @@ from typing_extensions import Self
 from ragbits.core.audit.metrics import record_metric
 from ragbits.core.audit.metrics.base import LLMMetric, MetricType
 from ragbits.core.llms.base import LLM, LLMOptions, ToolChoice
+from ragbits.core.llms.cache import LLMCache
 from ragbits.core.llms.exceptions import (
     LLMConnectionError,
     LLMEmptyResponseError,
@@ -17,9 +20,11 @@ from ragbits.core.llms.exceptions import (
     LLMNotSupportingPdfsError,
     LLMNotSupportingReasoningEffortError,
     LLMNotSupportingToolUseError,
+    LLMRateLimitError,
     LLMResponseError,
     LLMStatusError,
 )
+from ragbits.core.llms.scheduler import LLMScheduler
 from ragbits.core.prompt.base import BasePrompt, ChatFormat
 from ragbits.core.types import NOT_GIVEN, NotGiven
 from ragbits.core.utils.lazy_litellm import LazyLiteLLM
@@ -72,6 +77,8 @@ class LiteLLM(LLM[LiteLLMOptions], LazyLiteLLM):
         use_structured_output: bool = False,
         router: "Router | None" = None,
         custom_model_cost_config: dict | None = None,
+        scheduler: LLMScheduler | None = None,
+        cache: LLMCache | None = None,
     ) -> None:
         """
         Constructs a new LiteLLM instance.
@@ -94,8 +101,13 @@ class LiteLLM(LLM[LiteLLMOptions], LazyLiteLLM):
                 Necessary for custom model cost and capabilities tracking in LiteLLM.
                 See the [LiteLLM documentation](https://docs.litellm.ai/docs/completion/token_usage#9-register_model)
                 for more information.
+            scheduler: Scheduler of the requests sent to the LLM API, limiting the requests in flight and
+                the requests and tokens per minute, and retrying the requests rejected with a rate limit error.
+                Can be shared between LLM instances using the same API limits. If not specified, at most 16
+                requests are in flight, within the `rpm` and `tpm` limits of the default options if they are set.
+            cache: Cache of the responses, serving the responses to identical requests without calling the model.
         """
-        super().__init__(model_name, default_options)
+        super().__init__(model_name, default_options, cache=cache)
         self.api_base = api_base or base_url
         self.api_key = api_key
         self.api_version = api_version
@@ -103,6 +115,10 @@ class LiteLLM(LLM[LiteLLMOptions], LazyLiteLLM):
         self.router = router
         self.custom_model_cost_config = custom_model_cost_config
         self._cached_router: Router | None = None  # Cache for auto-created router
+        self.scheduler = scheduler or LLMScheduler(
+            requests_per_minute=self.default_options.rpm or None,
+            tokens_per_minute=self.default_options.tpm or None,
+        )
         if custom_model_cost_config:
             self._litellm.register_model(custom_model_cost_config)
 
@@ -203,16 +219,22 @@ class LiteLLM(LLM[LiteLLMOptions], LazyLiteLLM):
             raise LLMNotSupportingReasoningEffortError(self.model_name)
 
         start_time = time.perf_counter()
+        caller = object()
         raw_responses = await asyncio.gather(
             *(
-                self._get_litellm_response(
-                    conversation=single_prompt.chat,
-                    options=options,
-                    response_format=self._get_response_format(
-                        output_schema=single_prompt.output_schema(), json_mode=single_prompt.json_mode
+                self.scheduler.run(
+                    partial(
+                        self._get_litellm_response,
+                        conversation=single_prompt.chat,
+                        options=options,
+                        response_format=self._get_response_format(
+                            output_schema=single_prompt.output_schema(), json_mode=single_prompt.json_mode
+                        ),
+                        tools=tools,
+                        tool_choice=tool_choice,
                     ),
-                    tools=tools,
-                    tool_choice=tool_choice,
+                    caller=caller,
+                    tokens=self._estimate_tokens(single_prompt),
                 )
                 for single_prompt in prompt
             )
@@ -307,14 +329,18 @@ class LiteLLM(LLM[LiteLLMOptions], LazyLiteLLM):
         provider_calculated_usage = None
 
         start_time = time.perf_counter()
-        response = await self._get_litellm_response(
-            conversation=prompt.chat,
-            options=options,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice,
-            stream=True,
-            stream_options={"include_usage": True},
+        response = await self.scheduler.run(
+            partial(
+                self._get_litellm_response,
+                conversation=prompt.chat,
+                options=options,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice,
+                stream=True,
+                stream_options={"include_usage": True},
+            ),
+            tokens=self._estimate_tokens(prompt),
         )
 
         try:
@@ -406,6 +432,20 @@ class LiteLLM(LLM[LiteLLMOptions], LazyLiteLLM):
 
         return response_to_async_generator(response)  # type: ignore
 
+    def _estimate_tokens(self, prompt: BasePrompt) -> int:
+        """
+        Estimates the number of tokens of the prompt for the tokens per minute limit of the scheduler.
+
+        Args:
+            prompt: The prompt to estimate the tokens of.
+
+        Returns:
+            The estimated number of tokens, or 0 if the tokens per minute are not limited.
+        """
+        if self.scheduler.tokens_per_minute is None:
+            return 0
+        return self.count_tokens(prompt)
+
     def _create_router_from_self_and_options(self, options: LiteLLMOptions) -> "Router":
         params: dict[str, Any] = {
             "model": self.model_name,
@@ -471,6 +511,8 @@ class LiteLLM(LLM[LiteLLMOptions], LazyLiteLLM):
             response = await entrypoint.acompletion(**completion_kwargs)
         except self._litellm.openai.APIConnectionError as exc:
             raise LLMConnectionError() from exc
+        except self._litellm.openai.RateLimitError as exc:
+            raise LLMRateLimitError(exc.message, _get_retry_after(exc)) from exc
         except self._litellm.openai.APIStatusError as exc:
             raise LLMStatusError(exc.message, exc.status_code) from exc
         except self._litellm.openai.APIResponseValidationError as exc:
@@ -611,6 +653,9 @@ class LiteLLM(LLM[LiteLLMOptions], LazyLiteLLM):
         if "base_url" in config and "api_base" not in config:
             config["api_base"] = config.pop("base_url")
 
+        if "scheduler" in config:
+            config["scheduler"] = LLMScheduler(**config["scheduler"])
+
         return super().from_config(config)
 
     def __reduce__(self) -> tuple[Callable, tuple]:
@@ -622,7 +667,48 @@ class LiteLLM(LLM[LiteLLMOptions], LazyLiteLLM):
             "api_version": self.api_version,
             "use_structured_output": self.use_structured_output,
             "custom_model_cost_config": self.custom_model_cost_config,
+            "scheduler": {
+                "max_concurrency": self.scheduler.max_concurrency,
+                "requests_per_minute": self.scheduler.requests_per_minute,
+                "tokens_per_minute": self.scheduler.tokens_per_minute,
+                "max_retries": self.scheduler.max_retries,
+                "backoff": self.scheduler.backoff,
+                "max_backoff": self.scheduler.max_backoff,
+            },
         }
+        if self.cache:
+            config["cache"] = {
+                "cache_path": self.cache.cache_path,
+                "max_memory_entries": self.cache.max_memory_entries,
+                "deterministic_only": self.cache.deterministic_only,
+            }
         if self.router:
             config["router"] = self.router.model_list
         return self.from_config, (config,)
+
+
+def _get_retry_after(exc: Exception) -> float | None:
+    """
+    Gets the time to wait before retrying the request from the headers of the rate limit error response.
+
+    Args:
+        exc: The rate limit error.
+
+    Returns:
+        The time to wait in seconds, or None if the response doesn't specify it.
+    """
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    if retry_after_ms := headers.get("retry-after-ms"):
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    if retry_after := headers.get("retry-after"):
+        try:
+            return float(retry_after)
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return None
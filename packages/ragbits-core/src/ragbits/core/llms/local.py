@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any
 from ragbits.core.audit.metrics import record_metric
 from ragbits.core.audit.metrics.base import LLMMetric, MetricType
 from ragbits.core.llms.base import LLM, LLMOptions, ToolChoice
+from ragbits.core.llms.cache import LLMCache
 from ragbits.core.prompt.base import BasePrompt
 from ragbits.core.types import NOT_GIVEN, NotGiven
 
@@ -49,6 +50,7 @@ class LocalLLM(LLM[LocalLLMOptions]):
         api_key: str | None = None,
         price_per_prompt_token: float = 0.0,
         price_per_completion_token: float = 0.0,
+        cache: LLMCache | None = None,
     ) -> None:
         """
         Constructs a new local LLM instance.
@@ -59,6 +61,7 @@ class LocalLLM(LLM[LocalLLMOptions]):
             api_key: The API key for Hugging Face authentication.
             price_per_prompt_token: The price per prompt token.
             price_per_completion_token: The price per completion token.
+            cache: Cache of the responses, serving the responses to identical requests without calling the model.
 
         Raises:
             ImportError: If the 'local' extra requirements are not installed.
@@ -69,7 +72,7 @@ class LocalLLM(LLM[LocalLLMOptions]):
             raise ImportError("You need to install the 'local' extra requirements to use local LLM models")
         torch, AutoModelForCausalLM, AutoTokenizer, self.TextIteratorStreamer = deps
 
-        super().__init__(model_name, default_options)
+        super().__init__(model_name, default_options, cache=cache)
         self.model = AutoModelForCausalLM.from_pretrained(
             model_name, device_map="auto", torch_dtype=torch.bfloat16, token=api_key
         )
@@ -1,6 +1,7 @@
 from collections.abc import AsyncGenerator, Iterable
 
 from ragbits.core.llms.base import LLM, LLMOptions, ToolChoice
+from ragbits.core.llms.cache import LLMCache
 from ragbits.core.prompt import ChatFormat
 from ragbits.core.prompt.base import BasePrompt
 from ragbits.core.types import NOT_GIVEN, NotGiven
@@ -32,6 +33,7 @@ class MockLLM(LLM[MockLLMOptions]):
         *,
         price_per_prompt_token: float = 0.0,
         price_per_completion_token: float = 0.0,
+        cache: LLMCache | None = None,
     ) -> None:
         """
         Constructs a new MockLLM instance.
@@ -41,8 +43,9 @@ class MockLLM(LLM[MockLLMOptions]):
             default_options: Default options to be used.
             price_per_prompt_token: The price per prompt token.
             price_per_completion_token: The price per completion token.
+            cache: Cache of the responses, serving the responses to identical requests without calling the model.
         """
-        super().__init__(model_name, default_options=default_options)
+        super().__init__(model_name, default_options=default_options, cache=cache)
         self.calls: list[ChatFormat] = []
         self.tool_choice: ToolChoice | None = None
         self._price_per_prompt_token = price_per_prompt_token
@@ -0,0 +1,232 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from contextlib import asynccontextmanager
+from typing import TypeVar
+from weakref import WeakKeyDictionary
+
+from ragbits.core.llms.exceptions import LLMRateLimitError
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+class _TokenBucket:
+    """
+    Token bucket refilled evenly over a minute, up to the limit per minute.
+    """
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = per_minute
+        self.available = float(per_minute)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.capacity / 60)
+        self.updated = now
+
+    def delay(self, amount: int) -> float:
+        """
+        Get the time until the amount is available.
+
+        Args:
+            amount: The amount to take from the bucket. Amounts above the limit per minute are capped to it.
+
+        Returns:
+            The time to wait, in seconds.
+        """
+        self._refill()
+        missing = min(amount, self.capacity) - self.available
+        return max(0.0, missing * 60 / self.capacity)
+
+    def consume(self, amount: int) -> None:
+        """
+        Take the amount from the bucket.
+
+        Args:
+            amount: The amount to take from the bucket. Amounts above the limit per minute are capped to it.
+        """
+        self._refill()
+        self.available -= min(amount, self.capacity)
+
+
+class _SchedulerState:
+    """
+    Requests in flight and waiting in an event loop, handed out slots in turns between the callers.
+    """
+
+    def __init__(self, max_concurrency: int | None) -> None:
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self.waiters: dict[Hashable, deque[asyncio.Future[None]]] = {}
+        self.rate_lock = asyncio.Lock()
+
+    def _has_capacity(self) -> bool:
+        return self.max_concurrency is None or self.in_flight < self.max_concurrency
+
+    async def acquire(self, caller: Hashable) -> None:
+        if self._has_capacity() and not self.waiters:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.setdefault(caller, deque()).append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            elif (waiters := self.waiters.get(caller)) is not None and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self.waiters[caller]
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        while self.waiters and self._has_capacity():
+            # Take the first waiter of the caller served the longest ago, and move the caller to the end
+            caller = next(iter(self.waiters))
+            waiters = self.waiters.pop(caller)
+            waiter = waiters.popleft()
+            if waiters:
+                self.waiters[caller] = waiters
+            self.in_flight += 1
+            waiter.set_result(None)
+
+
+class LLMScheduler:
+    """
+    Scheduler of the requests sent to the LLM API, keeping them within the limit of requests in flight
+    and the client-side limits of requests and tokens per minute.
+
+    Requests of concurrent callers, such as concurrent `generate` calls, take the free slots in turns,
+    so that a large batch doesn't hold back the other callers. When the API rejects a request with
+    a rate limit error, all requests wait for the time from the `Retry-After` header, or for an exponential
+    backoff if it's missing, before the rejected request is retried.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = DEFAULT_MAX_CONCURRENCY,
+        *,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        """
+        Constructs a new LLMScheduler instance.
+
+        Args:
+            max_concurrency: The maximum number of requests in flight. If None, the number is not limited.
+            requests_per_minute: The maximum number of requests sent per minute. If None, it's not limited.
+            tokens_per_minute: The maximum number of prompt tokens sent per minute, estimated with
+                `LLM.count_tokens` before the request is sent. If None, it's not limited.
+            max_retries: The maximum number of retries of a request rejected with a rate limit error.
+            backoff: The time to wait before the first retry, in seconds, if the API doesn't return
+                the `Retry-After` header. The time doubles with each next retry.
+            max_backoff: The maximum time to wait before a retry without the `Retry-After` header, in seconds.
+
+        Raises:
+            ValueError: If any of the limits is not positive.
+        """
+        for name, limit in [
+            ("max_concurrency", max_concurrency),
+            ("requests_per_minute", requests_per_minute),
+            ("tokens_per_minute", tokens_per_minute),
+        ]:
+            if limit is not None and limit < 1:
+                raise ValueError(f"The {name} limit must be positive.")
+
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._requests = _TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._paused_until = 0.0
+        self._states: WeakKeyDictionary[asyncio.AbstractEventLoop, _SchedulerState] = WeakKeyDictionary()
+
+    def _get_state(self) -> _SchedulerState:
+        loop = asyncio.get_running_loop()
+        if (state := self._states.get(loop)) is None:
+            state = self._states[loop] = _SchedulerState(self.max_concurrency)
+        return state
+
+    def _get_delay(self, tokens: int) -> float:
+        delay = self._paused_until - time.monotonic()
+        if self._requests is not None:
+            delay = max(delay, self._requests.delay(1))
+        if self._tokens is not None:
+            delay = max(delay, self._tokens.delay(tokens))
+        return delay
+
+    @asynccontextmanager
+    async def slot(self, caller: Hashable | None = None, tokens: int = 0) -> AsyncIterator[None]:
+        """
+        Wait for a place among the requests in flight and within the rate limits, and hold the place
+        until the context exits.
+
+        Args:
+            caller: The identifier of the caller, taking the free places in turns with the other callers.
+                If None, the request is a caller of its own.
+            tokens: The estimated number of tokens of the request.
+        """
+        state = self._get_state()
+        await state.acquire(caller if caller is not None else object())
+        try:
+            async with state.rate_lock:
+                while (delay := self._get_delay(tokens)) > 0:
+                    await asyncio.sleep(delay)
+                if self._requests is not None:
+                    self._requests.consume(1)
+                if self._tokens is not None:
+                    self._tokens.consume(tokens)
+            yield
+        finally:
+            state.release()
+
+    async def run(self, request: Callable[[], Awaitable[T]], caller: Hashable | None = None, tokens: int = 0) -> T:
+        """
+        Send the request within the limits, retrying it if it's rejected with a rate limit error.
+
+        Args:
+            request: The function sending the request.
+            caller: The identifier of the caller, taking the free places in turns with the other callers.
+                If None, the request is a caller of its own.
+            tokens: The estimated number of tokens of the request.
+
+        Returns:
+            The result of the request.
+
+        Raises:
+            LLMRateLimitError: If the request is rejected with a rate limit error more than `max_retries` times.
+        """
+        attempt = 0
+        while True:
+            async with self.slot(caller, tokens):
+                try:
+                    return await request()
+                except LLMRateLimitError as exc:
+                    if attempt >= self.max_retries:
+                        raise
+                    self._pause(exc.retry_after, attempt)
+            attempt += 1
+
+    def _pause(self, retry_after: float | None, attempt: int) -> None:
+        """
+        Hold back all requests after a rate limit error.
+
+        Args:
+            retry_after: The time to wait returned by the API, in seconds.
+            attempt: The number of retries of the rejected request so far.
+        """
+        delay = retry_after if retry_after is not None else min(self.backoff * 2**attempt, self.max_backoff)
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
@@ -5,10 +5,12 @@ from pathlib import Path
 from typing import ClassVar
 from urllib.parse import urlparse
 
+from pydantic import PrivateAttr
 from typing_extensions import Self
 
 from ragbits.core.audit.traces import trace, traceable
 from ragbits.core.sources.base import Source, get_local_storage_dir
+from ragbits.core.sources.download import run_download
 from ragbits.core.sources.exceptions import SourceConnectionError, SourceNotFoundError
 from ragbits.core.utils.decorators import requires_dependencies
 
@@ -27,6 +29,10 @@ class AzureBlobStorageSource(Source):
     account_name: str
     container_name: str
     blob_name: str
+    _etag: str | None = PrivateAttr(default=None)
+
+    # The number of ranges of a large blob downloaded at once
+    _download_concurrency: ClassVar[int] = 8
 
     @property
     def id(self) -> str:
@@ -52,14 +58,8 @@ class AzureBlobStorageSource(Source):
         path = container_local_dir / self.blob_name
         with trace(account_name=self.account_name, container=self.container_name, blob=self.blob_name) as outputs:
             try:
-                blob_service = self._get_blob_service(self.account_name)
-                blob_client = blob_service.get_blob_client(container=self.container_name, blob=self.blob_name)
                 Path(path).parent.mkdir(parents=True, exist_ok=True)
-                stream = blob_client.download_blob()
-                content = stream.readall()
-                with open(path, "wb") as file:
-                    file.write(content)
-
+                await run_download(self._download, path)
             except ResourceNotFoundError as e:
                 raise SourceNotFoundError(f"Blob {self.blob_name} not found in container {self.container_name}") from e
             except Exception as e:
@@ -67,6 +67,41 @@ class AzureBlobStorageSource(Source):
             outputs.path = path
         return path
 
+    def _download(self, path: Path) -> None:
+        """
+        Download the blob to the local file, fetching the ranges of a large blob in parallel.
+
+        Args:
+            path: The local path to download the blob to.
+        """
+        blob_service = self._get_blob_service(self.account_name)
+        blob_client = blob_service.get_blob_client(container=self.container_name, blob=self.blob_name)
+        stream = blob_client.download_blob(max_concurrency=self._download_concurrency)
+        with open(path, "wb") as file:
+            stream.readinto(file)
+
+    @requires_dependencies(["azure.storage.blob"], "azure")
+    async def fingerprint(self) -> str | None:
+        """
+        Get the fingerprint of the blob, based on its ETag. The ETag returned by the listing is used if available,
+        otherwise it's requested from Azure without downloading the blob.
+
+        Returns:
+            The ETag of the blob.
+
+        Raises:
+            SourceConnectionError: If the blob service connection is not available.
+        """
+        if self._etag is not None:
+            return self._etag
+
+        try:
+            blob_service = self._get_blob_service(self.account_name)
+            blob_client = blob_service.get_blob_client(container=self.container_name, blob=self.blob_name)
+            return blob_client.get_blob_properties().etag
+        except Exception as e:
+            raise SourceConnectionError() from e
+
     @classmethod
     @requires_dependencies(["azure.storage.blob"], "azure")
     async def list_sources(
@@ -94,9 +129,11 @@ class AzureBlobStorageSource(Source):
                 blob_service = cls._get_blob_service(account_name)
                 container_client = blob_service.get_container_client(container)
                 blobs = container_client.list_blobs(name_starts_with=blob_name)
-                outputs.results = [
-                    cls(container_name=container, blob_name=blob.name, account_name=account_name) for blob in blobs
-                ]
+                outputs.results = []
+                for blob in blobs:
+                    source = cls(container_name=container, blob_name=blob.name, account_name=account_name)
+                    source._etag = blob.etag
+                    outputs.results.append(source)
                 return outputs.results
             except Exception as e:
                 raise SourceConnectionError() from e
@@ -1,7 +1,7 @@
 import os
 import tempfile
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
 from pathlib import Path
 from types import ModuleType
 from typing import Any, ClassVar
@@ -78,6 +78,16 @@ class Source(WithConstructionConfig, BaseModel, ABC):
             The path to the source.
         """
 
+    async def fingerprint(self) -> str | None:  # noqa: PLR6301
+        """
+        Get the fingerprint of the source content, without fetching the source.
+        The fingerprint changes whenever the content of the source changes.
+
+        Returns:
+            The fingerprint, or None if the source can't be fingerprinted without fetching it.
+        """
+        return None
+
     @classmethod
     @abstractmethod
     async def list_sources(cls, *args: Any, **kwargs: Any) -> Iterable[Self]:  # noqa: ANN401
@@ -88,6 +98,21 @@ class Source(WithConstructionConfig, BaseModel, ABC):
             The iterable of Source objects.
         """
 
+    @classmethod
+    async def iter_sources(cls, *args: Any, **kwargs: Any) -> AsyncIterator[Self]:  # noqa: ANN401
+        """
+        List all sources from the given storage lazily, yielding them as soon as they are found, so that
+        the sources can be processed while the storage is still being listed.
+
+        The default implementation yields the sources from `list_sources`. Sources of large storages override it
+        to list the storage page by page.
+
+        Yields:
+            The Source objects.
+        """
+        for source in await cls.list_sources(*args, **kwargs):
+            yield source
+
     @classmethod
     @abstractmethod
     async def from_uri(cls, path: str) -> Iterable[Self]:
@@ -104,6 +129,23 @@ class Source(WithConstructionConfig, BaseModel, ABC):
             The iterable of Source objects matching the path pattern.
         """
 
+    @classmethod
+    async def iter_from_uri(cls, path: str) -> AsyncIterator[Self]:
+        """
+        Create Source instances from a URI path lazily, yielding them as soon as they are found.
+
+        The default implementation yields the sources from `from_uri`. Sources of large storages override it
+        to list the storage page by page.
+
+        Args:
+            path: The path part of the URI (after protocol://). Pattern support depends on source type.
+
+        Yields:
+            The Source objects matching the path pattern.
+        """
+        for source in await cls.from_uri(path):
+            yield source
+
 
 class SourceDiscriminator:
     """
@@ -177,6 +219,41 @@ class SourceResolver:
         Returns:
             The iterable of Source objects.
 
+        Raises:
+            ValueError: If the URI format is invalid or the protocol is not supported.
+        """
+        handler_class, path = cls._get_handler(uri)
+        return await handler_class.from_uri(path)
+
+    @classmethod
+    def iter_resolve(cls, uri: str) -> AsyncIterator[Source]:
+        """
+        Resolve a URI into Source objects lazily, yielding them as soon as the storage listing finds them.
+        The URI is validated on the call, while the errors of the listing are raised during the iteration.
+
+        Args:
+            uri: The URI to resolve. The URI should be in the format of `protocol://path`.
+
+        Returns:
+            The asynchronous iterator of Source objects.
+
+        Raises:
+            ValueError: If the URI format is invalid or the protocol is not supported.
+        """
+        handler_class, path = cls._get_handler(uri)
+        return handler_class.iter_from_uri(path)
+
+    @classmethod
+    def _get_handler(cls, uri: str) -> tuple[type[Source], str]:
+        """
+        Get the source class handling the protocol of the URI.
+
+        Args:
+            uri: The URI in the format of `protocol://path`.
+
+        Returns:
+            The source class handling the protocol, and the path part of the URI.
+
         Raises:
             ValueError: If the URI format is invalid or the protocol is not supported.
         """
@@ -189,8 +266,7 @@ class SourceResolver:
             supported = ", ".join(sorted(cls._protocol_handlers.keys()))
             raise ValueError(f"Unsupported protocol: {protocol}. Supported protocols are: {supported}")
 
-        handler_class = cls._protocol_handlers[protocol]
-        return await handler_class.from_uri(path)
+        return cls._protocol_handlers[protocol], path
 
 
 def get_local_storage_dir() -> Path:
@@ -0,0 +1,118 @@
+import asyncio
+import os
+from collections.abc import AsyncIterator, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import ParamSpec, TypeVar
+from weakref import WeakKeyDictionary
+
+import aiohttp
+
+MAX_CONCURRENT_DOWNLOADS_ENV = "RAGBITS_MAX_CONCURRENT_DOWNLOADS"
+DEFAULT_MAX_CONCURRENT_DOWNLOADS = 16
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+_max_concurrent_downloads: int | None = None
+_download_limits: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = WeakKeyDictionary()
+_http_sessions: WeakKeyDictionary[asyncio.AbstractEventLoop, "_SharedSession"] = WeakKeyDictionary()
+
+
+class _SharedSession:
+    """
+    HTTP session shared by the downloads running at the same time in an event loop.
+    """
+
+    def __init__(self) -> None:
+        self.stack = AsyncExitStack()
+        self.session: aiohttp.ClientSession | None = None
+        self.users = 0
+
+
+def get_max_concurrent_downloads() -> int:
+    """
+    Get the maximum number of downloads of remote sources running at once.
+
+    The limit is set with `set_max_concurrent_downloads`, or with the environment variable
+    `RAGBITS_MAX_CONCURRENT_DOWNLOADS`. If neither is set, at most 16 downloads run at once.
+
+    Returns:
+        The maximum number of downloads running at once.
+    """
+    if _max_concurrent_downloads is not None:
+        return _max_concurrent_downloads
+    return int(os.getenv(MAX_CONCURRENT_DOWNLOADS_ENV, DEFAULT_MAX_CONCURRENT_DOWNLOADS))
+
+
+def set_max_concurrent_downloads(max_concurrent_downloads: int | None) -> None:
+    """
+    Set the maximum number of downloads of remote sources running at once.
+
+    Args:
+        max_concurrent_downloads: The maximum number of downloads running at once.
+            If None, the limit from the environment or the default one is used.
+
+    Raises:
+        ValueError: If the limit is not positive.
+    """
+    global _max_concurrent_downloads  # noqa: PLW0603
+    if max_concurrent_downloads is not None and max_concurrent_downloads < 1:
+        raise ValueError("The maximum number of concurrent downloads must be positive.")
+    _max_concurrent_downloads = max_concurrent_downloads
+    _download_limits.clear()
+
+
+@asynccontextmanager
+async def download_slot() -> AsyncIterator[None]:
+    """
+    Wait until fewer than the maximum number of downloads run in the current event loop, and hold a place
+    among them until the context exits.
+    """
+    loop = asyncio.get_running_loop()
+    if (limit := _download_limits.get(loop)) is None:
+        limit = _download_limits[loop] = asyncio.Semaphore(get_max_concurrent_downloads())
+    async with limit:
+        yield
+
+
+async def run_download(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Run the blocking download function in a thread, so that it doesn't block the event loop,
+    within the limit of downloads running at once.
+
+    Args:
+        func: The blocking function downloading the source.
+        *args: The positional arguments of the function.
+        **kwargs: The keyword arguments of the function.
+
+    Returns:
+        The result of the function.
+    """
+    async with download_slot():
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+@asynccontextmanager
+async def shared_http_session() -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Get the HTTP session shared by the downloads running at the same time in the current event loop,
+    so that they reuse the pooled connections. The session is closed when the last of them finishes.
+
+    Yields:
+        The shared HTTP session.
+    """
+    loop = asyncio.get_running_loop()
+    if (shared := _http_sessions.get(loop)) is None:
+        shared = _http_sessions[loop] = _SharedSession()
+    shared.users += 1
+    try:
+        if shared.session is None:
+            connector = aiohttp.TCPConnector(limit=get_max_concurrent_downloads())
+            shared.session = await shared.stack.enter_async_context(aiohttp.ClientSession(connector=connector))
+        yield shared.session
+    finally:
+        shared.users -= 1
+        if shared.users == 0:
+            if _http_sessions.get(loop) is shared:
+                del _http_sessions[loop]
+            await shared.stack.aclose()
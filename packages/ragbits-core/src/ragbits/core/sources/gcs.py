@@ -1,12 +1,15 @@
-from collections.abc import Iterable
+import asyncio
+from collections.abc import AsyncIterator, Iterable
 from contextlib import suppress
 from pathlib import Path
 from typing import ClassVar
 
+from pydantic import PrivateAttr
 from typing_extensions import Self
 
 from ragbits.core.audit.traces import trace, traceable
 from ragbits.core.sources.base import Source, get_local_storage_dir
+from ragbits.core.sources.download import download_slot, shared_http_session
 from ragbits.core.utils.decorators import requires_dependencies
 
 with suppress(ImportError):
@@ -23,6 +26,7 @@ class GCSSource(Source):
     object_name: str
 
     _storage: ClassVar["StorageClient | None"] = None
+    _etag: str | None = PrivateAttr(default=None)
 
     @classmethod
     def set_storage(cls, storage: "StorageClient | None") -> None:
@@ -66,15 +70,31 @@ class GCSSource(Source):
         path = bucket_local_dir / self.object_name
         with trace(bucket=self.bucket, object=self.object_name) as outputs:
             if not path.is_file():
-                storage = await self._get_storage()
-                async with storage as client:
-                    content = await client.download(self.bucket, self.object_name)
-                    Path(bucket_local_dir / self.object_name).parent.mkdir(parents=True, exist_ok=True)
-                    with open(path, mode="wb+") as file_object:
-                        file_object.write(content)
+                async with download_slot(), shared_http_session() as session:
+                    storage = self._storage if self._storage is not None else StorageClient(session=session)
+                    async with storage as client:
+                        content = await client.download(self.bucket, self.object_name)
+                        Path(bucket_local_dir / self.object_name).parent.mkdir(parents=True, exist_ok=True)
+                        await asyncio.to_thread(path.write_bytes, content)
             outputs.path = path
         return path
 
+    @requires_dependencies(["gcloud.aio.storage"], "gcs")
+    async def fingerprint(self) -> str | None:
+        """
+        Get the fingerprint of the object, based on its ETag. The ETag returned by the listing is used if available,
+        otherwise it's requested from Google Cloud Storage without downloading the object.
+
+        Returns:
+            The ETag of the object.
+        """
+        if self._etag is not None:
+            return self._etag
+
+        async with await self._get_storage() as storage:
+            metadata = await storage.download_metadata(self.bucket, self.object_name)
+            return metadata.get("etag")
+
     @classmethod
     @requires_dependencies(["gcloud.aio.storage"], "gcs")
     async def list_sources(cls, bucket: str, prefix: str = "") -> Iterable[Self]:
@@ -89,13 +109,36 @@ class GCSSource(Source):
             The iterable of sources from the GCS bucket.
         """
         with trace() as outputs:
-            async with await cls._get_storage() as storage:
-                result = await storage.list_objects(bucket, params={"prefix": prefix})
-                items = result.get("items", [])
-                outputs.results = [
-                    cls(bucket=bucket, object_name=item["name"]) for item in items if not item["name"].endswith("/")
-                ]
-                return outputs.results
+            outputs.results = [source async for source in cls.iter_sources(bucket=bucket, prefix=prefix)]
+            return outputs.results
+
+    @classmethod
+    @requires_dependencies(["gcloud.aio.storage"], "gcs")
+    async def iter_sources(cls, bucket: str, prefix: str = "") -> AsyncIterator[Self]:
+        """
+        List all sources in the given GCS bucket, matching the prefix, lazily, requesting the next page
+        of the listing only after the sources of the previous one are consumed.
+
+        Args:
+            bucket: The GCS bucket.
+            prefix: The prefix to match.
+
+        Yields:
+            The sources from the GCS bucket.
+        """
+        async with await cls._get_storage() as storage:
+            params = {"prefix": prefix}
+            while True:
+                result = await storage.list_objects(bucket, params=params)
+                for item in result.get("items", []):
+                    if item["name"].endswith("/"):
+                        continue
+                    source = cls(bucket=bucket, object_name=item["name"])
+                    source._etag = item.get("etag")
+                    yield source
+                if not (page_token := result.get("nextPageToken")):
+                    break
+                params = {"prefix": prefix, "pageToken": page_token}
 
     @classmethod
     @traceable
@@ -113,6 +156,47 @@ class GCSSource(Source):
         Returns:
             The iterable of sources from the GCS bucket.
 
+        Raises:
+            ValueError: If an unsupported pattern is used
+        """
+        bucket, prefix, is_prefix = cls._parse_uri(path)
+        if is_prefix:
+            return await cls.list_sources(bucket=bucket, prefix=prefix)
+
+        return [cls(bucket=bucket, object_name=prefix)]
+
+    @classmethod
+    async def iter_from_uri(cls, path: str) -> AsyncIterator[Self]:
+        """
+        Create GCSSource instances from a URI path lazily, listing the bucket page by page.
+
+        Args:
+            path: The URI path in the format described in `from_uri`.
+
+        Yields:
+            The sources from the GCS bucket.
+
+        Raises:
+            ValueError: If an unsupported pattern is used
+        """
+        bucket, prefix, is_prefix = cls._parse_uri(path)
+        if is_prefix:
+            async for source in cls.iter_sources(bucket=bucket, prefix=prefix):
+                yield source
+        else:
+            yield cls(bucket=bucket, object_name=prefix)
+
+    @staticmethod
+    def _parse_uri(path: str) -> tuple[str, str, bool]:
+        """
+        Parse the GCS URI path into the bucket and the object name.
+
+        Args:
+            path: The URI path in the format described in `from_uri`.
+
+        Returns:
+            The bucket, the object name or the prefix of the object names, and whether it is a prefix.
+
         Raises:
             ValueError: If an unsupported pattern is used
         """
@@ -128,7 +212,6 @@ class GCSSource(Source):
             if not prefix.endswith("*"):
                 raise ValueError(f"GCSSource only supports '*' at the end of path. Invalid pattern: {prefix}")
             # Remove the trailing * for GCS prefix listing
-            prefix = prefix[:-1]
-            return await cls.list_sources(bucket=bucket, prefix=prefix)
+            return bucket, prefix[:-1], True
 
-        return [cls(bucket=bucket, object_name=prefix)]
+        return bucket, prefix, False
@@ -1,5 +1,6 @@
+import asyncio
 import os
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
 from contextlib import suppress
 from enum import Enum
 from pathlib import Path
@@ -9,11 +10,15 @@ from typing_extensions import Self
 
 from ragbits.core.audit.traces import trace, traceable
 from ragbits.core.sources.base import Source, get_local_storage_dir
+from ragbits.core.sources.download import run_download
 from ragbits.core.utils.decorators import requires_dependencies
 
 with suppress(ImportError):
+    import httplib2
     from google.auth import exceptions
+    from google.auth.credentials import Credentials
     from google.oauth2 import service_account
+    from google_auth_httplib2 import AuthorizedHttp
     from googleapiclient.discovery import Resource as GoogleAPIResource
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
@@ -27,6 +32,10 @@ _IMPERSONATION_SCOPES = [
     "https://www.googleapis.com/auth/drive",  # Example: For Google Drive API
 ]
 
+# The maximum number of folders listed at once during the recursive listing, and the size of the listed pages
+_LIST_CONCURRENCY = 8
+_LIST_PAGE_SIZE = 1000
+
 # HTTP status codes
 _HTTP_NOT_FOUND = 404
 _HTTP_FORBIDDEN = 403
@@ -85,6 +94,7 @@ class GoogleDriveSource(Source):
     protocol: ClassVar[str] = "google_drive"
 
     _google_drive_client: ClassVar["GoogleAPIResource | None"] = None
+    _google_drive_credentials: ClassVar["Credentials | None"] = None
     _credentials_file_path: ClassVar[str | None] = None
     impersonate: ClassVar[bool | None] = None
     impersonate_target_email: ClassVar[str | None] = None
@@ -140,6 +150,7 @@ class GoogleDriveSource(Source):
         creds = service_account.Credentials.from_service_account_file(**cred_kwargs)
 
         cls._google_drive_client = build("drive", "v3", credentials=creds)
+        cls._google_drive_credentials = creds
         cls._google_drive_client.files().list(
             pageSize=1, fields="files(id)", supportsAllDrives=True, includeItemsFromAllDrives=True
         ).execute()
@@ -179,6 +190,22 @@ class GoogleDriveSource(Source):
                 ) from e
         return cls._google_drive_client
 
+    @classmethod
+    def _get_credentials(cls) -> "Credentials | None":
+        """
+        Get the credentials of the Google Drive API client, used to authorize the HTTP transports
+        of the requests running in threads. Initializes the client if not already set.
+
+        Returns:
+            The credentials of the client, or None if the client was set without them.
+
+        Raises:
+            ValueError: If credentials file path is not set or file does not exist.
+            RuntimeError: If another error occurs during client initialization or API verification.
+        """
+        cls._get_client()
+        return cls._google_drive_credentials
+
     @property
     def id(self) -> str:
         """
@@ -257,19 +284,9 @@ class GoogleDriveSource(Source):
         with trace(file_id=self.file_id, file_name=self.file_name, mime_type=self.mime_type) as outputs:
             if not path.is_file():
                 client = self._get_client()
+                credentials = self._get_credentials()
                 try:
-                    request = None
-                    if self.mime_type.startswith("application/vnd.google-apps"):
-                        request = client.files().export_media(fileId=self.file_id, mimeType=export_mime_type)
-                    else:
-                        request = client.files().get_media(fileId=self.file_id)
-
-                    with open(path, "wb") as fh:
-                        downloader = MediaIoBaseDownload(fh, request)
-                        done = False
-                        while not done:
-                            _, done = downloader.next_chunk()
-
+                    await run_download(self._download, client, credentials, path, export_mime_type)
                 except HttpError as e:
                     if e.resp.status == _HTTP_NOT_FOUND:
                         raise FileNotFoundError(f"File with ID {self.file_id} not found on Google Drive.") from e
@@ -281,6 +298,32 @@ class GoogleDriveSource(Source):
             outputs.path = path
         return path
 
+    def _download(
+        self, client: "GoogleAPIResource", credentials: "Credentials | None", path: Path, export_mime_type: str
+    ) -> None:
+        """
+        Download the file to the local path, blocking until the download completes.
+
+        Args:
+            client: The Google Drive API client.
+            credentials: The credentials authorizing the HTTP transport of the download.
+            path: The local path to download the file to.
+            export_mime_type: The MIME type Google-native documents are exported to.
+        """
+        if self.mime_type.startswith("application/vnd.google-apps"):
+            request = client.files().export_media(fileId=self.file_id, mimeType=export_mime_type)
+        else:
+            request = client.files().get_media(fileId=self.file_id)
+        # The HTTP transport of the client is not thread-safe, so each download uses its own one.
+        if credentials is not None:
+            request.http = AuthorizedHttp(credentials, http=httplib2.Http())
+
+        with open(path, "wb") as fh:
+            downloader = MediaIoBaseDownload(fh, request)
+            done = False
+            while not done:
+                _, done = downloader.next_chunk()
+
     @classmethod
     @requires_dependencies(["googleapiclient"], "google_drive")
     async def list_sources(cls, drive_id: str, recursive: bool = True) -> Iterable[Self]:
@@ -296,55 +339,73 @@ class GoogleDriveSource(Source):
             An iterable of GoogleDriveSource instances representing the found files.
         """
         with trace(drive_id=drive_id, recursive=recursive) as outputs:
-            client = cls._get_client()
+            outputs.results = [source async for source in cls.iter_sources(drive_id=drive_id, recursive=recursive)]
+            return outputs.results
 
-            # Check if the drive_id is a folder, shared drive, or file
-            is_folder, is_shared_drive, root_file_name = await cls._check_drive_type(client, drive_id)
+    @classmethod
+    @requires_dependencies(["googleapiclient"], "google_drive")
+    async def iter_sources(cls, drive_id: str, recursive: bool = True) -> AsyncIterator[Self]:
+        """
+        Lists all files (and optionally recursively, subfolders and their files) within a given Google Drive
+        folder/Shared Drive ID lazily. Subfolders are listed concurrently, and the files are yielded as soon as
+        the page listing them arrives.
 
-            # If it's not a folder, return the single file
-            if not is_folder:
-                if not root_file_name:  # Error occurred in _check_drive_type
-                    outputs.results = []
-                    return outputs.results
+        Args:
+            drive_id: The ID of the folder or Shared Drive to list files from.
+            recursive: If True, lists files in subfolders recursively.
 
-                file_meta = (
-                    client.files().get(fileId=drive_id, fields="id, name, mimeType", supportsAllDrives=True).execute()
-                )
-                outputs.results = [
-                    cls(
-                        file_id=file_meta["id"],
-                        file_name=file_meta["name"],
-                        mime_type=file_meta["mimeType"],
-                        is_folder=False,
-                    )
-                ]
-                return outputs.results
+        Yields:
+            GoogleDriveSource instances representing the found files.
+        """
+        client = cls._get_client()
 
-            # Process folder contents
-            all_files_info: dict[str, Any] = {}
+        # Check if the drive_id is a folder, shared drive, or file
+        is_folder, is_shared_drive, root_file_name = await cls._check_drive_type(client, drive_id)
 
-            await cls._recursive_list_files(client, drive_id, all_files_info, recursive, is_shared_drive)
+        # If it's not a folder, return the single file
+        if not is_folder:
+            if not root_file_name:  # Error occurred in _check_drive_type
+                return
 
-            sources = [
-                cls(file_id=info["id"], file_name=info["name"], mime_type=info["mimeType"], is_folder=info["is_folder"])
-                for info in all_files_info.values()
-            ]
-            outputs.results = sources
-            return outputs.results
+            file_meta = await asyncio.to_thread(
+                client.files().get(fileId=drive_id, fields="id, name, mimeType", supportsAllDrives=True).execute
+            )
+            yield cls(
+                file_id=file_meta["id"],
+                file_name=file_meta["name"],
+                mime_type=file_meta["mimeType"],
+                is_folder=False,
+            )
+            return
+
+        # Process folder contents
+        credentials = cls._get_credentials()
+        async for info in cls._iter_folder_files(client, credentials, drive_id, recursive, is_shared_drive):
+            yield cls(
+                file_id=info["id"], file_name=info["name"], mime_type=info["mimeType"], is_folder=info["is_folder"]
+            )
 
     @classmethod
-    async def _recursive_list_files(
+    async def _iter_folder_files(  # noqa: PLR0915
         cls,
         client: "GoogleAPIResource",
+        credentials: "Credentials | None",
         drive_id: str,
-        all_files_info: dict[str, Any],
         recursive: bool,
         is_shared_drive: bool,
-    ) -> None:
-        """Helper method to recursively list files in a drive/folder."""
-
-        async def _recursive_list(
-            current_folder_id: str, current_path_prefix: str = "", current_root_shared_drive_id: str | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Helper method listing the files in a drive/folder, listing up to `_LIST_CONCURRENCY` subfolders at once.
+        """
+        files: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(_LIST_PAGE_SIZE)
+        folders: asyncio.Queue[tuple[str, str, str | None]] = asyncio.Queue()
+        folders.put_nowait((drive_id, "", drive_id if is_shared_drive else None))
+
+        async def _list_folder(
+            http: "AuthorizedHttp | None",
+            current_folder_id: str,
+            current_path_prefix: str,
+            current_root_shared_drive_id: str | None,
         ) -> None:
             page_token = None
             query = f"'{current_folder_id}' in parents and trashed = false"
@@ -354,7 +415,7 @@ class GoogleDriveSource(Source):
                     list_params = {
                         "q": query,
                         "fields": "nextPageToken, files(id, name, mimeType)",
-                        "pageSize": 1000,
+                        "pageSize": _LIST_PAGE_SIZE,
                         "pageToken": page_token,
                         "supportsAllDrives": True,
                         "includeItemsFromAllDrives": True,
@@ -364,7 +425,7 @@ class GoogleDriveSource(Source):
                         list_params["corpora"] = "drive"
                         list_params["driveId"] = current_root_shared_drive_id
 
-                    results = client.files().list(**list_params).execute()
+                    results = await asyncio.to_thread(client.files().list(**list_params).execute, http=http)
 
                     items = results.get("files", [])
                     for item in items:
@@ -376,15 +437,17 @@ class GoogleDriveSource(Source):
                                 if not next_root_shared_drive_id and is_shared_drive and current_folder_id == drive_id:
                                     next_root_shared_drive_id = drive_id
 
-                                await _recursive_list(item["id"], full_local_name, next_root_shared_drive_id)
-                        elif item["id"] not in all_files_info:
-                            all_files_info[item["id"]] = {
-                                "id": item["id"],
-                                "name": item["name"],
-                                "mimeType": item["mimeType"],
-                                "is_folder": False,
-                                "path_in_drive": full_local_name,
-                            }
+                                folders.put_nowait((item["id"], full_local_name, next_root_shared_drive_id))
+                        else:
+                            await files.put(
+                                {
+                                    "id": item["id"],
+                                    "name": item["name"],
+                                    "mimeType": item["mimeType"],
+                                    "is_folder": False,
+                                    "path_in_drive": full_local_name,
+                                }
+                            )
 
                     page_token = results.get("nextPageToken", None)
                     if not page_token:
@@ -403,7 +466,38 @@ class GoogleDriveSource(Source):
                         outputs.error = f"An unexpected error occurred while listing folder {current_folder_id}: {e}"
                     break
 
-        await _recursive_list(drive_id, current_root_shared_drive_id=(drive_id if is_shared_drive else None))
+        async def _work(http: "AuthorizedHttp | None") -> None:
+            while True:
+                folder = await folders.get()
+                try:
+                    await _list_folder(http, *folder)
+                finally:
+                    folders.task_done()
+
+        async def _traverse() -> None:
+            workers: list[asyncio.Task] = []
+            try:
+                # The HTTP transport of the client is not thread-safe, so each worker uses its own one.
+                # A client set without credentials is used by a single worker.
+                for _ in range(_LIST_CONCURRENCY if credentials is not None else 1):
+                    http = AuthorizedHttp(credentials, http=httplib2.Http()) if credentials is not None else None
+                    workers.append(asyncio.create_task(_work(http)))
+                await folders.join()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await files.put(None)
+
+        traversal = asyncio.create_task(_traverse())
+        listed_ids: set[str] = set()
+        try:
+            while (info := await files.get()) is not None:
+                if info["id"] not in listed_ids:
+                    listed_ids.add(info["id"])
+                    yield info
+            await traversal
+        finally:
+            traversal.cancel()
 
     @classmethod
     async def _check_drive_type(cls, client: "GoogleAPIResource", drive_id: str) -> tuple[bool, bool, str]:
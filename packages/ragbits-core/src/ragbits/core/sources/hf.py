@@ -1,5 +1,6 @@
+import asyncio
 import re
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
 from pathlib import Path
 from typing import ClassVar
 
@@ -7,6 +8,7 @@ from typing_extensions import Self
 
 from ragbits.core.audit.traces import trace, traceable
 from ragbits.core.sources.base import Source, get_local_storage_dir
+from ragbits.core.sources.download import run_download
 from ragbits.core.sources.exceptions import SourceConnectionError, SourceNotFoundError
 from ragbits.core.utils.decorators import requires_dependencies
 
@@ -45,32 +47,9 @@ class HuggingFaceSource(Source):
             SourceConnectionError: If the source connection fails.
             SourceNotFoundError: If the source document is not found.
         """
-        from datasets import load_dataset
-        from datasets.exceptions import DatasetNotFoundError
-
         with trace(path=self.path, split=self.split, row=self.row) as outputs:
             if self.row is not None:
-                try:
-                    dataset = load_dataset(self.path, split=self.split, streaming=True)
-                except ConnectionError as exc:
-                    raise SourceConnectionError() from exc
-                except DatasetNotFoundError as exc:
-                    raise SourceNotFoundError(source_id=self.id) from exc
-
-                try:
-                    data = next(iter(dataset.skip(self.row).take(1)))
-                except StopIteration as exc:
-                    raise SourceNotFoundError(source_id=self.id) from exc
-
-                storage_dir = get_local_storage_dir()
-                source_dir = storage_dir / Path(data["source"]).parent
-                source_dir.mkdir(parents=True, exist_ok=True)
-                path = storage_dir / data["source"]
-
-                if not path.is_file():
-                    with open(path, mode="w", encoding="utf-8") as file:
-                        file.write(data["content"])
-                outputs.path = path
+                outputs.path = await run_download(self._download_row)
             else:
                 storage_dir = get_local_storage_dir()
                 source_dir = storage_dir / self.path
@@ -78,18 +57,70 @@ class HuggingFaceSource(Source):
                 path = source_dir / f"{self.split}.json"
 
                 if not path.is_file():
-                    try:
-                        dataset = load_dataset(self.path, split=self.split)
-                    except ConnectionError as exc:
-                        raise SourceConnectionError() from exc
-                    except DatasetNotFoundError as exc:
-                        raise SourceNotFoundError(source_id=self.id) from exc
-
-                    dataset.to_json(path)
+                    await run_download(self._download_split, path)
                 outputs.path = path
 
         return outputs.path
 
+    def _download_row(self) -> Path:
+        """
+        Download the row of the dataset and store its content locally, blocking until the download completes.
+
+        Returns:
+            The local path to the content of the row.
+
+        Raises:
+            SourceConnectionError: If the source connection fails.
+            SourceNotFoundError: If the source document is not found.
+        """
+        from datasets import load_dataset
+        from datasets.exceptions import DatasetNotFoundError
+
+        try:
+            dataset = load_dataset(self.path, split=self.split, streaming=True)
+        except ConnectionError as exc:
+            raise SourceConnectionError() from exc
+        except DatasetNotFoundError as exc:
+            raise SourceNotFoundError(source_id=self.id) from exc
+
+        try:
+            data = next(iter(dataset.skip(self.row).take(1)))
+        except StopIteration as exc:
+            raise SourceNotFoundError(source_id=self.id) from exc
+
+        storage_dir = get_local_storage_dir()
+        source_dir = storage_dir / Path(data["source"]).parent
+        source_dir.mkdir(parents=True, exist_ok=True)
+        path = storage_dir / data["source"]
+
+        if not path.is_file():
+            with open(path, mode="w", encoding="utf-8") as file:
+                file.write(data["content"])
+        return path
+
+    def _download_split(self, path: Path) -> None:
+        """
+        Download the split of the dataset and store it locally as JSON, blocking until the download completes.
+
+        Args:
+            path: The local path to store the split at.
+
+        Raises:
+            SourceConnectionError: If the source connection fails.
+            SourceNotFoundError: If the source document is not found.
+        """
+        from datasets import load_dataset
+        from datasets.exceptions import DatasetNotFoundError
+
+        try:
+            dataset = load_dataset(self.path, split=self.split)
+        except ConnectionError as exc:
+            raise SourceConnectionError() from exc
+        except DatasetNotFoundError as exc:
+            raise SourceNotFoundError(source_id=self.id) from exc
+
+        dataset.to_json(path)
+
     @classmethod
     @traceable
     async def list_sources(cls, path: str, split: str) -> Iterable[Self]:
@@ -103,18 +134,31 @@ class HuggingFaceSource(Source):
         Returns:
             The iterable of sources from the Hugging Face repository.
         """
+        return [source async for source in cls.iter_sources(path=path, split=split)]
+
+    @classmethod
+    async def iter_sources(cls, path: str, split: str) -> AsyncIterator[Self]:
+        """
+        List all sources in the Hugging Face repository lazily. The dataset is loaded in a thread,
+        and a source is created for each row only when it is consumed.
+
+        Args:
+            path: Path or name of the dataset.
+            split: Dataset split.
+
+        Yields:
+            The sources from the Hugging Face repository.
+        """
         from datasets import load_dataset
 
-        sources = load_dataset(path, split=split)
+        sources = await asyncio.to_thread(load_dataset, path, split=split)
         cleaned_split = re.sub(r"\[.*?\]", "", split)
-        return [
-            cls(
+        for row in range(len(sources)):
+            yield cls(
                 path=path,
                 split=cleaned_split,
                 row=row,
             )
-            for row in range(len(sources))
-        ]
 
     @classmethod
     @traceable
@@ -1,4 +1,6 @@
-from collections.abc import Iterable
+import asyncio
+from collections.abc import AsyncIterator, Iterable, Iterator
+from itertools import islice
 from pathlib import Path
 from typing import ClassVar
 
@@ -8,6 +10,9 @@ from ragbits.core.audit.traces import traceable
 from ragbits.core.sources.base import Source
 from ragbits.core.sources.exceptions import SourceNotFoundError
 
+# The number of paths matched by the glob pattern at once when listing the sources lazily.
+_LIST_PAGE_SIZE = 1000
+
 
 class LocalFileSource(Source):
     """
@@ -39,6 +44,18 @@ class LocalFileSource(Source):
             raise SourceNotFoundError(source_id=self.id)
         return self.path
 
+    async def fingerprint(self) -> str | None:
+        """
+        Get the fingerprint of the file, based on its size and modification time.
+
+        Returns:
+            The fingerprint, or None if the file doesn't exist.
+        """
+        if not self.path.is_file():
+            return None
+        stat = self.path.stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
     @classmethod
     @traceable
     async def list_sources(cls, path: Path, file_pattern: str = "*") -> Iterable[Self]:
@@ -52,7 +69,23 @@ class LocalFileSource(Source):
         Returns:
             The iterable of sources from the local file system.
         """
-        return [cls(path=file_path) for file_path in path.glob(file_pattern)]
+        return [source async for source in cls.iter_sources(path, file_pattern)]
+
+    @classmethod
+    async def iter_sources(cls, path: Path, file_pattern: str = "*") -> AsyncIterator[Self]:
+        """
+        List all sources in the given directory, matching the file pattern, lazily. The directory is walked
+        in a thread, a page of paths at a time.
+
+        Args:
+            path: The path to the directory.
+            file_pattern: The file pattern to match.
+
+        Yields:
+            The sources from the local file system.
+        """
+        async for file_path in cls._iter_glob(path, file_pattern):
+            yield cls(path=file_path)
 
     @classmethod
     @traceable
@@ -78,7 +111,45 @@ class LocalFileSource(Source):
             return [cls(path=base_path)]
         if not pattern:
             return []
-        return [cls(path=f) for f in base_path.glob(pattern) if f.is_file()]
+        return [source async for source in cls.iter_from_uri(path)]
+
+    @classmethod
+    async def iter_from_uri(cls, path: str) -> AsyncIterator[Self]:
+        """
+        Create LocalFileSource instances from a URI path lazily, yielding the files as soon as they are matched.
+
+        Args:
+            path: The URI path in the format described in `from_uri`.
+
+        Yields:
+            The sources from the local file system.
+        """
+        base_path, pattern = cls._split_path_and_pattern(path=Path(path))
+        if base_path.is_file():
+            yield cls(path=base_path)
+        elif pattern:
+            async for file_path in cls._iter_glob(base_path, pattern, files_only=True):
+                yield cls(path=file_path)
+
+    @staticmethod
+    async def _iter_glob(path: Path, pattern: str, files_only: bool = False) -> AsyncIterator[Path]:
+        """
+        Match the glob pattern in a thread, a page of paths at a time, so that the event loop isn't blocked.
+
+        Args:
+            path: The path to the directory.
+            pattern: The glob pattern to match.
+            files_only: Whether to skip the matched directories.
+
+        Yields:
+            The matched paths.
+        """
+        paths: Iterator[Path] = path.glob(pattern)
+        if files_only:
+            paths = (file_path for file_path in paths if file_path.is_file())
+        while page := await asyncio.to_thread(lambda: list(islice(paths, _LIST_PAGE_SIZE))):
+            for file_path in page:
+                yield file_path
 
     @staticmethod
     def _split_path_and_pattern(path: Path) -> tuple[Path, str]:
@@ -1,17 +1,21 @@
-from collections.abc import Iterable
+import asyncio
+from collections.abc import AsyncIterator, Iterable
 from contextlib import suppress
 from pathlib import Path
 from typing import ClassVar, Optional
 from urllib.parse import urlparse
 
+from pydantic import PrivateAttr
 from typing_extensions import Self
 
 from ragbits.core.audit.traces import trace, traceable
 from ragbits.core.sources.base import Source, get_local_storage_dir
+from ragbits.core.sources.download import run_download
 from ragbits.core.utils.decorators import requires_dependencies
 
 with suppress(ImportError):
     import boto3
+    from boto3.s3.transfer import TransferConfig
     from botocore.client import BaseClient
     from botocore.exceptions import ClientError, NoCredentialsError, PartialCredentialsError
 
@@ -26,6 +30,10 @@ class S3Source(Source):
     key: str
 
     _s3_client: ClassVar[Optional["BaseClient"]] = None
+    # The size of the objects above which they are downloaded in parts, and the number of parts downloaded at once
+    _multipart_threshold: ClassVar[int] = 8 * 1024 * 1024
+    _multipart_concurrency: ClassVar[int] = 8
+    _etag: str | None = PrivateAttr(default=None)
 
     @property
     def id(self) -> str:
@@ -81,7 +89,16 @@ class S3Source(Source):
         path = container_local_dir / normalized_key
         with trace(bucket=self.bucket_name, key=self.key) as outputs:
             try:
-                self._s3_client.download_file(self.bucket_name, self.key, path)
+                await run_download(
+                    self._s3_client.download_file,
+                    self.bucket_name,
+                    self.key,
+                    str(path),
+                    Config=TransferConfig(
+                        multipart_threshold=self._multipart_threshold,
+                        max_concurrency=self._multipart_concurrency,
+                    ),
+                )
             except ClientError as e:
                 if e.response["Error"]["Code"] == "404":
                     raise FileNotFoundError(f"The object does not exist: {self.key}") from e
@@ -94,6 +111,27 @@ class S3Source(Source):
             outputs.path = path
         return path
 
+    @requires_dependencies(["boto3"], "s3")
+    async def fingerprint(self) -> str | None:
+        """
+        Get the fingerprint of the object, based on its ETag. The ETag returned by the listing is used if available,
+        otherwise it's requested from S3 without downloading the object.
+
+        Returns:
+            The ETag of the object.
+        """
+        if self._etag is not None:
+            return self._etag
+
+        if self._s3_client is None:
+            self._set_client(self.bucket_name)
+
+        if self._s3_client is None:
+            raise RuntimeError("S3 client is not initialized.")
+
+        response = await asyncio.to_thread(self._s3_client.head_object, Bucket=self.bucket_name, Key=self.key)
+        return response["ETag"]
+
     @classmethod
     @requires_dependencies(["boto3"], "s3")
     async def list_sources(cls, bucket_name: str, prefix: str) -> Iterable[Self]:
@@ -107,6 +145,30 @@ class S3Source(Source):
         Returns:
             The iterable of sources from the S3 bucket.
 
+        Raises:
+            ClientError: If the source doesn't exist.
+            NoCredentialsError: If no credentials are available.
+            PartialCredentialsError: If credentials are incomplete.
+        """
+        with trace(bucket=bucket_name, key=prefix) as outputs:
+            aws_sources_list = [source async for source in cls.iter_sources(bucket_name=bucket_name, prefix=prefix)]
+            outputs.sources = aws_sources_list
+            return aws_sources_list
+
+    @classmethod
+    @requires_dependencies(["boto3"], "s3")
+    async def iter_sources(cls, bucket_name: str, prefix: str) -> AsyncIterator[Self]:
+        """
+        List all files under the given bucket name and with the given prefix lazily, requesting the next page
+        of the listing only after the sources of the previous one are consumed.
+
+        Args:
+            bucket_name: The name of the S3 bucket to use.
+            prefix: The path to the files and prefix to look for.
+
+        Yields:
+            The sources from the S3 bucket.
+
         Raises:
             ClientError: If the source doesn't exist.
             NoCredentialsError: If no credentials are available.
@@ -115,20 +177,18 @@ class S3Source(Source):
         cls._set_client(bucket_name)
         if cls._s3_client is None:
             raise RuntimeError("S3 client is not initialized.")
-        with trace(bucket=bucket_name, key=prefix) as outputs:
-            try:
-                aws_sources_list = []
-                paginator = cls._s3_client.get_paginator("list_objects_v2")
-                for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
-                    for obj in page.get("Contents", []):
-                        key = obj["Key"]
-                        aws_sources_list.append(cls(bucket_name=bucket_name, key=key))
-                outputs.sources = aws_sources_list
-                return aws_sources_list
-            except (NoCredentialsError, PartialCredentialsError) as e:
-                raise ValueError("AWS credentials are missing or incomplete. Please configure them.") from e
-            except ClientError as e:
-                raise RuntimeError(f"Failed to list files in bucket {bucket_name}: {e}") from e
+        try:
+            paginator = cls._s3_client.get_paginator("list_objects_v2")
+            pages = iter(paginator.paginate(Bucket=bucket_name, Prefix=prefix))
+            while (page := await asyncio.to_thread(next, pages, None)) is not None:
+                for obj in page.get("Contents", []):
+                    source = cls(bucket_name=bucket_name, key=obj["Key"])
+                    source._etag = obj.get("ETag")
+                    yield source
+        except (NoCredentialsError, PartialCredentialsError) as e:
+            raise ValueError("AWS credentials are missing or incomplete. Please configure them.") from e
+        except ClientError as e:
+            raise RuntimeError(f"Failed to list files in bucket {bucket_name}: {e}") from e
 
     @classmethod
     @traceable
@@ -147,6 +207,47 @@ class S3Source(Source):
         Returns:
             The iterable of sources from the S3 bucket.
 
+        Raises:
+            ValueError: If the path has invalid format
+        """
+        bucket_name, key, is_prefix = cls._parse_uri(path)
+        if is_prefix:
+            return await cls.list_sources(bucket_name=bucket_name, prefix=key)
+
+        return [cls(bucket_name=bucket_name, key=key)]
+
+    @classmethod
+    async def iter_from_uri(cls, path: str) -> AsyncIterator[Self]:
+        """
+        Create S3Source instances from a URI path lazily, listing the bucket page by page.
+
+        Args:
+            path: The URI path in the format described in `from_uri`.
+
+        Yields:
+            The sources from the S3 bucket.
+
+        Raises:
+            ValueError: If the path has invalid format
+        """
+        bucket_name, key, is_prefix = cls._parse_uri(path)
+        if is_prefix:
+            async for source in cls.iter_sources(bucket_name=bucket_name, prefix=key):
+                yield source
+        else:
+            yield cls(bucket_name=bucket_name, key=key)
+
+    @staticmethod
+    def _parse_uri(path: str) -> tuple[str, str, bool]:
+        """
+        Parse the S3 URI path into the bucket name and the key.
+
+        Args:
+            path: The URI path in the format described in `from_uri`.
+
+        Returns:
+            The bucket name, the key or the prefix of the keys, and whether it is a prefix.
+
         Raises:
             ValueError: If the path has invalid format
         """
@@ -181,7 +282,6 @@ class S3Source(Source):
         if "*" in path_to_file:
             if not path_to_file.endswith("*") or "*" in path_to_file[:-1]:
                 raise ValueError(f"AWS Source only supports '*' at the end of path. Invalid pattern: {[path_to_file]}.")
-            path_to_file = path_to_file[:-1]
-            return await cls.list_sources(bucket_name=bucket_name, prefix=path_to_file)
+            return bucket_name, path_to_file[:-1], True
 
-        return [cls(bucket_name=bucket_name, key=path_to_file)]
+        return bucket_name, path_to_file, False
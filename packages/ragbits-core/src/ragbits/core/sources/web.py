@@ -8,6 +8,7 @@ import aiohttp
 from typing_extensions import Self
 
 from ragbits.core.sources.base import Source, get_local_storage_dir
+from ragbits.core.sources.download import download_slot, shared_http_session
 from ragbits.core.sources.exceptions import SourceDownloadError, SourceNotFoundError
 
 
@@ -49,7 +50,11 @@ class WebSource(Source):
         path = container_local_dir / normalized_url_path
 
         try:
-            async with aiohttp.ClientSession() as session, session.get(self.url, headers=self.headers) as response:
+            async with (
+                download_slot(),
+                shared_http_session() as session,
+                session.get(self.url, headers=self.headers) as response,
+            ):
                 if response.ok:
                     with open(path, "wb") as f:
                         async for chunk in response.content.iter_chunked(1024):
@@ -0,0 +1,98 @@
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+ItemT = TypeVar("ItemT")
+ParamsT = TypeVar("ParamsT")
+ResultT = TypeVar("ResultT")
+
+
+@dataclass
+class _PendingBatch(Generic[ItemT]):
+    """
+    Items of concurrent calls waiting to be processed in a single batch.
+    """
+
+    items: list[ItemT] = field(default_factory=list)
+    futures: list[tuple[int, int, asyncio.Future]] = field(default_factory=list)
+    flush_task: asyncio.Task | None = None
+
+
+class MicroBatcher(Generic[ItemT, ParamsT, ResultT]):
+    """
+    Groups the items of concurrent calls with equal parameters into a single call of the batch function,
+    and scatters its results back to the callers.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[ItemT], ParamsT], Awaitable[ResultT]],
+        window: float = 0.0,
+        key: Callable[[ParamsT], Any] | None = None,
+    ) -> None:
+        """
+        Constructs a new MicroBatcher instance.
+
+        Args:
+            process_batch: The function processing the items of a batch, returning one result per item.
+            window: The number of seconds to wait for concurrent calls after the first call of a batch.
+            key: The function returning the JSON-serializable representation of the parameters. Only calls with
+                equal representations are batched together. Defaults to the parameters themselves.
+        """
+        self.process_batch = process_batch
+        self.window = window
+        self.key = key
+        self._pending_batches: dict[str, _PendingBatch[ItemT]] = {}
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_pending_batches"] = {}
+        return state
+
+    async def submit(self, items: list[ItemT], params: ParamsT) -> ResultT:
+        """
+        Adds the items to the batch pending for the given parameters and waits for their results.
+
+        Args:
+            items: The items to process.
+            params: The parameters of the batch function.
+
+        Returns:
+            The results of the given items.
+        """
+        key = json.dumps(self.key(params) if self.key else params, sort_keys=True, default=str)
+        batch = self._pending_batches.get(key)
+        if batch is None:
+            batch = self._pending_batches[key] = _PendingBatch()
+            batch.flush_task = asyncio.create_task(self._flush(key, batch, params))
+
+        future = asyncio.get_running_loop().create_future()
+        batch.futures.append((len(batch.items), len(batch.items) + len(items), future))
+        batch.items.extend(items)
+        return await future
+
+    async def _flush(self, key: str, batch: _PendingBatch[ItemT], params: ParamsT) -> None:
+        """
+        Processes the items of the pending batch once the window passes and scatters the results.
+
+        Args:
+            key: The key of the pending batch.
+            batch: The pending batch.
+            params: The parameters of the batch function.
+        """
+        await asyncio.sleep(self.window)
+        del self._pending_batches[key]
+
+        try:
+            results = await self.process_batch(batch.items, params)
+        except Exception as exc:
+            for _, _, future in batch.futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for start, end, future in batch.futures:
+            if not future.done():
+                future.set_result(results[start:end])  # type: ignore[index]
@@ -1,5 +1,5 @@
 import os
-from collections.abc import Iterable, Iterator
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
 from itertools import islice
 from typing import TypeVar
 
@@ -34,3 +34,44 @@ def batched(data: Iterable[T], batch_size: int | None = None) -> Iterator[list[T
     it = iter(data)
     while batch := list(islice(it, batch_size)):
         yield batch
+
+
+async def aiterate(data: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    """
+    Iterates over the items of a synchronous or asynchronous iterable.
+
+    Args:
+        data: The data to iterate over.
+
+    Returns:
+        An asynchronous iterator of the items of the data.
+    """
+    if isinstance(data, AsyncIterable):
+        async for item in data:
+            yield item
+    else:
+        for item in data:
+            yield item
+
+
+async def abatched(data: Iterable[T] | AsyncIterable[T], batch_size: int | None = None) -> AsyncIterator[list[T]]:
+    """
+    Batches the synchronous or asynchronous data into chunks of the given size, consuming the data
+    only as the batches are requested.
+
+    Args:
+        data: The data to batch.
+        batch_size: The size of the batch. If None, no batching is performed.
+
+    Returns:
+        An asynchronous iterator of batches of the data when batch_size is provided,
+        or of a single batch with all the data when batch_size is None.
+    """
+    batch: list[T] = []
+    async for item in aiterate(data):
+        batch.append(item)
+        if batch_size is not None and len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -1,4 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 from enum import Enum
 from typing import ClassVar, TypeVar, cast
 from uuid import UUID
@@ -104,6 +106,25 @@ class VectorStore(ConfigurableComponent[VectorStoreOptionsT], ABC):
     default_module: ClassVar = vector_stores
     configuration_key: ClassVar = "vector_store"
 
+    _change_listeners: tuple[Callable[[], Awaitable[None]], ...] = ()
+
+    def add_change_listener(self, listener: Callable[[], Awaitable[None]]) -> None:
+        """
+        Register a function awaited whenever entries are stored in or removed from the vector store,
+        e.g. to invalidate cached results.
+
+        Args:
+            listener: The function to await after the change.
+        """
+        self._change_listeners = (*self._change_listeners, listener)
+
+    async def _notify_change(self) -> None:
+        """
+        Await the registered change listeners. Implementations call it once entries are stored or removed.
+        """
+        for listener in self._change_listeners:
+            await listener()
+
     @abstractmethod
     async def store(self, entries: list[VectorStoreEntry]) -> None:
         """
@@ -130,6 +151,26 @@ class VectorStore(ConfigurableComponent[VectorStoreOptionsT], ABC):
             The entries.
         """
 
+    async def retrieve_many(
+        self,
+        texts: list[str],
+        options: VectorStoreOptionsT | None = None,
+    ) -> list[list[VectorStoreResult]]:
+        """
+        Retrieve entries from the vector store most similar to each of the provided texts.
+
+        The default implementation runs the queries concurrently. Vector stores supporting batch search
+        override it to embed all the texts at once and send a single query to the backend.
+
+        Args:
+            texts: The texts to query the vector store with.
+            options: The options for querying the vector store, shared by all the queries.
+
+        Returns:
+            The entries for each of the texts, in the order of the texts.
+        """
+        return list(await asyncio.gather(*(self.retrieve(text, options) for text in texts)))
+
     @abstractmethod
     async def remove(self, ids: list[UUID]) -> None:
         """
@@ -139,6 +180,19 @@ class VectorStore(ConfigurableComponent[VectorStoreOptionsT], ABC):
             ids: The list of entries' IDs to remove.
         """
 
+    async def remove_where(self, where: WhereQuery) -> None:
+        """
+        Remove the entries matching the filter from the vector store.
+
+        The default implementation lists the matching entries and removes them by their IDs. Vector stores
+        supporting filtered deletion override it to delete the entries in a single query to the backend.
+
+        Args:
+            where: The filter dictionary - the keys are the field names and the values are the values to filter by.
+        """
+        if ids := [entry.id for entry in await self.list(where=where)]:
+            await self.remove(ids)
+
     @abstractmethod
     async def list(
         self, where: WhereQuery | None = None, limit: int | None = None, offset: int = 0
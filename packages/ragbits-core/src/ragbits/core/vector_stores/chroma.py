@@ -4,7 +4,7 @@ from uuid import UUID
 
 import chromadb
 from chromadb.api import ClientAPI
-from chromadb.api.types import IncludeMetadataDocuments, IncludeMetadataDocumentsEmbeddingsDistances
+from chromadb.api.types import IncludeMetadataDocuments, IncludeMetadataDocumentsEmbeddingsDistances, QueryResult
 from typing_extensions import Self
 
 from ragbits.core.audit.traces import trace
@@ -143,6 +143,7 @@ class ChromaVectorStore(VectorStoreWithDenseEmbedder[VectorStoreOptions]):
                 metadatas=metadatas,
                 documents=documents,
             )
+            await self._notify_change()
 
     def _calculate_score(self, distance: float) -> float:
         """
@@ -203,37 +204,107 @@ class ChromaVectorStore(VectorStoreWithDenseEmbedder[VectorStoreOptions]):
                 where=where_dict,
             )
 
-            ids = [id for batch in results.get("ids", []) for id in batch]
-            scores = [self._calculate_score(distance) for batch in results.get("distances") or [] for distance in batch]
-            documents = [document for batch in results.get("documents") or [] for document in batch]
-            embeddings = [embedding for batch in results.get("embeddings") or [] for embedding in batch]
+            outputs.results = [
+                result for batch in self._query_results_to_results(results, merged_options) for result in batch
+            ]
 
-            metadatas: Sequence = [dict(metadata) for batch in results.get("metadatas") or [] for metadata in batch]
+            return outputs.results
 
-            # Convert metadata back to nested structure
-            unflattened_metadatas: list[dict] = [unflatten_dict(metadata) if metadata else {} for metadata in metadatas]
+    async def retrieve_many(
+        self,
+        texts: list[str],
+        options: VectorStoreOptions | None = None,
+    ) -> list[list[VectorStoreResult]]:
+        """
+        Retrieves entries from the ChromaDB collection most similar to each of the provided texts. All the texts
+        are embedded in a single call and sent as a single multi-query.
 
-            images: list[bytes | None] = [metadata.pop("__image", None) for metadata in unflattened_metadatas]
+        Args:
+            texts: The texts to query the vector store with.
+            options: The options for querying the vector store.
 
-            outputs.results = [
-                VectorStoreResult(
-                    score=score,
-                    vector=vector,
-                    entry=VectorStoreEntry(
-                        id=id,
-                        text=document,
-                        image_bytes=image,
-                        metadata=metadata,
-                    ),
-                )
-                for id, metadata, score, document, image, vector in zip(
-                    ids, unflattened_metadatas, scores, documents, images, embeddings, strict=True
-                )
-                if merged_options.score_threshold is None or score >= merged_options.score_threshold
-            ]
+        Returns:
+            The retrieved entries for each of the texts, in the order of the texts.
+
+        Raises:
+            MetadataNotFoundError: If the metadata is not found.
+        """
+        merged_options = (self.default_options | options) if options else self.default_options
+
+        with trace(
+            texts=texts,
+            options=merged_options.dict(),
+            index_name=self._index_name,
+            collection=self._collection,
+            distance_method=self._distance_method,
+            embedder=repr(self._embedder),
+            embedding_type=self._embedding_type,
+        ) as outputs:
+            if not texts:
+                outputs.results = []
+                return outputs.results
+
+            query_vectors = cast(list[list[float]], await self._embedder.embed_text(texts))
+
+            results = self._collection.query(
+                query_embeddings=query_vectors,  # type: ignore[arg-type]
+                n_results=merged_options.k,
+                include=IncludeMetadataDocumentsEmbeddingsDistances,
+                where=self._create_chroma_filter(merged_options.where),
+            )
 
+            outputs.results = self._query_results_to_results(results, merged_options)
             return outputs.results
 
+    def _query_results_to_results(
+        self, results: QueryResult, options: VectorStoreOptions
+    ) -> list[list[VectorStoreResult]]:
+        """
+        Converts the results of a ChromaDB query to results above the score threshold, one list per query.
+
+        Args:
+            results: The results of the query.
+            options: The options for querying the vector store.
+
+        Returns:
+            The results of each of the queries.
+        """
+        batches = []
+        for ids, distances, documents, embeddings, metadatas in zip(
+            results.get("ids", []),
+            results.get("distances") or [],
+            results.get("documents") or [],
+            results.get("embeddings") or [],
+            results.get("metadatas") or [],
+            strict=True,
+        ):
+            # Convert metadata back to nested structure
+            unflattened_metadatas: list[dict] = [
+                unflatten_dict(dict(metadata)) if metadata else {} for metadata in metadatas
+            ]
+            images: list[bytes | None] = [metadata.pop("__image", None) for metadata in unflattened_metadatas]
+            scores = [self._calculate_score(distance) for distance in distances]
+
+            batches.append(
+                [
+                    VectorStoreResult(
+                        score=score,
+                        vector=vector,
+                        entry=VectorStoreEntry(
+                            id=id,
+                            text=document,
+                            image_bytes=image,
+                            metadata=metadata,
+                        ),
+                    )
+                    for id, metadata, score, document, image, vector in zip(
+                        ids, unflattened_metadatas, scores, documents, images, embeddings, strict=True
+                    )
+                    if options.score_threshold is None or score >= options.score_threshold
+                ]
+            )
+        return batches
+
     async def remove(self, ids: list[UUID]) -> None:
         """
         Remove entries from the vector store.
@@ -243,6 +314,18 @@ class ChromaVectorStore(VectorStoreWithDenseEmbedder[VectorStoreOptions]):
         """
         with trace(ids=ids, collection=self._collection, index_name=self._index_name):
             self._collection.delete(ids=[str(id) for id in ids])
+            await self._notify_change()
+
+    async def remove_where(self, where: WhereQuery) -> None:
+        """
+        Remove the entries matching the filter from the vector store, in a single filtered delete.
+
+        Args:
+            where: The filter dictionary - the keys are the field names and the values are the values to filter by.
+        """
+        with trace(where=where, collection=self._collection, index_name=self._index_name):
+            self._collection.delete(where=self._create_chroma_filter(where))
+            await self._notify_change()
 
     async def list(
         self, where: WhereQuery | None = None, limit: int | None = None, offset: int = 0
@@ -314,7 +397,10 @@ class ChromaVectorStore(VectorStoreWithDenseEmbedder[VectorStoreOptions]):
         if not where:
             return None
 
+        # Metadata is stored flattened, so nested filters are flattened to match its keys
+        flat_where = flatten_dict(where)
+
         # If there are multiple filters, combine them with $and
-        if len(where) > 1:
-            return cast(chromadb.Where, {"$and": [{k: v} for k, v in flatten_dict(where).items()]})
-        return cast(chromadb.Where, where)
+        if len(flat_where) > 1:
+            return cast(chromadb.Where, {"$and": [{k: v} for k, v in flat_where.items()]})
+        return cast(chromadb.Where, flat_where)
@@ -46,6 +46,7 @@ class HybridSearchVectorStore(VectorStore):
         """
         store_tasks = (vector_store.store(entries) for vector_store in self.vector_stores)
         await asyncio.gather(*store_tasks)
+        await self._notify_change()
 
     @traceable
     async def retrieve(
@@ -69,6 +70,29 @@ class HybridSearchVectorStore(VectorStore):
 
         return self.retrieval_strategy.join(results)
 
+    @traceable
+    async def retrieve_many(
+        self,
+        texts: list[str],
+        options: VectorStoreOptions | None = None,
+    ) -> list[list[VectorStoreResult]]:
+        """
+        Retrieve entries from the vector stores most similar to each of the provided texts. Each vector store
+        answers all the queries in a single batch, and the results of each query are combined using the retrieval
+        strategy provided in the constructor.
+
+        Args:
+            texts: The texts to query the vector stores with.
+            options: The options for querying the vector stores.
+
+        Returns:
+            The entries for each of the texts, in the order of the texts.
+        """
+        retrieve_tasks = (vector_store.retrieve_many(texts, options) for vector_store in self.vector_stores)
+        results = await asyncio.gather(*retrieve_tasks)
+
+        return [self.retrieval_strategy.join(list(text_results)) for text_results in zip(*results, strict=True)]
+
     @traceable
     async def remove(self, ids: list[UUID]) -> None:
         """
@@ -79,6 +103,17 @@ class HybridSearchVectorStore(VectorStore):
         """
         remove_tasks = (vector_store.remove(ids) for vector_store in self.vector_stores)
         await asyncio.gather(*remove_tasks)
+        await self._notify_change()
+
+    async def remove_where(self, where: WhereQuery) -> None:
+        """
+        Remove the entries matching the filter from all vector stores.
+
+        Args:
+            where: The filter dictionary - the keys are the field names and the values are the values to filter by.
+        """
+        await asyncio.gather(*(vector_store.remove_where(where) for vector_store in self.vector_stores))
+        await self._notify_change()
 
     @traceable
     async def list(
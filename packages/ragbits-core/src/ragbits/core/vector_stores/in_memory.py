@@ -1,8 +1,11 @@
-import math
+from array import array
+from collections.abc import Hashable, Iterable, Iterator
 from itertools import islice
-from typing import cast
+from typing import Any, Literal
 from uuid import UUID
 
+import numpy as np
+
 from ragbits.core.audit.traces import trace, traceable
 from ragbits.core.embeddings import Embedder, SparseVector
 from ragbits.core.vector_stores.base import (
@@ -15,6 +18,406 @@ from ragbits.core.vector_stores.base import (
 )
 
 
+class _DenseMatrixIndex:
+    """
+    Contiguous float32 matrix of dense vectors with an id <-> row mapping.
+
+    Rows of removed vectors are tombstoned and compacted away once they make up more than half of the matrix.
+    The matrix grows geometrically, so storing vectors one by one has amortized constant cost.
+    For the cosine distance, vectors are normalized once when added, so scoring is a single matrix-vector product.
+    """
+
+    _INITIAL_CAPACITY = 1024
+    _GROWTH_FACTOR = 2
+
+    def __init__(self, distance_method: Literal["l2", "ip", "cosine"] = "l2") -> None:
+        self._distance_method = distance_method
+        self._matrix: np.ndarray | None = None
+        self._sq_norms = np.empty(0, dtype=np.float64)
+        self._alive = np.empty(0, dtype=bool)
+        self._row_ids: list[UUID | None] = []
+        self._rows: dict[UUID, int] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, id: UUID) -> bool:
+        return id in self._rows
+
+    def row(self, id: UUID) -> int:
+        """
+        Returns the row of the vector with the given ID.
+        """
+        return self._rows[id]
+
+    def row_id(self, row: int) -> UUID:
+        """
+        Returns the ID of the vector stored in the given row.
+        """
+        return self._row_ids[row]  # type: ignore[return-value]
+
+    def vector(self, id: UUID) -> list[float]:
+        """
+        Returns the vector with the given ID as a list of floats (normalized for the cosine distance).
+        """
+        return self._matrix[self._rows[id]].tolist()  # type: ignore[index]
+
+    def add(self, vectors: dict[UUID, list[float]]) -> None:
+        """
+        Adds vectors to the index, overwriting the vectors of already present IDs in place.
+
+        Args:
+            vectors: The vectors mapped by ID.
+
+        Raises:
+            ValueError: If the vectors have a different dimension than the ones already stored.
+        """
+        if not vectors:
+            return
+
+        new_matrix = np.asarray(list(vectors.values()), dtype=np.float32)
+        if self._matrix is not None and new_matrix.shape[1] != self._matrix.shape[1]:
+            raise ValueError(f"Vector dimension mismatch: expected {self._matrix.shape[1]}, got {new_matrix.shape[1]}")
+
+        if self._distance_method == "cosine":
+            norms = np.linalg.norm(new_matrix, axis=1, keepdims=True)
+            new_matrix = np.divide(new_matrix, norms, out=np.zeros_like(new_matrix), where=norms > 0)
+
+        rows = np.empty(len(vectors), dtype=np.intp)
+        new_ids = [id for id in vectors if id not in self._rows]
+        self._reserve(self._size + len(new_ids), new_matrix.shape[1])
+        for i, id in enumerate(vectors):
+            if id not in self._rows:
+                self._rows[id] = self._size
+                self._row_ids.append(id)
+                self._size += 1
+            rows[i] = self._rows[id]
+
+        self._matrix[rows] = new_matrix  # type: ignore[index]
+        self._sq_norms[rows] = np.einsum("ij,ij->i", new_matrix, new_matrix, dtype=np.float64)
+        self._alive[rows] = True
+
+    def remove(self, ids: list[UUID]) -> None:
+        """
+        Tombstones the rows of the given IDs.
+
+        Args:
+            ids: The IDs of the vectors to remove.
+        """
+        for id in ids:
+            row = self._rows.pop(id, None)
+            if row is not None:
+                self._alive[row] = False
+                self._row_ids[row] = None
+
+        if self._size - len(self._rows) > max(self._size // 2, self._INITIAL_CAPACITY):
+            self._compact()
+
+    def scores(self, query: list[float], rows: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the scores between the query and the stored vectors in a single vectorized pass.
+        Following the "bigger is better" convention, the L2 score is the negative distance, while the inner product
+        and cosine scores are the similarities themselves.
+
+        Args:
+            query: The query vector.
+            rows: The rows to score. If not provided, all live rows are scored.
+
+        Returns:
+            The scored rows and their scores.
+        """
+        rows, scores = self.scores_many([query], rows)
+        return rows, scores[:, 0]
+
+    def scores_many(self, queries: list[list[float]], rows: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the scores between each of the queries and the stored vectors in a single matrix-matrix product.
+
+        Args:
+            queries: The query vectors.
+            rows: The rows to score. If not provided, all live rows are scored.
+
+        Returns:
+            The scored rows and the (rows, queries) matrix of their scores.
+        """
+        if self._matrix is None:
+            return np.empty(0, dtype=np.intp), np.empty((0, len(queries)), dtype=np.float32)
+
+        if rows is None:
+            rows = np.flatnonzero(self._alive[: self._size])
+
+        query_matrix = np.asarray(queries, dtype=np.float32)
+        if self._distance_method == "ip":
+            return rows, self._matrix[rows] @ query_matrix.T
+
+        if self._distance_method == "cosine":
+            query_norms = np.linalg.norm(query_matrix, axis=1, keepdims=True)
+            query_matrix = query_matrix / np.where(query_norms > 0, query_norms, 1)
+            return rows, self._matrix[rows] @ query_matrix.T
+
+        # ||a - b||^2 = ||a||^2 - 2 a.b + ||b||^2, which avoids materializing the (n, dim) difference matrix.
+        # The terms are accumulated in float64, as the subtraction cancels out most digits for vectors with large norms.
+        query_matrix = query_matrix.astype(np.float64)
+        dot_products = np.einsum("ij,kj->ik", self._matrix[rows], query_matrix, dtype=np.float64)
+        query_sq_norms = np.einsum("ij,ij->i", query_matrix, query_matrix)
+        sq_distances = self._sq_norms[rows, None] - 2 * dot_products + query_sq_norms
+        return rows, -np.sqrt(np.maximum(sq_distances, 0))
+
+    def _reserve(self, capacity: int, dim: int) -> None:
+        if self._matrix is not None and capacity <= len(self._matrix):
+            return
+
+        new_capacity = max(self._INITIAL_CAPACITY, capacity)
+        if self._matrix is not None:
+            new_capacity = max(new_capacity, len(self._matrix) * self._GROWTH_FACTOR)
+
+        matrix = np.zeros((new_capacity, dim), dtype=np.float32)
+        sq_norms = np.zeros(new_capacity, dtype=np.float64)
+        alive = np.zeros(new_capacity, dtype=bool)
+        if self._matrix is not None:
+            matrix[: self._size] = self._matrix[: self._size]
+            sq_norms[: self._size] = self._sq_norms[: self._size]
+            alive[: self._size] = self._alive[: self._size]
+
+        self._matrix, self._sq_norms, self._alive = matrix, sq_norms, alive
+
+    def _compact(self) -> None:
+        live_rows = np.flatnonzero(self._alive[: self._size])
+        count = len(live_rows)
+        self._matrix[:count] = self._matrix[live_rows]  # type: ignore[index]
+        self._sq_norms[:count] = self._sq_norms[live_rows]
+        self._alive[:count] = True
+        self._alive[count:] = False
+        self._row_ids = [self._row_ids[row] for row in live_rows]
+        self._rows = {id: row for row, id in enumerate(self._row_ids)}  # type: ignore[misc]
+        self._size = count
+
+
+class _SparseInvertedIndex:
+    """
+    Inverted index of sparse vectors, mapping each position to the rows holding it and their values.
+
+    Only rows sharing at least one position with the query are scored, by accumulating the postings of the query
+    positions into a score array. Removed rows are tombstoned and the postings are rebuilt once they make up more
+    than half of the rows.
+    """
+
+    _MIN_COMPACTION_SIZE = 1024
+
+    def __init__(self, weighting: Literal["dot", "bm25"] = "dot", k1: float = 1.2, b: float = 0.75) -> None:
+        self._weighting = weighting
+        self._k1 = k1
+        self._b = b
+        self._vectors: dict[UUID, SparseVector] = {}
+        self._row_ids: list[UUID | None] = []
+        self._rows: dict[UUID, int] = {}
+        self._alive = array("b")
+        self._lengths = array("f")
+        self._total_length = 0.0
+        self._postings: dict[int, tuple[array, array]] = {}
+        self._document_frequencies: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, id: UUID) -> bool:
+        return id in self._rows
+
+    def row(self, id: UUID) -> int:
+        """
+        Returns the row of the vector with the given ID.
+        """
+        return self._rows[id]
+
+    def row_id(self, row: int) -> UUID:
+        """
+        Returns the ID of the vector stored in the given row.
+        """
+        return self._row_ids[row]  # type: ignore[return-value]
+
+    def vector(self, id: UUID) -> SparseVector:
+        """
+        Returns the vector with the given ID.
+        """
+        return self._vectors[id]
+
+    def add(self, vectors: dict[UUID, SparseVector]) -> None:
+        """
+        Adds vectors to the index, replacing the vectors of already present IDs.
+
+        Args:
+            vectors: The vectors mapped by ID.
+        """
+        self.remove([id for id in vectors if id in self._rows])
+        for id, vector in vectors.items():
+            row = len(self._row_ids)
+            self._vectors[id] = vector
+            self._rows[id] = row
+            self._row_ids.append(id)
+            self._alive.append(1)
+            self._lengths.append(float(vector.values.sum()))
+            self._total_length += self._lengths[row]
+            for index, value in zip(vector.indices.tolist(), vector.values.tolist(), strict=True):
+                rows, values = self._postings.setdefault(index, (array("q"), array("f")))
+                rows.append(row)
+                values.append(value)
+                self._document_frequencies[index] = self._document_frequencies.get(index, 0) + 1
+
+    def remove(self, ids: list[UUID]) -> None:
+        """
+        Tombstones the rows of the given IDs.
+
+        Args:
+            ids: The IDs of the vectors to remove.
+        """
+        for id in ids:
+            row = self._rows.pop(id, None)
+            if row is None:
+                continue
+            for index in self._vectors.pop(id).indices.tolist():
+                self._document_frequencies[index] -= 1
+            self._row_ids[row] = None
+            self._alive[row] = 0
+            self._total_length -= self._lengths[row]
+
+        if len(self._row_ids) - len(self._rows) > max(len(self._row_ids) // 2, self._MIN_COMPACTION_SIZE):
+            self._compact()
+
+    def scores(self, query: SparseVector, rows: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Scores the live rows sharing at least one position with the query.
+
+        Args:
+            query: The query vector.
+            rows: The rows allowed in the results. If not provided, all live rows are allowed.
+
+        Returns:
+            The scored rows and their scores.
+        """
+        scores = np.zeros(len(self._row_ids), dtype=np.float64)
+        matched = np.zeros(len(self._row_ids), dtype=bool)
+        bm25 = self._weighting == "bm25" and len(self._rows) > 0
+        if bm25:
+            lengths = np.frombuffer(self._lengths, dtype=np.float32)
+            alive_count = len(self._rows)
+            average_length = max(self._total_length / alive_count, 1e-9)
+            length_norms = self._k1 * (1 - self._b + self._b * lengths / average_length)
+
+        for index, query_value in zip(query.indices.tolist(), query.values.tolist(), strict=True):
+            postings = self._postings.get(index)
+            if postings is None:
+                continue
+            posting_rows = np.frombuffer(postings[0], dtype=np.int64)
+            posting_values = np.frombuffer(postings[1], dtype=np.float32).astype(np.float64)
+            if bm25:
+                frequency = self._document_frequencies[index]
+                idf = np.log(1 + (alive_count - frequency + 0.5) / (frequency + 0.5))
+                posting_values = idf * posting_values * (self._k1 + 1) / (posting_values + length_norms[posting_rows])
+            scores[posting_rows] += query_value * posting_values
+            matched[posting_rows] = True
+
+        matched &= np.frombuffer(self._alive, dtype=np.int8).astype(bool)
+        if rows is not None:
+            allowed = np.zeros(len(self._row_ids), dtype=bool)
+            allowed[rows] = True
+            matched &= allowed
+
+        matched_rows = np.flatnonzero(matched)
+        return matched_rows, scores[matched_rows]
+
+    def _compact(self) -> None:
+        vectors = self._vectors
+        self._vectors, self._row_ids, self._rows = {}, [], {}
+        self._alive, self._lengths, self._total_length = array("b"), array("f"), 0.0
+        self._postings, self._document_frequencies = {}, {}
+        self.add(vectors)
+
+
+class _MetadataIndex:
+    """
+    Hash indexes mapping the values of metadata paths to the IDs of the entries holding them.
+
+    Paths are dot-separated keys of nested metadata dictionaries. Indexes of declared paths are maintained from
+    the start, while the indexes of other paths are built on their first use in a filter.
+    """
+
+    def __init__(self, paths: list[str] | None = None) -> None:
+        self._indexes: dict[str, dict[Any, set[UUID]]] = {path: {} for path in paths or []}
+
+    @staticmethod
+    def _value(metadata: dict, path: str) -> Any:  # noqa: ANN401
+        value: Any = metadata
+        for key in path.split("."):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+    def add(self, entries: Iterable[VectorStoreEntry]) -> None:
+        """
+        Adds the entries to the indexes built so far.
+
+        Args:
+            entries: The entries to add.
+        """
+        entries = list(entries)
+        for path in self._indexes:
+            self._index(path, entries)
+
+    def remove(self, entries: Iterable[VectorStoreEntry]) -> None:
+        """
+        Removes the entries from the indexes built so far.
+
+        Args:
+            entries: The entries to remove.
+        """
+        entries = list(entries)
+        for path, index in self._indexes.items():
+            for entry in entries:
+                value = self._value(entry.metadata, path)
+                if isinstance(value, Hashable) and (ids := index.get(value)) is not None:
+                    ids.discard(entry.id)
+                    if not ids:
+                        del index[value]
+
+    def ids(self, where: WhereQuery, entries: dict[UUID, VectorStoreEntry]) -> set[UUID]:
+        """
+        Returns the IDs of the entries matching all conditions of the filter, building missing indexes.
+
+        Args:
+            where: The filter, possibly with nested dictionaries or dot-separated keys.
+            entries: All entries of the store, used to build missing indexes.
+
+        Returns:
+            The IDs of the matching entries.
+        """
+        candidates: list[set[UUID]] = []
+        for path, value in self._conditions(where):
+            if path not in self._indexes:
+                self._indexes[path] = {}
+                self._index(path, entries.values())
+            candidates.append(self._indexes[path].get(value, set()) if isinstance(value, Hashable) else set())
+
+        candidates.sort(key=len)
+        return set.intersection(*candidates) if candidates else set(entries)
+
+    @classmethod
+    def _conditions(cls, where: WhereQuery, prefix: str = "") -> Iterator[tuple[str, Any]]:
+        for key, value in where.items():
+            if isinstance(value, dict):
+                yield from cls._conditions(value, f"{prefix}{key}.")
+            else:
+                yield f"{prefix}{key}", value
+
+    def _index(self, path: str, entries: Iterable[VectorStoreEntry]) -> None:
+        index = self._indexes[path]
+        for entry in entries:
+            value = self._value(entry.metadata, path)
+            if isinstance(value, Hashable):
+                index.setdefault(value, set()).add(entry.id)
+
+
 class InMemoryVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
     """
     A simple in-memory implementation of Vector Store, storing vectors in memory.
@@ -26,7 +429,11 @@ class InMemoryVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
         self,
         embedder: Embedder,
         embedding_type: EmbeddingType = EmbeddingType.TEXT,
+        distance_method: Literal["l2", "ip", "cosine"] = "l2",
         default_options: VectorStoreOptions | None = None,
+        *,
+        sparse_weighting: Literal["dot", "bm25"] = "dot",
+        metadata_index_paths: list[str] | None = None,
     ) -> None:
         """
         Constructs a new InMemoryVectorStore instance.
@@ -36,6 +443,11 @@ class InMemoryVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
             embedder: The embedder to use for converting entries to vectors. Can be a regular Embedder for dense vectors
                      or a SparseEmbedder for sparse vectors.
             embedding_type: Which part of the entry to embed, either text or image. The other part will be ignored.
+            distance_method: The distance method used to score dense vectors.
+            sparse_weighting: The scoring of sparse vectors: the dot product, or BM25 treating the sparse values
+                as term frequencies. Only entries sharing at least one position with the query are scored.
+            metadata_index_paths: The dot-separated metadata paths (e.g. `document_meta.source.id`) indexed
+                up front for `where` filters. Other paths are indexed on their first use in a filter.
         """
         super().__init__(
             default_options=default_options,
@@ -43,7 +455,12 @@ class InMemoryVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
             embedding_type=embedding_type,
         )
         self._entries: dict[UUID, VectorStoreEntry] = {}
-        self._embeddings: dict[UUID, list[float] | SparseVector] = {}
+        self._distance_method = distance_method
+        self._dense_index = _DenseMatrixIndex(distance_method)
+        self._sparse_index = _SparseInvertedIndex(sparse_weighting)
+        self._metadata_index = _MetadataIndex(metadata_index_paths)
+        self._positions: dict[UUID, int] = {}
+        self._next_position = 0
 
     async def store(self, entries: list[VectorStoreEntry]) -> None:
         """
@@ -58,10 +475,18 @@ class InMemoryVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
             embedding_type=self._embedding_type,
         ) as outputs:
             embeddings = await self._create_embeddings(entries)
-            self._embeddings.update(embeddings)
-            self._entries.update({entry.id: entry for entry in entries if entry.id in embeddings})
-            outputs.embeddings = self._embeddings
-            outputs.entries = self._entries
+            self._dense_index.add({id: v for id, v in embeddings.items() if not isinstance(v, SparseVector)})
+            self._sparse_index.add({id: v for id, v in embeddings.items() if isinstance(v, SparseVector)})
+            stored_entries = {entry.id: entry for entry in entries if entry.id in embeddings}
+            self._metadata_index.remove(self._entries[id] for id in stored_entries if id in self._entries)
+            self._metadata_index.add(stored_entries.values())
+            for id in stored_entries:
+                if id not in self._positions:
+                    self._positions[id] = self._next_position
+                    self._next_position += 1
+            self._entries.update(stored_entries)
+            outputs.embeddings = embeddings
+            await self._notify_change()
 
     async def retrieve(
         self,
@@ -84,45 +509,145 @@ class InMemoryVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
             options=merged_options.dict(),
             embedder=repr(self._embedder),
             embedding_type=self._embedding_type,
+            distance_method=self._distance_method,
         ) as outputs:
             query_vector = (await self._embedder.embed_text([text]))[0]
-            results: list[VectorStoreResult] = []
-
-            for entry_id, vector in self._embeddings.items():
-                entry = self._entries[entry_id]
-
-                # Apply metadata filtering
-                if merged_options.where and not all(
-                    entry.metadata.get(key) == value for key, value in merged_options.where.items()
-                ):
-                    continue
-
-                # Calculate score based on vector type
-                if isinstance(query_vector, SparseVector) and isinstance(vector, SparseVector):
-                    # For sparse vectors, use dot product between query and document vectors
-                    # Create dictionaries for efficient lookup
-                    vector_dict = dict(zip(vector.indices, vector.values, strict=False))
-
-                    # Calculate dot product of overlapping indices
-                    score = 0.0
-                    for idx, val in zip(query_vector.indices, query_vector.values, strict=False):
-                        if idx in vector_dict:
-                            score += val * vector_dict[idx]
-                else:
-                    # For dense vectors, use negative L2 distance
-                    query_vector_dense = cast(list[float], query_vector)
-                    vector_dense = cast(list[float], vector)
-                    score = -math.sqrt(
-                        sum((a - b) ** 2 for a, b in zip(vector_dense, query_vector_dense, strict=False))
-                    )
+            if isinstance(query_vector, SparseVector):
+                outputs.results = self._retrieve_sparse(query_vector, merged_options)
+            else:
+                outputs.results = self._retrieve_dense(query_vector, merged_options)
+            return outputs.results
 
-                result = VectorStoreResult(entry=self._entries[entry_id], vector=vector, score=score)
-                if merged_options.score_threshold is None or result.score >= merged_options.score_threshold:
-                    results.append(result)
+    async def retrieve_many(
+        self,
+        texts: list[str],
+        options: VectorStoreOptions | None = None,
+    ) -> list[list[VectorStoreResult]]:
+        """
+        Retrieve entries from the vector store most similar to each of the provided texts. All the texts are embedded
+        in a single call, and dense vectors are scored against all the queries in a single matrix-matrix product.
 
-            outputs.results = sorted(results, key=lambda r: r.score, reverse=True)[: merged_options.k]
+        Args:
+            texts: The texts to query the vector store with.
+            options: The options for querying the vector store.
+
+        Returns:
+            The entries for each of the texts, in the order of the texts.
+        """
+        merged_options = (self.default_options | options) if options else self.default_options
+        with trace(
+            texts=texts,
+            options=merged_options.dict(),
+            embedder=repr(self._embedder),
+            embedding_type=self._embedding_type,
+            distance_method=self._distance_method,
+        ) as outputs:
+            if not texts:
+                outputs.results = []
+                return outputs.results
+
+            query_vectors = await self._embedder.embed_text(texts)
+            if isinstance(query_vectors[0], SparseVector):
+                rows = self._filter_rows(self._sparse_index, merged_options)
+                outputs.results = [
+                    self._build_results(
+                        self._sparse_index,
+                        *self._sparse_index.scores(query_vector, rows),  # type: ignore[arg-type]
+                        merged_options,
+                    )
+                    for query_vector in query_vectors
+                ]
+            else:
+                rows, scores = self._dense_index.scores_many(
+                    query_vectors,  # type: ignore[arg-type]
+                    self._filter_rows(self._dense_index, merged_options),
+                )
+                outputs.results = [
+                    self._build_results(self._dense_index, rows, scores[:, i], merged_options)
+                    for i in range(len(query_vectors))
+                ]
             return outputs.results
 
+    def _retrieve_dense(self, query_vector: list[float], options: VectorStoreOptions) -> list[VectorStoreResult]:
+        """
+        Scores the dense vectors matching the filter and builds results for the top k of them only.
+        """
+        return self._retrieve_from_index(self._dense_index, query_vector, options)
+
+    def _retrieve_sparse(self, query_vector: SparseVector, options: VectorStoreOptions) -> list[VectorStoreResult]:
+        """
+        Scores the sparse vectors matching the filter through the inverted index.
+        """
+        return self._retrieve_from_index(self._sparse_index, query_vector, options)
+
+    def _retrieve_from_index(
+        self,
+        index: "_DenseMatrixIndex | _SparseInvertedIndex",
+        query_vector: list[float] | SparseVector,
+        options: VectorStoreOptions,
+    ) -> list[VectorStoreResult]:
+        """
+        Scores the vectors of the index matching the filter and builds results for the top k of them only.
+        """
+        rows, scores = index.scores(query_vector, self._filter_rows(index, options))  # type: ignore[arg-type]
+        return self._build_results(index, rows, scores, options)
+
+    def _filter_rows(
+        self, index: "_DenseMatrixIndex | _SparseInvertedIndex", options: VectorStoreOptions
+    ) -> np.ndarray | None:
+        """
+        Returns the rows of the index matching the filter, or None if there is no filter.
+        """
+        if not options.where:
+            return None
+        return np.fromiter(
+            (index.row(entry_id) for entry_id in self._filter_ids(options.where) if entry_id in index),
+            dtype=np.intp,
+        )
+
+    def _build_results(
+        self,
+        index: "_DenseMatrixIndex | _SparseInvertedIndex",
+        rows: np.ndarray,
+        scores: np.ndarray,
+        options: VectorStoreOptions,
+    ) -> list[VectorStoreResult]:
+        """
+        Builds results for the top k of the scored rows above the score threshold.
+        """
+        if options.score_threshold is not None:
+            above_threshold = scores >= options.score_threshold
+            rows, scores = rows[above_threshold], scores[above_threshold]
+
+        results = []
+        for i in self._top_k(rows, scores, options.k):
+            entry_id = index.row_id(int(rows[i]))
+            results.append(
+                VectorStoreResult(
+                    entry=self._entries[entry_id],
+                    vector=index.vector(entry_id),
+                    score=float(scores[i]),
+                )
+            )
+        return results
+
+    @staticmethod
+    def _top_k(rows: np.ndarray, scores: np.ndarray, k: int) -> np.ndarray:
+        """
+        Selects positions of the k best scores, ordered by descending score and then by insertion order.
+        """
+        if k < len(scores):
+            candidates = np.argpartition(-scores, k - 1)[:k] if k > 0 else np.empty(0, dtype=np.intp)
+        else:
+            candidates = np.arange(len(scores))
+        return candidates[np.lexsort((rows[candidates], -scores[candidates]))]
+
+    def _filter_ids(self, where: WhereQuery) -> list[UUID]:
+        """
+        Returns the IDs of the entries whose metadata matches the filter, in insertion order.
+        """
+        return sorted(self._metadata_index.ids(where, self._entries), key=self._positions.__getitem__)
+
     @traceable
     async def remove(self, ids: list[UUID]) -> None:
         """
@@ -131,9 +656,24 @@ class InMemoryVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
         Args:
             ids: The list of entries' IDs to remove.
         """
+        self._metadata_index.remove(self._entries[id] for id in ids)
         for id in ids:
             del self._entries[id]
-            del self._embeddings[id]
+            del self._positions[id]
+        self._dense_index.remove(ids)
+        self._sparse_index.remove(ids)
+        await self._notify_change()
+
+    @traceable
+    async def remove_where(self, where: WhereQuery) -> None:
+        """
+        Remove the entries matching the filter from the vector store, found with the metadata index.
+
+        Args:
+            where: The filter dictionary - the keys are the field names and the values are the values to filter by.
+        """
+        if ids := self._filter_ids(where):
+            await self.remove(ids)
 
     @traceable
     async def list(
@@ -144,21 +684,15 @@ class InMemoryVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
 
         Args:
             where: The filter dictionary - the keys are the field names and the values are the values to filter by.
-                Not specifying the key means no filtering.
+                Nested dictionaries or dot-separated keys filter by nested metadata. Not specifying the key means
+                no filtering.
             limit: The maximum number of entries to return.
             offset: The number of entries to skip.
 
         Returns:
             The entries.
         """
-        entries = iter(self._entries.values())
-
-        entries = (entry for entry in entries if entry.id in self._embeddings)
-
-        if where:
-            entries = (
-                entry for entry in entries if all(entry.metadata.get(key) == value for key, value in where.items())
-            )
+        entries = (self._entries[id] for id in self._filter_ids(where)) if where else iter(self._entries.values())
 
         if offset:
             entries = islice(entries, offset, None)
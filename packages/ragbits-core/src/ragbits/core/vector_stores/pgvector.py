@@ -1,9 +1,11 @@
 import json
 import re
+import struct
 from typing import Any, NamedTuple
 from uuid import UUID
 
 import asyncpg
+import numpy as np
 from pydantic.json import pydantic_encoder
 
 from ragbits.core.audit.traces import trace
@@ -44,6 +46,13 @@ DISTANCE_OPS = {
 MAX_VECTOR_SIZE = 2000
 
 
+# Header of the binary COPY format: the signature, the flags and the length of the header extension.
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_COPY_TRAILER = struct.pack(">h", -1)
+# Version of the binary representation of JSONB, followed by the JSON text.
+_JSONB_VERSION = b"\x01"
+
+
 class PgVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
     """
     Vector store implementation using [pgvector]
@@ -116,6 +125,7 @@ class PgVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
         self._vector_size_info: VectorSize | None = None
         self._distance_method = distance_method
         self._indexing_params = params
+        self._table_exists = False
 
     def __reduce__(self) -> tuple:
         """
@@ -166,10 +176,81 @@ class PgVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
             vector_size = self._vector_size
             if vector_size is None:
                 raise RuntimeError("Vector size must be determined before converting sparse vectors to string")
-            points_str = ",".join(f"{i}:{v}" for i, v in zip(vector.indices, vector.values, strict=False))
+            points_str = ",".join(
+                f"{i}:{v}" for i, v in zip(vector.indices.tolist(), vector.values.tolist(), strict=False)
+            )
             return f"{{{points_str}}}/{vector_size}"
         return json.dumps(vector)
 
+    def _vector_type(self, vector_size: int) -> str:
+        """
+        Returns the pgvector type of the vector column.
+
+        Args:
+            vector_size: The size of the vectors.
+
+        Returns:
+            The name of the type: "vector", "halfvec" or "sparsevec".
+        """
+        # If the size is greater than 2000 then the HALFVEC type is chosen.
+        # More info: https://github.com/pgvector/pgvector
+        if isinstance(self._embedder, SparseEmbedder):
+            return "sparsevec"
+        if vector_size > MAX_VECTOR_SIZE and re.search("halfvec", DISTANCE_OPS[self._distance_method].function_name):
+            return "halfvec"
+        return "vector"
+
+    @staticmethod
+    def _vector_to_binary(vector: list[float] | SparseVector, vector_type: str, vector_size: int) -> bytes:
+        """
+        Encodes a vector in the binary wire format of pgvector.
+
+        Args:
+            vector: The vector to encode.
+            vector_type: The pgvector type of the vector column.
+            vector_size: The size of the vectors.
+
+        Returns:
+            The binary representation of the vector.
+        """
+        if isinstance(vector, SparseVector):
+            # Positions are 1-based in the text format written by `_vector_to_string`, but 0-based in binary.
+            return (
+                struct.pack(">iii", vector_size, len(vector.indices), 0)
+                + (vector.indices - 1).astype(">i4").tobytes()
+                + vector.values.astype(">f4").tobytes()
+            )
+        values = np.asarray(vector, dtype=">f2" if vector_type == "halfvec" else ">f4")
+        return struct.pack(">HH", len(values), 0) + values.tobytes()
+
+    @classmethod
+    def _entry_to_copy_row(
+        cls, entry: VectorStoreEntry, vector: list[float] | SparseVector, vector_type: str, vector_size: int
+    ) -> bytes:
+        """
+        Encodes an entry as a row of the binary COPY format.
+
+        Args:
+            entry: The entry to encode.
+            vector: The embedding of the entry.
+            vector_type: The pgvector type of the vector column.
+            vector_size: The size of the vectors.
+
+        Returns:
+            The binary representation of the row.
+        """
+        fields = [
+            entry.id.bytes,
+            entry.text.encode() if entry.text is not None else None,
+            entry.image_bytes,
+            cls._vector_to_binary(vector, vector_type, vector_size),
+            _JSONB_VERSION + json.dumps(entry.metadata, default=pydantic_encoder).encode(),
+        ]
+        row = struct.pack(">h", len(fields))
+        for field in fields:
+            row += struct.pack(">i", -1) if field is None else struct.pack(">i", len(field)) + field
+        return row
+
     @staticmethod
     def _string_to_vector(vector_str: str) -> list[float] | SparseVector:
         """
@@ -184,8 +265,7 @@ class PgVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
         if vector_str.startswith("{"):
             # Sparse vector
             points = re.findall(r"(\d+):([\d.]+)", vector_str)
-            indices, values = zip(*[(int(i), float(v)) for i, v in points], strict=False)
-            return SparseVector(indices=list(indices), values=list(values))
+            return SparseVector(indices=[int(i) for i, _ in points], values=[float(v) for _, v in points])
         else:
             # Dense vector
             return json.loads(vector_str)
@@ -238,6 +318,50 @@ class PgVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
 
         return query, values
 
+    def _create_retrieve_many_query(
+        self, vectors: list[list[float]] | list[SparseVector], vector_type: str, query_options: VectorStoreOptions
+    ) -> tuple[str, list[Any]]:
+        """
+        Create sql query retrieving entries for many vectors at once, running the KNN search of each vector
+        in a lateral join.
+
+        Args:
+            vectors: The vectors to query.
+            vector_type: The pgvector type of the vector column.
+            query_options: The options for querying the vector store.
+
+        Returns:
+            str: sql query, returning the 1-based position of the vector in the `query_index` column.
+        """
+        distance_operator = DISTANCE_OPS[self._distance_method].operator
+        distance = f"t.vector {distance_operator} q.vector::{vector_type}"
+        score_formula = DISTANCE_OPS[self._distance_method].score_formula.replace("distance", f"({distance})")
+
+        values: list[Any] = [[self._vector_to_string(vector) for vector in vectors]]
+        # _table_name has been validated in the class constructor, and it is a valid table name.
+        subquery = f"SELECT t.*, {distance} as distance, {score_formula} as score FROM {self._table_name} t"  # noqa S608
+
+        if query_options.where:
+            subquery += f" WHERE t.metadata @> ${len(values) + 1}"
+            values.append(json.dumps(query_options.where))
+
+        subquery += " ORDER BY distance"
+
+        if query_options.k:
+            subquery += f" LIMIT ${len(values) + 1}"
+            values.append(query_options.k)
+
+        queries = "unnest($1::text[]) WITH ORDINALITY AS q(vector, query_index)"
+        query = f"SELECT q.query_index, r.* FROM {queries} CROSS JOIN LATERAL ({subquery}) r"  # noqa S608
+
+        if query_options.score_threshold is not None:
+            query += f" WHERE r.score >= ${len(values) + 1}"
+            values.append(query_options.score_threshold)
+
+        query += " ORDER BY q.query_index, r.distance;"
+
+        return query, values
+
     def _create_list_query(
         self, where: WhereQuery | None = None, limit: int | None = None, offset: int = 0
     ) -> tuple[str, list[Any]]:
@@ -290,18 +414,7 @@ class PgVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
             # vector_size has been validated in the class constructor or obtained from embedder,
             # and it is a valid vector size.
 
-            is_sparse = isinstance(self._embedder, SparseEmbedder)
-
-            # Check vector size
-            # if greater than 2000 then choose type HALFVEC
-            # More info: https://github.com/pgvector/pgvector
-            vector_func = (
-                "HALFVEC"
-                if vector_size > MAX_VECTOR_SIZE and re.search("halfvec", distance)
-                else "VECTOR"
-                if not is_sparse
-                else "SPARSEVEC"
-            )
+            vector_func = self._vector_type(vector_size).upper()
 
             create_table_query = f"""
             CREATE TABLE {self._table_name}
@@ -322,6 +435,11 @@ class PgVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
             USING {index_type} (vector {distance})
             WITH {index_params}
             """
+            # The GIN index supports the JSONB containment filters of `list` and `remove_where`.
+            create_metadata_index_query = f"""
+            CREATE INDEX {self._table_name + "_metadata_idx"} ON {self._table_name}
+            USING gin (metadata jsonb_path_ops)
+            """
 
             if await self._check_table_exists():
                 print(f"Table {self._table_name} already exist!")
@@ -333,6 +451,7 @@ class PgVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
                     async with conn.transaction():
                         await conn.execute(create_table_query)
                         await conn.execute(create_index_query)
+                        await conn.execute(create_metadata_index_query)
 
                     print("Table and index created!")
                 except Exception as e:
@@ -341,7 +460,10 @@ class PgVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
 
     async def store(self, entries: list[VectorStoreEntry]) -> None:
         """
-        Stores entries in the pgVector collection.
+        Stores entries in the pgVector collection, replacing the entries with the same IDs.
+
+        The rows are streamed with a binary `COPY` in a single transaction, with vectors encoded
+        in the binary wire format of pgvector.
 
         Args:
             entries: The entries to store.
@@ -351,11 +473,12 @@ class PgVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
 
         # Ensure vector size is determined before processing
         vector_size = await self._get_vector_size()
+        vector_type = self._vector_type(vector_size)
 
         # _table_name has been validated in the class constructor, and it is a valid table name.
-        insert_query = f"""
-        INSERT INTO {self._table_name} (id, text, image_bytes, vector, metadata)
-        VALUES ($1, $2, $3, $4, $5)
+        delete_query = f"""
+        DELETE FROM {self._table_name}
+        WHERE id = ANY($1)
         """  # noqa S608
         with trace(
             table_name=self._table_name,
@@ -365,28 +488,35 @@ class PgVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
             embedding_type=self._embedding_type,
         ):
             embeddings = await self._create_embeddings(entries)
-            exists = await self._check_table_exists()
-            if not exists:
-                print(f"Table {self._table_name} does not exist. Creating the table.")
-                try:
-                    await self.create_table()
-                except Exception as e:
-                    print(f"Failed to handle missing table: {e}")
-                    return
+            if not self._table_exists:
+                if not await self._check_table_exists():
+                    print(f"Table {self._table_name} does not exist. Creating the table.")
+                    try:
+                        await self.create_table()
+                    except Exception as e:
+                        print(f"Failed to handle missing table: {e}")
+                        return
+                self._table_exists = True
+
+            rows = {
+                entry.id: self._entry_to_copy_row(entry, embeddings[entry.id], vector_type, vector_size)
+                for entry in entries
+                if entry.id in embeddings
+            }
+            if not rows:
+                return
 
-            async with self._client.acquire() as conn:
-                for entry in entries:
-                    if entry.id not in embeddings:
-                        continue
-
-                    await conn.execute(
-                        insert_query,
-                        str(entry.id),
-                        entry.text,
-                        entry.image_bytes,
-                        self._vector_to_string(embeddings[entry.id]),
-                        json.dumps(entry.metadata, default=pydantic_encoder),
-                    )
+            async with self._client.acquire() as conn, conn.transaction():
+                await conn.execute(delete_query, list(rows))
+                # Rows are written in the binary COPY format up front, so no type codec is registered for
+                # the pgvector types, wherever the extension is installed.
+                await conn.copy_to_table(
+                    self._table_name,
+                    source=_COPY_HEADER + b"".join(rows.values()) + _COPY_TRAILER,
+                    columns=["id", "text", "image_bytes", "vector", "metadata"],
+                    format="binary",
+                )
+            await self._notify_change()
 
     async def remove(self, ids: list[UUID]) -> None:
         """
@@ -410,6 +540,26 @@ class PgVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
             except asyncpg.exceptions.UndefinedTableError:
                 print(f"Table {self._table_name} does not exist.")
                 return
+            await self._notify_change()
+
+    async def remove_where(self, where: WhereQuery) -> None:
+        """
+        Remove the entries matching the filter from the vector store, with a JSONB containment filter
+        supported by the GIN index on the metadata.
+
+        Args:
+            where: The filter dictionary - the keys are the field names and the values are the values to filter by.
+        """
+        # _table_name has been validated in the class constructor, and it is a valid table name.
+        remove_query = f"DELETE FROM {self._table_name} WHERE metadata @> $1"  # noqa: S608
+        with trace(table_name=self._table_name, where=where):
+            try:
+                async with self._client.acquire() as conn:
+                    await conn.execute(remove_query, json.dumps(where))
+            except asyncpg.exceptions.UndefinedTableError:
+                print(f"Table {self._table_name} does not exist.")
+                return
+            await self._notify_change()
 
     async def retrieve(
         self,
@@ -447,25 +597,86 @@ class PgVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
                 async with self._client.acquire() as conn:
                     results = await conn.fetch(query, *values)
 
-                outputs.results = [
-                    VectorStoreResult(
-                        entry=VectorStoreEntry(
-                            id=record["id"],
-                            text=record["text"],
-                            image_bytes=record["image_bytes"],
-                            metadata=json.loads(record["metadata"]),
-                        ),
-                        vector=self._string_to_vector(record["vector"]),
-                        score=record["score"],
-                    )
-                    for record in results
-                ]
+                outputs.results = [self._record_to_result(record) for record in results]
 
             except asyncpg.exceptions.UndefinedTableError:
                 print(f"Table {self._table_name} does not exist.")
                 outputs.results = []
             return outputs.results
 
+    async def retrieve_many(
+        self,
+        texts: list[str],
+        options: VectorStoreOptionsT | None = None,
+    ) -> list[list[VectorStoreResult]]:
+        """
+        Retrieves entries from the pgVector collection most similar to each of the provided texts. All the texts
+        are embedded in a single call and searched for in a single query.
+
+        Args:
+            texts: The texts to query the vector store with.
+            options: The options for querying the vector store.
+
+        Returns:
+            The retrieved entries for each of the texts, in the order of the texts.
+        """
+        merged_options = (self.default_options | options) if options else self.default_options
+
+        # Ensure vector size is determined before processing
+        vector_size = await self._get_vector_size()
+
+        with trace(
+            texts=texts,
+            options=merged_options.dict(),
+            table_name=self._table_name,
+            vector_size=vector_size,
+            distance_method=self._distance_method,
+            embedder=repr(self._embedder),
+            embedding_type=self._embedding_type,
+        ) as outputs:
+            outputs.results = [[] for _ in texts]
+            if not texts:
+                return outputs.results
+
+            query_vectors = await self._embedder.embed_text(texts)
+            query, values = self._create_retrieve_many_query(
+                query_vectors,  # type: ignore[arg-type]
+                self._vector_type(vector_size),
+                merged_options,
+            )
+
+            try:
+                async with self._client.acquire() as conn:
+                    results = await conn.fetch(query, *values)
+            except asyncpg.exceptions.UndefinedTableError:
+                print(f"Table {self._table_name} does not exist.")
+                return outputs.results
+
+            for record in results:
+                outputs.results[record["query_index"] - 1].append(self._record_to_result(record))
+            return outputs.results
+
+    def _record_to_result(self, record: asyncpg.Record) -> VectorStoreResult:
+        """
+        Converts a record returned by a retrieve query to a result.
+
+        Args:
+            record: The record.
+
+        Returns:
+            The result.
+        """
+        return VectorStoreResult(
+            entry=VectorStoreEntry(
+                id=record["id"],
+                text=record["text"],
+                image_bytes=record["image_bytes"],
+                metadata=json.loads(record["metadata"]),
+            ),
+            vector=self._string_to_vector(record["vector"]),
+            score=record["score"],
+        )
+
     async def list(
         self, where: WhereQuery | None = None, limit: int | None = None, offset: int = 0
     ) -> list[VectorStoreEntry]:
@@ -135,8 +135,8 @@ class QdrantVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
         """
         if isinstance(vector, SparseVector):
             return models.SparseVector(
-                indices=vector.indices,
-                values=vector.values,
+                indices=vector.indices.tolist(),
+                values=vector.values.tolist(),
             )
         return cast(list[float], vector)
 
@@ -153,8 +153,8 @@ class QdrantVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
         """
         if isinstance(vector, models.SparseVector):
             return SparseVector(
-                indices=list(vector.indices),
-                values=list(vector.values),
+                indices=vector.indices,
+                values=vector.values,
             )
         if not isinstance(vector, list):
             raise TypeError(f"Expected a vector of type list or SparseVector, Qdrant returned {type(vector)}")
@@ -212,6 +212,7 @@ class QdrantVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
                 points=points,
                 wait=True,
             )
+            await self._notify_change()
 
     async def retrieve(
         self,
@@ -258,22 +259,90 @@ class QdrantVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
                 query_filter=self._create_qdrant_filter(merged_options.where),
             )
 
-            outputs.results = []
-            for point in query_results.points:
-                entry = VectorStoreEntry.model_validate(point.payload)
-
-                outputs.results.append(
-                    VectorStoreResult(
-                        entry=entry,
-                        score=point.score * score_multiplier,
-                        vector=self._from_qdrant_vector(point.vector[self._vector_name])
-                        if isinstance(point.vector, dict)
-                        else self._from_qdrant_vector(point.vector),
+            outputs.results = self._points_to_results(query_results.points, score_multiplier)
+            return outputs.results
+
+    async def retrieve_many(
+        self,
+        texts: list[str],
+        options: VectorStoreOptions | None = None,
+    ) -> list[list[VectorStoreResult]]:
+        """
+        Retrieves entries from the Qdrant collection most similar to each of the provided texts. All the texts
+        are embedded in a single call and the queries are sent in a single batch request.
+
+        Args:
+            texts: The texts to query the vector store with.
+            options: The options for querying the vector store.
+
+        Returns:
+            The retrieved entries for each of the texts, in the order of the texts.
+        """
+        merged_options = (self.default_options | options) if options else self.default_options
+
+        reverse_score = distance_to_order(self._distance_method) == DistanceOrder.SMALLER_IS_BETTER
+        score_multiplier = -1 if reverse_score else 1
+        score_threshold = (
+            None if merged_options.score_threshold is None else merged_options.score_threshold * score_multiplier
+        )
+        with trace(
+            texts=texts,
+            options=merged_options.dict(),
+            index_name=self._index_name,
+            distance_method=self._distance_method,
+            embedder=repr(self._embedder),
+            embedding_type=self._embedding_type,
+        ) as outputs:
+            if not texts:
+                outputs.results = []
+                return outputs.results
+
+            query_vectors = await self._embedder.embed_text(texts)
+            query_filter = self._create_qdrant_filter(merged_options.where)
+
+            query_responses = await self._client.query_batch_points(
+                collection_name=self._index_name,
+                requests=[
+                    models.QueryRequest(
+                        query=self._to_qdrant_vector(query_vector),
+                        using=self._vector_name,
+                        limit=merged_options.k,
+                        score_threshold=score_threshold,
+                        with_payload=True,
+                        with_vector=True,
+                        filter=query_filter,
                     )
-                )
+                    for query_vector in query_vectors
+                ],
+            )
 
+            outputs.results = [
+                self._points_to_results(response.points, score_multiplier) for response in query_responses
+            ]
             return outputs.results
 
+    def _points_to_results(self, points: list[models.ScoredPoint], score_multiplier: int) -> list[VectorStoreResult]:
+        """
+        Converts the scored points returned by Qdrant to results following the "larger is better" convention.
+
+        Args:
+            points: The scored points.
+            score_multiplier: The multiplier reversing the score of "smaller is better" distance methods.
+
+        Returns:
+            The results.
+        """
+        return [
+            VectorStoreResult(
+                entry=VectorStoreEntry.model_validate(point.payload),
+                score=point.score * score_multiplier,
+                vector=self._from_qdrant_vector(point.vector[self._vector_name])
+                if isinstance(point.vector, dict)
+                else self._from_qdrant_vector(point.vector),
+            )
+            for point in points
+        ]
+
     async def remove(self, ids: list[UUID]) -> None:
         """
         Remove entries from the vector store.
@@ -292,6 +361,24 @@ class QdrantVectorStore(VectorStoreWithEmbedder[VectorStoreOptions]):
                 collection_name=self._index_name,
                 points_selector=models.PointIdsList(points=[str(id) for id in ids]),
             )
+        await self._notify_change()
+
+    async def remove_where(self, where: WhereQuery) -> None:
+        """
+        Remove the entries matching the filter from the vector store, in a single filtered delete.
+
+        Args:
+            where: The filter dictionary - the keys are the field names and the values are the values to filter by.
+        """
+        with trace(where=where, index_name=self._index_name):
+            if not await self._client.collection_exists(self._index_name):
+                return
+
+            await self._client.delete(
+                collection_name=self._index_name,
+                points_selector=models.FilterSelector(filter=self._create_qdrant_filter(where)),
+            )
+        await self._notify_change()
 
     @staticmethod
     def _create_qdrant_filter(where: WhereQuery | None) -> Filter:
@@ -1,3 +1,4 @@
+import asyncio
 import warnings
 from collections.abc import Callable, Mapping, Sequence
 from typing import TypeVar, cast
@@ -11,6 +12,7 @@ from weaviate.auth import AuthCredentials
 from weaviate.classes.config import Configure, DataType, Property, Tokenization, VectorDistances
 from weaviate.classes.query import Filter, MetadataQuery
 from weaviate.collections.classes.filters import FilterReturn
+from weaviate.collections.classes.internal import Object
 from weaviate.config import AdditionalConfig, Proxies
 from weaviate.connect.base import ConnectionParams
 from weaviate.embedded import EmbeddedOptions
@@ -236,6 +238,7 @@ class WeaviateVectorStore(VectorStoreWithEmbedder[WeaviateVectorStoreOptions]):
 
                 if objects:
                     await index.data.insert_many(objects)
+                    await self._notify_change()
 
     async def retrieve(self, text: str, options: WeaviateVectorStoreOptionsT | None = None) -> list[VectorStoreResult]:
         """
@@ -250,11 +253,6 @@ class WeaviateVectorStore(VectorStoreWithEmbedder[WeaviateVectorStoreOptions]):
         """
         merged_options = (self.default_options | options) if options else self.default_options
 
-        # Ragbits has a "larger is better" convention for all scores, so we need to reverse the score if the distance
-        # method is "smaller is better".
-        # Weaviate documentation says that all distance methods are "smaller is better":
-        # https://weaviate.io/developers/weaviate/config-refs/distances#available-distance-metrics
-        score_multiplier = -1
         score_threshold = merged_options.score_threshold
         async with self._client:
             with trace(
@@ -297,41 +295,124 @@ class WeaviateVectorStore(VectorStoreWithEmbedder[WeaviateVectorStoreOptions]):
                         include_vector=True,
                     )
 
-                outputs_results = []
-                for object_ in results.objects:
-                    entry_raw = {"uuid": object_.uuid, "properties": self._unflatten_metadata(object_.properties)}
-                    entry_dict = {
-                        "id": entry_raw["uuid"],
-                        "text": cast(dict, entry_raw["properties"]).get("text", None),
-                        "image_bytes": cast(dict, entry_raw["properties"]).get("image_bytes", None),
-                        "metadata": cast(dict, entry_raw["properties"]).get("metadata", {}),
-                    }
-                    entry = VectorStoreEntry.model_validate(entry_dict)
-
-                    if merged_options.use_keyword_search:
-                        # For keyword search score follows "larger is better" rule,
-                        # so we don't need to multiply it by score_multiplier
-                        score = object_.metadata.score
-                    else:
-                        score = (
-                            object_.metadata.distance * score_multiplier
-                            if object_.metadata.distance is not None
-                            else None
-                        )
+                outputs.results = self._objects_to_results(results.objects, merged_options)
+                return outputs.results
 
-                    if score is not None:
-                        outputs_results.append(
-                            VectorStoreResult(
-                                entry=entry,
-                                score=score,
-                                vector=cast(list[float], object_.vector["default"]),
-                            )
-                        )
+    async def retrieve_many(
+        self, texts: list[str], options: WeaviateVectorStoreOptionsT | None = None
+    ) -> list[list[VectorStoreResult]]:
+        """
+        Retrieves entries from the Weaviate collection most similar to each of the provided texts. All the texts
+        are embedded in a single call, and the queries run concurrently over a single client connection, as
+        Weaviate has no batch endpoint for vector search.
+
+        Args:
+            texts: The texts to query the vector store with.
+            options: The options for querying the vector store.
+
+        Returns:
+            The retrieved entries for each of the texts, in the order of the texts.
+        """
+        merged_options = (self.default_options | options) if options else self.default_options
+
+        async with self._client:
+            with trace(
+                texts=texts,
+                options=merged_options,
+                index_name=self._index_name,
+                distance_method=self._distance_method,
+                embedder=repr(self._embedder),
+                embedding_type=self._embedding_type,
+            ) as outputs:
+                if not texts or not await self._client.collections.exists(self._index_name):
+                    outputs.results = [[] for _ in texts]
+                    return outputs.results
+
+                index = self._client.collections.get(self._index_name)
+
+                filters = (
+                    self._create_weaviate_filter(merged_options.where, self._separator)
+                    if merged_options.where
+                    else None
+                )
 
-                outputs.results = outputs_results
+                if merged_options.use_keyword_search:
+                    queries = [
+                        index.query.bm25(
+                            query=text,
+                            filters=filters,
+                            limit=merged_options.k,
+                            return_metadata=MetadataQuery(score=True),
+                            include_vector=True,
+                        )
+                        for text in texts
+                    ]
+                else:
+                    query_vectors = await self._embedder.embed_text(texts)
+                    queries = [
+                        index.query.near_vector(
+                            near_vector=cast(Sequence[float], query_vector),
+                            filters=filters,
+                            limit=merged_options.k,
+                            distance=merged_options.score_threshold,  # max accepted distance
+                            return_metadata=MetadataQuery(distance=True),
+                            include_vector=True,
+                        )
+                        for query_vector in query_vectors
+                    ]
 
+                outputs.results = [
+                    self._objects_to_results(results.objects, merged_options)
+                    for results in await asyncio.gather(*queries)
+                ]
                 return outputs.results
 
+    def _objects_to_results(
+        self, objects: Sequence[Object], options: WeaviateVectorStoreOptions
+    ) -> list[VectorStoreResult]:
+        """
+        Converts the objects returned by a Weaviate query to results following the "larger is better" convention.
+
+        Args:
+            objects: The returned objects.
+            options: The options of the query.
+
+        Returns:
+            The results.
+        """
+        # Ragbits has a "larger is better" convention for all scores, so we need to reverse the score if the distance
+        # method is "smaller is better".
+        # Weaviate documentation says that all distance methods are "smaller is better":
+        # https://weaviate.io/developers/weaviate/config-refs/distances#available-distance-metrics
+        score_multiplier = -1
+        results = []
+        for object_ in objects:
+            entry_raw = {"uuid": object_.uuid, "properties": self._unflatten_metadata(object_.properties)}
+            entry_dict = {
+                "id": entry_raw["uuid"],
+                "text": cast(dict, entry_raw["properties"]).get("text", None),
+                "image_bytes": cast(dict, entry_raw["properties"]).get("image_bytes", None),
+                "metadata": cast(dict, entry_raw["properties"]).get("metadata", {}),
+            }
+            entry = VectorStoreEntry.model_validate(entry_dict)
+
+            if options.use_keyword_search:
+                # For keyword search score follows "larger is better" rule,
+                # so we don't need to multiply it by score_multiplier
+                score = object_.metadata.score
+            else:
+                score = object_.metadata.distance * score_multiplier if object_.metadata.distance is not None else None
+
+            if score is not None:
+                results.append(
+                    VectorStoreResult(
+                        entry=entry,
+                        score=score,
+                        vector=cast(list[float], object_.vector["default"]),
+                    )
+                )
+        return results
+
     async def remove(self, ids: list[UUID]) -> None:
         """
         Remove entries from the vector store.
@@ -345,6 +426,26 @@ class WeaviateVectorStore(VectorStoreWithEmbedder[WeaviateVectorStoreOptions]):
                 if collection_exists:
                     index = self._client.collections.get(self._index_name)
                     await index.data.delete_many(where=Filter.by_id().contains_any(ids))
+                    await self._notify_change()
+
+    async def remove_where(self, where: WhereQuery) -> None:
+        """
+        Remove the entries matching the filter from the vector store, with filtered batch deletes.
+
+        Args:
+            where: The filter dictionary - the keys are the field names and the values are the values to filter by.
+        """
+        async with self._client:
+            with trace(where=where, index_name=self._index_name):
+                if not await self._client.collections.exists(self._index_name):
+                    return
+
+                index = self._client.collections.get(self._index_name)
+                weaviate_filter = self._create_weaviate_filter(where, self._separator)
+                # A single batch delete is limited by the server, so delete until no matching entries remain.
+                while (await index.data.delete_many(where=weaviate_filter)).successful:
+                    pass
+                await self._notify_change()
 
     @staticmethod
     def _create_weaviate_filter(where: WhereQuery, separator: str) -> FilterReturn:
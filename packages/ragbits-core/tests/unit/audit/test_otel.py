@@ -0,0 +1,34 @@
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+from opentelemetry.trace import StatusCode  # noqa: E402
+
+from ragbits.core.audit.traces import clear_trace_handlers, set_trace_handlers, trace  # noqa: E402
+from ragbits.core.audit.traces.base import SpanExportQueue  # noqa: E402
+from ragbits.core.audit.traces.otel import OtelTraceHandler  # noqa: E402
+
+
+def test_otel_trace_handler_with_export_queue() -> None:
+    clear_trace_handlers()
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    export_queue = SpanExportQueue()
+    set_trace_handlers(OtelTraceHandler(provider=provider, export_queue=export_queue))
+
+    with trace(name="parent", query="what?") as outputs:
+        with trace(name="child", vector=[0.1] * 1536):
+            pass
+        outputs.response = "answer"
+
+    clear_trace_handlers()
+    export_queue.shutdown()
+    child, parent = exporter.get_finished_spans()
+    assert child.parent.span_id == parent.context.span_id  # type: ignore[union-attr]
+    assert parent.attributes == {"inputs.query": "what?", "outputs.response": "answer"}
+    assert parent.status.status_code == StatusCode.OK
+    assert child.end_time <= parent.end_time  # type: ignore[operator]
@@ -2,12 +2,18 @@ import asyncio
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from ragbits.core.audit.traces import _get_function_inputs, set_trace_handlers, trace, traceable
-from ragbits.core.audit.traces.base import AttributeFormatter, TraceHandler
+from ragbits.core.audit.traces import (
+    _get_function_inputs,
+    clear_trace_handlers,
+    set_trace_handlers,
+    trace,
+    traceable,
+)
+from ragbits.core.audit.traces.base import AttributeFormatter, SpanExportQueue, TraceHandler
 from ragbits.core.prompt.base import SimplePrompt
 from ragbits.core.vector_stores import VectorStoreEntry
 
@@ -134,6 +140,54 @@ def test_traceable_no_return(mock_handler: MockTraceHandler) -> None:
     mock_handler.stop.assert_called_once_with(outputs={}, current_span=current_span)
 
 
+async def test_traceable_without_handlers() -> None:
+    clear_trace_handlers()
+
+    @traceable
+    def sample_sync_function(a: int) -> int:
+        return a + 1
+
+    @traceable
+    async def sample_async_function(a: int) -> int:
+        return a + 2
+
+    with patch("ragbits.core.audit.traces._get_function_inputs") as get_function_inputs:
+        assert sample_sync_function(1) == 2
+        assert await sample_async_function(1) == 3
+        with trace(input1="value1") as outputs:
+            outputs.result = "success"
+
+    get_function_inputs.assert_not_called()
+
+
+def test_trace_handler_sampling() -> None:
+    clear_trace_handlers()
+    handler = MockTraceHandler(sample_rate=0.0)
+    handler.start = MagicMock()  # type: ignore
+    handler.stop = MagicMock()  # type: ignore
+    set_trace_handlers(handler)
+
+    with trace(name="parent"), trace(name="child") as outputs:
+        outputs.result = "success"
+
+    clear_trace_handlers()
+    handler.start.assert_not_called()
+    handler.stop.assert_not_called()
+
+
+def test_span_export_queue() -> None:
+    export_queue = SpanExportQueue(max_size=1)
+    results: list[int] = []
+
+    assert export_queue.submit(lambda: results.append(1))
+    assert export_queue.flush(timeout=5)
+    export_queue.shutdown()
+    assert export_queue.submit(lambda: results.append(2))
+
+    assert results == [1, 2]
+    assert export_queue.dropped == 0
+
+
 @pytest.mark.parametrize(
     ("func", "args", "kwargs", "expected"),
     [
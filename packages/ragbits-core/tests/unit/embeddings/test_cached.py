@@ -0,0 +1,93 @@
+import pickle
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from ragbits.core.embeddings import CachedEmbedder, DenseEmbedder, NoopEmbedder
+from ragbits.core.options import Options
+from ragbits.core.utils.config_handling import ObjectConstructionConfig
+
+
+@pytest.fixture(name="embedder")
+def embedder_fixture() -> NoopEmbedder:
+    embedder = NoopEmbedder(return_values=[[[0.1, 0.2], [0.3, 0.4]]], image_return_values=[[[0.5, 0.6]]])
+    embedder.embed_text = AsyncMock(wraps=embedder.embed_text)  # type: ignore[method-assign]
+    return embedder
+
+
+async def test_cached_embedder_embeds_only_misses(embedder: NoopEmbedder) -> None:
+    cached = CachedEmbedder(embedder)
+
+    first = await cached.embed_text(["a", "b", "a"])
+    second = await cached.embed_text(["b", "c", "a"])
+
+    assert first == [pytest.approx([0.1, 0.2]), pytest.approx([0.3, 0.4]), pytest.approx([0.1, 0.2])]
+    assert second == [pytest.approx([0.3, 0.4]), pytest.approx([0.1, 0.2]), pytest.approx([0.1, 0.2])]
+    assert [call.args[0] for call in embedder.embed_text.call_args_list] == [["a", "b"], ["c"]]  # type: ignore[attr-defined]
+    assert (cached.hits, cached.misses) == (3, 3)
+
+
+async def test_cached_embedder_persists_on_disk(embedder: NoopEmbedder, tmp_path: Path) -> None:
+    cache_path = tmp_path / "embeddings.db"
+    await CachedEmbedder(embedder, cache_path=cache_path).embed_text(["a", "b"])
+
+    cached = CachedEmbedder(embedder, cache_path=cache_path, max_memory_entries=1)
+    result = await cached.embed_text(["b", "a"])
+
+    assert result == [pytest.approx([0.3, 0.4]), pytest.approx([0.1, 0.2])]
+    assert embedder.embed_text.call_count == 1  # type: ignore[attr-defined]
+    assert len(cached._memory) == 1
+
+
+async def test_cached_embedder_keys_on_options_and_kind(embedder: NoopEmbedder) -> None:
+    cached = CachedEmbedder(embedder)
+
+    await cached.embed_text(["a"])
+    await cached.embed_text(["a"], options=embedder.options_cls(dimensions=2))  # type: ignore[call-arg]
+    image = await cached.embed_image([b"a"])
+
+    assert embedder.embed_text.call_count == 2  # type: ignore[attr-defined]
+    assert image == [pytest.approx([0.5, 0.6])]
+
+
+async def test_cached_embedder_passes_default_options(embedder: NoopEmbedder) -> None:
+    cached = CachedEmbedder(embedder, default_options=Options(dimensions=2))  # type: ignore[call-arg]
+
+    await cached.embed_text(["a"])
+    await cached.embed_text(["a"], options=embedder.options_cls(dimensions=2))  # type: ignore[call-arg]
+    await cached.embed_text(["a"], options=embedder.options_cls(dimensions=3))  # type: ignore[call-arg]
+
+    assert embedder.embed_text.call_count == 2  # type: ignore[attr-defined]
+    assert embedder.embed_text.call_args_list[0].args[1].dimensions == 2  # type: ignore[attr-defined]
+    assert embedder.embed_text.call_args_list[1].args[1].dimensions == 3  # type: ignore[attr-defined]
+
+
+async def test_cached_embedder_pickling(tmp_path: Path) -> None:
+    cached = CachedEmbedder(NoopEmbedder(), cache_path=tmp_path / "embeddings.db")
+    await cached.embed_text(["a"])
+
+    unpickled = pickle.loads(pickle.dumps(cached))  # noqa: S301
+
+    assert await unpickled.embed_text(["a"]) == [pytest.approx([0.1, 0.1])]
+    assert (unpickled.hits, unpickled.misses) == (1, 1)
+
+
+def test_cached_embedder_from_config(tmp_path: Path) -> None:
+    config = ObjectConstructionConfig.model_validate(
+        {
+            "type": "CachedEmbedder",
+            "config": {
+                "embedder": {"type": "NoopEmbedder"},
+                "cache_path": str(tmp_path / "embeddings.db"),
+                "max_memory_entries": 100,
+            },
+        }
+    )
+
+    embedder: DenseEmbedder = DenseEmbedder.subclass_from_config(config)
+
+    assert isinstance(embedder, CachedEmbedder)
+    assert isinstance(embedder.embedder, NoopEmbedder)
+    assert embedder.namespace == "NoopEmbedder"
+    assert embedder.max_memory_entries == 100
@@ -0,0 +1,66 @@
+import asyncio
+from typing import Any
+
+import numpy as np
+
+from ragbits.core.embeddings.dense._inference import InferenceRunner
+
+
+class _CountingModel:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+
+def _encode(model: _CountingModel, data: list[str], kwargs: dict[str, Any]) -> np.ndarray:
+    model.batches.append(data)
+    return np.array([[len(text), kwargs.get("scale", 1)] for text in data], dtype=np.float32)
+
+
+async def test_inference_runner_runs_off_the_event_loop():
+    model = _CountingModel()
+    runner = InferenceRunner(model, _CountingModel, _encode, max_workers=2)
+
+    result = await runner.run(["a", "bbb"], {})
+
+    assert result.dtype == np.float32
+    assert result.tolist() == [[1.0, 1.0], [3.0, 1.0]]
+    assert model.batches == [["a", "bbb"]]
+
+
+async def test_inference_runner_micro_batches_concurrent_calls():
+    model = _CountingModel()
+    runner = InferenceRunner(model, _CountingModel, _encode, batch_window=0.01)
+
+    first, second, third = await asyncio.gather(
+        runner.run(["a"], {}),
+        runner.run(["bb", "ccc"], {}),
+        runner.run(["dddd"], {"scale": 2}),
+    )
+
+    assert first.tolist() == [[1.0, 1.0]]
+    assert second.tolist() == [[2.0, 1.0], [3.0, 1.0]]
+    assert third.tolist() == [[4.0, 2.0]]
+    assert sorted(model.batches) == [["a", "bb", "ccc"], ["dddd"]]
+
+
+async def test_inference_runner_skips_empty_input():
+    model = _CountingModel()
+    runner = InferenceRunner(model, _CountingModel, _encode)
+
+    result = await runner.run([], {})
+
+    assert result.shape[0] == 0
+    assert model.batches == []
+
+
+async def test_inference_runner_shutdown():
+    model = _CountingModel()
+    runner = InferenceRunner(model, _CountingModel, _encode, max_workers=1)
+    await runner.run(["a"], {})
+
+    runner.shutdown()
+    result = await runner.run(["bb"], {})
+
+    assert result.tolist() == [[2.0, 1.0]]
+    runner.shutdown()
+    assert runner._executor is None
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from ragbits.core.embeddings.base import VectorSize
@@ -128,3 +129,65 @@ async def test_litellm_embedder_get_vector_size_fallback_to_sample():
         mock_embedding.assert_called_once()
         assert vector_size.size == 4
         assert vector_size.is_sparse is False
+
+
+def create_mock_litellm(in_flight: list[int] | None = None) -> MagicMock:
+    """Create a mock litellm module embedding each text as a vector holding its length."""
+
+    async def aembedding(input: list[str], **kwargs) -> MagicMock:
+        if in_flight is not None:
+            in_flight.append(in_flight[-1] + 1)
+            await asyncio.sleep(0.01)
+            in_flight.append(in_flight[-1] - 1)
+        return create_mock_response([[float(len(text))] for text in input])
+
+    mock_litellm = MagicMock()
+    mock_litellm.aembedding = AsyncMock(side_effect=aembedding)
+    mock_litellm.openai = MagicMock()
+    return mock_litellm
+
+
+async def test_litellm_embedder_splits_batches():
+    """Test that inputs exceeding the batch limits are split into multiple requests."""
+    embedder = LiteLLMEmbedder(max_batch_size=2, max_batch_tokens=10)
+    data = ["a", "bb", "ccc", "d" * 40, "e"]
+
+    with patch.object(embedder, "_get_litellm_module", return_value=create_mock_litellm()) as mock_get_module:
+        embeddings = await embedder.embed_text(data)
+
+    assert embeddings == [[1.0], [2.0], [3.0], [40.0], [1.0]]
+    assert [call.kwargs["input"] for call in mock_get_module.return_value.aembedding.call_args_list] == [
+        ["a", "bb"],
+        ["ccc"],
+        ["d" * 40],
+        ["e"],
+    ]
+
+
+async def test_litellm_embedder_limits_concurrency():
+    """Test that the number of requests in flight does not exceed max_concurrency."""
+    embedder = LiteLLMEmbedder(max_batch_size=1, max_concurrency=2)
+    in_flight = [0]
+
+    with patch.object(embedder, "_get_litellm_module", return_value=create_mock_litellm(in_flight)):
+        await asyncio.gather(embedder.embed_text(["a", "b", "c"]), embedder.embed_text(["d", "e"]))
+
+    assert max(in_flight) == 2
+
+
+async def test_litellm_embedder_coalesces_concurrent_calls():
+    """Test that concurrent calls within the coalescing window are sent in a single request."""
+    embedder = LiteLLMEmbedder(coalesce_window=0.01)
+
+    with patch.object(embedder, "_get_litellm_module", return_value=create_mock_litellm()) as mock_get_module:
+        results = await asyncio.gather(
+            embedder.embed_text(["a", "bb"]),
+            embedder.embed_text(["ccc"]),
+            embedder.embed_text(["dddd"], options=LiteLLMEmbedderOptions(dimensions=2)),
+        )
+
+    assert results == [[[1.0], [2.0]], [[3.0]], [[4.0]]]
+    assert [call.kwargs["input"] for call in mock_get_module.return_value.aembedding.call_args_list] == [
+        ["a", "bb", "ccc"],
+        ["dddd"],
+    ]
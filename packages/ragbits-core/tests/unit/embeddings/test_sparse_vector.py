@@ -0,0 +1,44 @@
+import pickle
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from ragbits.core.embeddings import SparseVector
+
+
+def test_sparse_vector_stores_compact_arrays():
+    vector = SparseVector(indices=[3, 1], values=[0.5, 2.0])
+
+    assert vector.indices.dtype == np.int32
+    assert vector.values.dtype == np.float32
+    assert vector.indices.tolist() == [1, 3]
+    assert vector.values.tolist() == [2.0, 0.5]
+
+
+def test_sparse_vector_sums_repeated_indices():
+    vector = SparseVector(indices=[2, 0, 2], values=[1.0, 3.0, 1.5])
+
+    assert vector.indices.tolist() == [0, 2]
+    assert vector.values.tolist() == [3.0, 2.5]
+
+
+def test_sparse_vector_length_mismatch():
+    with pytest.raises(ValidationError):
+        SparseVector(indices=[1, 2], values=[1.0])
+
+
+def test_sparse_vector_dot():
+    first = SparseVector(indices=[0, 2, 5], values=[1.0, 2.0, 3.0])
+    second = SparseVector(indices=[2, 3, 5], values=[4.0, 1.0, 0.5])
+
+    assert first.dot(second) == pytest.approx(9.5)
+    assert first.dot(SparseVector(indices=[1], values=[1.0])) == 0.0
+
+
+def test_sparse_vector_serializes_to_lists():
+    vector = SparseVector(indices=[1, 3], values=[0.5, 0.25])
+
+    assert vector.model_dump() == {"indices": [1, 3], "values": [0.5, 0.25]}
+    assert SparseVector.model_validate_json(vector.model_dump_json()) == vector
+    assert pickle.loads(pickle.dumps(vector)) == vector  # noqa: S301
@@ -0,0 +1,110 @@
+import pickle
+from pathlib import Path
+from unittest.mock import patch
+
+from ragbits.core.audit.metrics.base import LLMMetric
+from ragbits.core.llms.cache import LLMCache
+from ragbits.core.llms.litellm import LiteLLM, LiteLLMOptions
+from ragbits.core.llms.mock import MockLLM, MockLLMOptions
+
+
+async def test_generate_serves_identical_prompts_from_cache() -> None:
+    cache = LLMCache(deterministic_only=False)
+    llm = MockLLM(default_options=MockLLMOptions(response="Paris"), cache=cache)
+
+    first = await llm.generate_with_metadata(["Capital of France?", "Capital of France?", "Capital of Italy?"])
+    second = await llm.generate_with_metadata("Capital of France?")
+
+    assert [response.content for response in first] == ["Paris", "Paris", "Paris"]
+    assert second.content == "Paris"
+    assert second.metadata["cached"] is True
+    assert len(llm.calls) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+async def test_cache_metrics_follow_cache_counters() -> None:
+    cache = LLMCache(deterministic_only=False)
+    llm = MockLLM(default_options=MockLLMOptions(response="Paris"), cache=cache)
+
+    with patch("ragbits.core.llms.cache.record_metric") as record_metric:
+        await llm.generate_with_metadata(["Capital of France?", "Capital of France?", "Capital of Italy?"])
+        await llm.generate_with_metadata(["Capital of France?", "Capital of Spain?"])
+
+    recorded = {LLMMetric.CACHE_HITS: 0, LLMMetric.CACHE_MISSES: 0}
+    for call in record_metric.call_args_list:
+        recorded[call.kwargs["metric"]] += call.kwargs["value"]
+        assert call.kwargs["model"] == llm.model_name
+    assert (recorded[LLMMetric.CACHE_HITS], recorded[LLMMetric.CACHE_MISSES]) == (cache.hits, cache.misses) == (1, 3)
+
+
+async def test_generate_with_cache_opt_out() -> None:
+    llm = MockLLM(cache=LLMCache(deterministic_only=False))
+
+    await llm.generate("Hello")
+    await llm.generate("Hello", use_cache=False)
+
+    assert len(llm.calls) == 2
+
+
+async def test_generate_keys_cache_on_options() -> None:
+    llm = MockLLM(cache=LLMCache(deterministic_only=False))
+
+    first = await llm.generate("Hello", options=MockLLMOptions(response="Hi"))
+    second = await llm.generate("Hello", options=MockLLMOptions(response="Hey"))
+
+    assert (first, second) == ("Hi", "Hey")
+    assert len(llm.calls) == 2
+
+
+async def test_generate_caches_only_deterministic_responses() -> None:
+    cache = LLMCache()
+    llm = LiteLLM(default_options=LiteLLMOptions(mock_response="Paris"), cache=cache)
+
+    await llm.generate("Capital of France?")
+    await llm.generate("Capital of France?")
+    await llm.generate("Capital of France?", options=LiteLLMOptions(temperature=0))
+    response = await llm.generate_with_metadata("Capital of France?", options=LiteLLMOptions(temperature=0))
+
+    assert response.content == "Paris"
+    assert response.metadata["cached"] is True
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+async def test_generate_streaming_replays_cached_chunks() -> None:
+    llm = MockLLM(
+        default_options=MockLLMOptions(response_stream=["Par", "is"]), cache=LLMCache(deterministic_only=False)
+    )
+
+    first = [chunk async for chunk in llm.generate_streaming("Capital of France?")]
+    stream = llm.generate_streaming("Capital of France?")
+    second = [chunk async for chunk in stream]
+
+    assert first == second == ["Par", "is"]
+    assert stream.usage.total_tokens == 30
+    assert len(llm.calls) == 1
+
+
+async def test_generate_serves_responses_from_disk(tmp_path: Path) -> None:
+    first_llm = MockLLM(cache=LLMCache(cache_path=tmp_path / "cache.db", deterministic_only=False))
+    await first_llm.generate("Hello")
+
+    second_llm = MockLLM(cache=LLMCache(cache_path=tmp_path / "cache.db", deterministic_only=False))
+    response = await second_llm.generate("Hello")
+
+    assert response == "mocked response"
+    assert second_llm.calls == []
+    assert second_llm.cache.hit_rate == 1.0  # type: ignore[union-attr]
+
+
+def test_litellm_pickling_keeps_cache_config(tmp_path: Path) -> None:
+    llm = LiteLLM(cache=LLMCache(cache_path=tmp_path / "cache.db", max_memory_entries=10))
+    llm_pickled = pickle.loads(pickle.dumps(llm))  # noqa: S301
+    assert llm_pickled.cache.cache_path == tmp_path / "cache.db"
+    assert llm_pickled.cache.max_memory_entries == 10
+    assert llm_pickled.cache.deterministic_only is True
+
+
+def test_llm_from_config_with_cache() -> None:
+    llm = MockLLM.from_config({"cache": {"max_memory_entries": 10}})
+    assert isinstance(llm.cache, LLMCache)
+    assert llm.cache.max_memory_entries == 10
@@ -1,7 +1,11 @@
+import asyncio
 import json
 import pickle
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import litellm
 import pytest
 from litellm import Message, Router, Usage
 from litellm.types.utils import ChatCompletionMessageToolCall, Choices, Function, ModelResponse
@@ -12,8 +16,10 @@ from ragbits.core.llms.exceptions import (
     LLMNotSupportingImagesError,
     LLMNotSupportingReasoningEffortError,
     LLMNotSupportingToolUseError,
+    LLMRateLimitError,
 )
 from ragbits.core.llms.litellm import LiteLLM, LiteLLMOptions
+from ragbits.core.llms.scheduler import LLMScheduler
 from ragbits.core.prompt import Prompt
 from ragbits.core.prompt.base import BasePrompt, BasePromptWithParser, ChatFormat
 from ragbits.core.utils.function_schema import convert_function_to_function_schema
@@ -473,3 +479,62 @@ async def test_create_router_from_self_and_options():
     model_config_with_limits = router_with_limits.model_list[0]
     assert model_config_with_limits["litellm_params"]["tpm"] == 1000
     assert model_config_with_limits["litellm_params"]["rpm"] == 60
+
+
+async def test_generation_within_scheduler_limit():
+    """Test that batched prompts are sent within the limit of requests in flight of the scheduler."""
+    llm = LiteLLM(api_key="test_key", scheduler=LLMScheduler(max_concurrency=2))
+    in_flight = peak = 0
+
+    async def get_response(**kwargs: Any) -> ModelResponse:  # noqa: ANN401
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return ModelResponse(
+            choices=[Choices(message=Message(content="response", role="assistant"))],
+            usage=Usage(completion_tokens=1, prompt_tokens=5, total_tokens=6),
+        )
+
+    llm._get_litellm_response = get_response  # type: ignore
+    outputs = await llm.generate([MockPrompt(f"Question {i}") for i in range(5)])
+
+    assert outputs == ["response"] * 5
+    assert peak == 2
+
+
+async def test_generation_retries_rate_limited_requests():
+    """Test that requests rejected with a rate limit error are retried after the time from the response."""
+    llm = LiteLLM(api_key="test_key", scheduler=LLMScheduler(max_retries=1))
+    rate_limit_error = litellm.RateLimitError(
+        "Rate limit exceeded.",
+        llm_provider="openai",
+        model="gpt-3.5-turbo",
+        response=httpx.Response(429, headers={"retry-after-ms": "10"}, request=httpx.Request("POST", "https://test")),
+    )
+
+    response = ModelResponse(
+        choices=[Choices(message=Message(content="response", role="assistant"))],
+        usage=Usage(completion_tokens=1, prompt_tokens=5, total_tokens=6),
+    )
+
+    with patch.object(llm._litellm.Router, "acompletion", AsyncMock(side_effect=[rate_limit_error, response])):
+        assert await llm.generate(MockPrompt("Hello, how are you?")) == "response"
+
+    with (
+        patch.object(llm._litellm.Router, "acompletion", AsyncMock(side_effect=rate_limit_error)),
+        pytest.raises(LLMRateLimitError) as exc_info,
+    ):
+        await llm.generate(MockPrompt("Hello, how are you?"))
+
+    assert exc_info.value.retry_after == 0.01
+
+
+async def test_pickling_keeps_scheduler_limits():
+    """Test that the limits of the scheduler are kept when the LiteLLM class is pickled."""
+    llm = LiteLLM(scheduler=LLMScheduler(max_concurrency=4, requests_per_minute=100, tokens_per_minute=1000))
+    llm_pickled = pickle.loads(pickle.dumps(llm))  # noqa: S301
+    assert llm_pickled.scheduler.max_concurrency == 4
+    assert llm_pickled.scheduler.requests_per_minute == 100
+    assert llm_pickled.scheduler.tokens_per_minute == 1000
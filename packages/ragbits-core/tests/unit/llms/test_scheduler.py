@@ -0,0 +1,116 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from ragbits.core.llms.exceptions import LLMRateLimitError
+from ragbits.core.llms.scheduler import LLMScheduler
+
+
+class FakeClock:
+    """
+    Clock advanced by the sleeps of the scheduler.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+async def test_scheduler_limits_requests_in_flight() -> None:
+    scheduler = LLMScheduler(max_concurrency=3)
+    in_flight = peak = 0
+
+    async def request() -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    await asyncio.gather(*(scheduler.run(request) for _ in range(10)))
+
+    assert peak == 3
+
+
+async def test_scheduler_shares_slots_between_callers() -> None:
+    scheduler = LLMScheduler(max_concurrency=1)
+    order: list[str] = []
+
+    def request(name: str):  # noqa: ANN202
+        async def send() -> None:
+            order.append(name)
+            await asyncio.sleep(0)
+
+        return send
+
+    await asyncio.gather(
+        *(scheduler.run(request(f"a{i}"), caller="a") for i in range(4)),
+        *(scheduler.run(request(f"b{i}"), caller="b") for i in range(2)),
+    )
+
+    assert order == ["a0", "a1", "b0", "a2", "b1", "a3"]
+
+
+async def test_scheduler_limits_tokens_per_minute() -> None:
+    clock = FakeClock()
+
+    async def request() -> float:
+        return clock.now
+
+    with (
+        patch("ragbits.core.llms.scheduler.time", clock),
+        patch.object(asyncio, "sleep", clock.sleep),
+    ):
+        scheduler = LLMScheduler(tokens_per_minute=100)
+        sent_at = [await scheduler.run(request, tokens=60) for _ in range(3)]
+
+    assert sent_at == pytest.approx([0.0, 12.0, 48.0])
+
+
+async def test_scheduler_retries_after_rate_limit_error() -> None:
+    clock = FakeClock()
+    attempts = 0
+
+    async def request() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise LLMRateLimitError("Rate limit exceeded.", retry_after=5.0)
+        return "response"
+
+    with (
+        patch("ragbits.core.llms.scheduler.time", clock),
+        patch.object(asyncio, "sleep", clock.sleep),
+    ):
+        response = await LLMScheduler(max_retries=1).run(request)
+
+    assert response == "response"
+    assert clock.sleeps == [5.0]
+
+
+async def test_scheduler_raises_rate_limit_error_after_max_retries() -> None:
+    scheduler = LLMScheduler(max_retries=2, backoff=0.001)
+    attempts = 0
+
+    async def request() -> None:
+        nonlocal attempts
+        attempts += 1
+        raise LLMRateLimitError("Rate limit exceeded.")
+
+    with pytest.raises(LLMRateLimitError):
+        await scheduler.run(request)
+
+    assert attempts == 3
+
+
+def test_scheduler_rejects_non_positive_limits() -> None:
+    with pytest.raises(ValueError):
+        LLMScheduler(max_concurrency=0)
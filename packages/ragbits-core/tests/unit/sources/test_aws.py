@@ -1,4 +1,5 @@
-from unittest.mock import patch
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
 
 from sympy.testing import pytest
 
@@ -46,3 +47,44 @@ async def test_from_uri_raises_exception():
     for uri in wrong_uris:
         with pytest.raises(ValueError):
             await S3Source.from_uri(uri)
+
+
+async def test_fingerprint_from_listing():
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": "path/to/file", "ETag": '"etag"'}]}
+    ]
+    with patch.object(S3Source, "_s3_client", client):
+        (source,) = await S3Source.list_sources(bucket_name="bucket", prefix="path/to")
+        assert await source.fingerprint() == '"etag"'
+
+    client.head_object.assert_not_called()
+
+
+async def test_fingerprint_from_head_object():
+    client = MagicMock()
+    client.head_object.return_value = {"ETag": '"etag"'}
+    with patch.object(S3Source, "_s3_client", client):
+        assert await S3Source(bucket_name="bucket", key="path/to/file").fingerprint() == '"etag"'
+
+    client.head_object.assert_called_once_with(Bucket="bucket", Key="path/to/file")
+
+
+async def test_iter_sources_lists_pages_lazily():
+    requested_pages = []
+
+    def _paginate(**kwargs: str) -> Iterator[dict]:
+        for page in range(3):
+            requested_pages.append(page)
+            yield {"Contents": [{"Key": f"path/to/file{page}", "ETag": f'"etag{page}"'}]}
+
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.side_effect = _paginate
+    with patch.object(S3Source, "_s3_client", client):
+        sources = S3Source.iter_sources(bucket_name="bucket", prefix="path/to")
+        first = await anext(sources)
+
+        assert first.key == "path/to/file0"
+        assert requested_pages == [0]
+        assert [source.key async for source in sources] == ["path/to/file1", "path/to/file2"]
+        assert requested_pages == [0, 1, 2]
@@ -127,11 +127,8 @@ def test_get_blob_service_with_default_credentials():
 
 @pytest.mark.asyncio
 async def test_fetch():
-    blob_content = b"Sample blob content"
-
     mock_blob_service_client = MagicMock()
     mock_blob_client = mock_blob_service_client.get_blob_client.return_value
-    mock_blob_client.download_blob.return_value.readall = MagicMock(return_value=blob_content)
 
     with (
         patch.object(AzureBlobStorageSource, "_get_blob_service", return_value=mock_blob_service_client),
@@ -148,7 +145,8 @@ async def test_fetch():
         expected_path = PosixPath("/test_path/test_account/test_container/test_blob.txt")
         assert downloaded_path == expected_path
         mocked_file.assert_called_once_with(expected_path, "wb")
-        mocked_file().write.assert_called_once_with(blob_content)
+        mock_blob_client.download_blob.assert_called_once_with(max_concurrency=8)
+        mock_blob_client.download_blob.return_value.readinto.assert_called_once_with(mocked_file())
 
 
 @pytest.mark.asyncio
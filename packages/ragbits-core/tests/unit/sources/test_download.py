@@ -0,0 +1,82 @@
+import asyncio
+import threading
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ragbits.core.sources.download import (
+    download_slot,
+    get_max_concurrent_downloads,
+    run_download,
+    set_max_concurrent_downloads,
+    shared_http_session,
+)
+from ragbits.core.sources.s3 import S3Source
+
+
+@pytest.fixture(name="max_concurrent_downloads")
+def max_concurrent_downloads_fixture() -> Iterator[int]:
+    set_max_concurrent_downloads(2)
+    yield 2
+    set_max_concurrent_downloads(None)
+
+
+async def test_download_slot_limits_concurrency(max_concurrent_downloads: int) -> None:
+    running = 0
+    max_running = 0
+
+    async def _download() -> None:
+        nonlocal running, max_running
+        async with download_slot():
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*[_download() for _ in range(6)])
+
+    assert max_running == max_concurrent_downloads
+
+
+async def test_run_download_in_thread() -> None:
+    thread_id = await run_download(threading.get_ident)
+
+    assert thread_id != threading.get_ident()
+
+
+def test_max_concurrent_downloads_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RAGBITS_MAX_CONCURRENT_DOWNLOADS", "3")
+
+    assert get_max_concurrent_downloads() == 3
+
+
+def test_max_concurrent_downloads_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        set_max_concurrent_downloads(0)
+
+
+async def test_shared_http_session_reused_while_in_use() -> None:
+    async with shared_http_session() as first, shared_http_session() as second:
+        assert first is second
+        assert not first.closed
+
+    assert first.closed
+    async with shared_http_session() as third:
+        assert third is not first
+
+
+async def test_s3_fetch_offloads_download(tmp_path) -> None:  # noqa: ANN001
+    client = MagicMock()
+    caller_thread_id = threading.get_ident()
+    client.download_file.side_effect = lambda *args, **kwargs: setattr(client, "thread_id", threading.get_ident())
+    with (
+        patch.object(S3Source, "_s3_client", client),
+        patch("ragbits.core.sources.s3.get_local_storage_dir", return_value=tmp_path),
+    ):
+        path = await S3Source(bucket_name="bucket", key="path/to/file").fetch()
+
+    assert path == tmp_path / "bucket" / "path_to_file"
+    assert client.thread_id != caller_thread_id
+    assert client.download_file.call_args.args == ("bucket", "path/to/file", str(path))
+    assert client.download_file.call_args.kwargs["Config"].max_concurrency == S3Source._multipart_concurrency
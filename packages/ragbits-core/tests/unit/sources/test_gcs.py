@@ -1,5 +1,6 @@
 from types import TracebackType
 from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 from aiohttp import ClientSession
 from gcloud.aio.storage import Storage as StorageClient
@@ -72,3 +73,24 @@ async def test_gcs_source_fetch() -> None:
     assert path.name == "doc.md"
     assert path.read_text() == "This is the content of the file."
     assert mock_storage.downloaded_files == [("test-bucket", "doc.md")]
+
+
+async def test_gcs_source_iter_sources_follows_pages() -> None:
+    storage = MagicMock()
+    storage.__aenter__ = AsyncMock(return_value=storage)
+    storage.__aexit__ = AsyncMock()
+    storage.list_objects = AsyncMock(
+        side_effect=[
+            {"items": [{"name": "folder/doc1.md"}, {"name": "folder/"}], "nextPageToken": "token"},
+            {"items": [{"name": "folder/doc2.md"}]},
+        ]
+    )
+    GCSSource.set_storage(storage)
+
+    try:
+        sources = [source async for source in GCSSource.iter_sources(bucket="test-bucket", prefix="folder/")]
+    finally:
+        GCSSource.set_storage(None)
+
+    assert [source.object_name for source in sources] == ["folder/doc1.md", "folder/doc2.md"]
+    assert storage.list_objects.call_args_list[1].kwargs["params"] == {"prefix": "folder/", "pageToken": "token"}
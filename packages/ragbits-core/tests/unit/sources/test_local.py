@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from ragbits.core.sources.base import SourceResolver
 from ragbits.core.sources.local import LocalFileSource
 
 TEST_FILE_PATH = Path(__file__)
@@ -21,3 +22,36 @@ async def test_local_source_list_sources():
     assert sum(1 for _ in sources) == 2
     assert all(isinstance(source, LocalFileSource) for source in sources)
     assert all(source.path.suffix == ".md" for source in sources)
+
+
+async def test_local_source_fingerprint(tmp_path: Path):
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("George")
+    source = LocalFileSource(path=file_path)
+
+    fingerprint = await source.fingerprint()
+    assert fingerprint == await source.fingerprint()
+
+    file_path.write_text("Peppa Pig")
+    assert await source.fingerprint() != fingerprint
+    assert await LocalFileSource(path=tmp_path / "missing.txt").fingerprint() is None
+
+
+async def test_local_source_iter_sources(tmp_path: Path):
+    for name in ["a.md", "b.md", "c.txt"]:
+        (tmp_path / name).write_text(name)
+
+    sources = LocalFileSource.iter_sources(tmp_path, file_pattern="*.md")
+
+    assert sorted([source.path.name async for source in sources]) == ["a.md", "b.md"]
+
+
+async def test_source_resolver_iter_resolve(tmp_path: Path):
+    (tmp_path / "dir").mkdir()
+    for name in ["a.md", "b.md", "dir/c.md"]:
+        (tmp_path / name).write_text(name)
+
+    sources = [source async for source in SourceResolver.iter_resolve(f"local://{tmp_path}/**/*.md")]
+
+    assert sorted(source.path.name for source in sources) == ["a.md", "b.md", "c.md"]
+    assert sources == list(await SourceResolver.resolve(f"local://{tmp_path}/**/*.md"))
@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from ragbits.core.utils.batching import MicroBatcher
+
+
+async def test_micro_batcher_groups_calls_with_equal_params():
+    calls: list[tuple[list[int], str]] = []
+
+    async def process_batch(items: list[int], params: str) -> list[str]:
+        calls.append((items, params))
+        return [f"{params}{item}" for item in items]
+
+    batcher = MicroBatcher(process_batch, window=0.01)
+
+    first, second, third = await asyncio.gather(
+        batcher.submit([1, 2], "a"),
+        batcher.submit([3], "a"),
+        batcher.submit([4], "b"),
+    )
+
+    assert first == ["a1", "a2"]
+    assert second == ["a3"]
+    assert third == ["b4"]
+    assert sorted(calls) == [([1, 2, 3], "a"), ([4], "b")]
+
+
+async def test_micro_batcher_propagates_errors():
+    async def process_batch(items: list[int], params: None) -> list[int]:
+        raise ValueError("failed")
+
+    batcher = MicroBatcher(process_batch)
+
+    results = await asyncio.gather(batcher.submit([1], None), batcher.submit([2], None), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    with pytest.raises(ValueError):
+        await batcher.submit([3], None)
@@ -1,6 +1,8 @@
+from collections.abc import AsyncIterator
+
 import pytest
 
-from ragbits.core.utils.helpers import batched
+from ragbits.core.utils.helpers import abatched, batched
 
 
 @pytest.mark.parametrize(
@@ -27,3 +29,24 @@ from ragbits.core.utils.helpers import batched
 def test_batched(input_data: list[int], batch_size: int, expected: list[list[int]]) -> None:
     result = list(batched(input_data, batch_size))
     assert result == expected
+
+
+async def _agenerate(data: list[int]) -> AsyncIterator[int]:
+    for item in data:
+        yield item
+
+
+@pytest.mark.parametrize("is_async", [False, True], ids=["sync_iterable", "async_iterable"])
+@pytest.mark.parametrize(
+    ("input_data", "batch_size", "expected"),
+    [
+        ([], 3, []),
+        ([1, 2, 3], None, [[1, 2, 3]]),
+        ([1, 2, 3, 4, 5], 2, [[1, 2], [3, 4], [5]]),
+    ],
+    ids=["empty_iterable", "none_batch_size", "batch_size_with_remainder"],
+)
+async def test_abatched(input_data: list[int], batch_size: int, expected: list[list[int]], is_async: bool) -> None:
+    data = _agenerate(input_data) if is_async else input_data
+    result = [batch async for batch in abatched(data, batch_size)]
+    assert result == expected
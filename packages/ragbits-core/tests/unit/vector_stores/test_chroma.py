@@ -130,6 +130,29 @@ async def test_retrieve(
         assert query_result.entry.image_bytes == result.get("image")
 
 
+async def test_retrieve_many(mock_chromadb_store: ChromaVectorStore) -> None:
+    ids = [str(uuid.uuid5(uuid.NAMESPACE_OID, "test id 1")), str(uuid.uuid5(uuid.NAMESPACE_OID, "test id 2"))]
+    mock_chromadb_store._embedder = NoopEmbedder(return_values=[[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]])
+    mock_chromadb_store._collection.query.return_value = {  # type: ignore
+        "metadatas": [[{"content": "test content 1"}], [{"content": "test content 2"}]],
+        "embeddings": [[[0.12, 0.25, 0.29]], [[0.42, 0.51, 0.59]]],
+        "distances": [[0.1], [0.3]],
+        "documents": [["test content 1"], ["test content 2"]],
+        "ids": [[ids[0]], [ids[1]]],
+    }
+
+    query_results = await mock_chromadb_store.retrieve_many(
+        ["query 1", "query 2"], options=VectorStoreOptions(score_threshold=0.8)
+    )
+
+    mock_chromadb_store._collection.query.assert_called_once()  # type: ignore
+    assert mock_chromadb_store._collection.query.call_args.kwargs["query_embeddings"] == [  # type: ignore
+        [0.1, 0.2, 0.3],
+        [0.4, 0.5, 0.6],
+    ]
+    assert [[result.entry.text for result in results] for results in query_results] == [["test content 1"], []]
+
+
 async def test_retrieve_l2(mock_chromadb_l2_store: ChromaVectorStore) -> None:
     ids = [str(uuid.uuid5(uuid.NAMESPACE_OID, "test id 1")), str(uuid.uuid5(uuid.NAMESPACE_OID, "test id 2"))]
     mock_chromadb_l2_store._collection.query.return_value = {  # type: ignore
@@ -183,6 +206,14 @@ async def test_remove(mock_chromadb_store: ChromaVectorStore) -> None:
     )
 
 
+async def test_remove_where(mock_chromadb_store: ChromaVectorStore) -> None:
+    await mock_chromadb_store.remove_where({"document_meta": {"source": {"id": "local_file:/test/path"}}})
+
+    mock_chromadb_store._client.get_or_create_collection().delete.assert_called_once_with(  # type: ignore
+        where={"document_meta.source.id": "local_file:/test/path"}
+    )
+
+
 async def test_list(mock_chromadb_store: ChromaVectorStore) -> None:
     mock_chromadb_store._collection.get.return_value = {  # type: ignore
         "metadatas": [
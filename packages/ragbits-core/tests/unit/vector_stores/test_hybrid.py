@@ -95,6 +95,20 @@ async def test_hybrid_remove(entries: list[VectorStoreEntry]):
     assert vs1_entries == entries[:2] + entries[3:]
 
 
+async def test_hybrid_remove_where(entries: list[VectorStoreEntry]):
+    vs1 = InMemoryVectorStore(embedder=NoopEmbedder())
+    vs2 = InMemoryVectorStore(embedder=NoopEmbedder())
+    vs_hybrid = HybridSearchVectorStore(vs1, vs2)
+
+    tagged = [entry.model_copy(update={"metadata": {"tag": i % 2}}) for i, entry in enumerate(entries)]
+    await vs1.store(tagged)
+    await vs2.store(tagged)
+    await vs_hybrid.remove_where({"tag": 0})
+
+    for vs in (vs1, vs2):
+        assert sorted(entry.id for entry in await vs.list()) == [entry.id for entry in tagged[1::2]]
+
+
 async def test_hybrid_retrieve(entries: list[VectorStoreEntry]):
     vs1 = InMemoryVectorStore(
         embedder=NoopEmbedder(
@@ -124,3 +138,17 @@ async def test_hybrid_retrieve(entries: list[VectorStoreEntry]):
     entries_order = [2, 5, 3, 1, 4, 0]
     assert [r.entry for r in results] == [entries[i] for i in entries_order]
     assert [r.score for r in results] == [max(s.score for s in r.subresults) for r in results]
+
+
+async def test_hybrid_retrieve_many(entries: list[VectorStoreEntry]):
+    vs1 = InMemoryVectorStore(embedder=NoopEmbedder())
+    vs2 = InMemoryVectorStore(embedder=NoopEmbedder())
+    vs_hybrid = HybridSearchVectorStore(vs1, vs2)
+
+    await vs1.store(entries[:2])
+    await vs2.store(entries[2:3])
+    results = await vs_hybrid.retrieve_many(["foo", "bar"])
+
+    assert len(results) == 2
+    for query_results in results:
+        assert sorted(result.entry.id for result in query_results) == [entry.id for entry in entries[:3]]
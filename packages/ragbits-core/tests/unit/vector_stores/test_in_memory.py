@@ -1,11 +1,15 @@
 from pathlib import Path
+from unittest.mock import AsyncMock
+from uuid import uuid4
 
 import pytest
 from pydantic import computed_field
 
+from ragbits.core.embeddings import SparseEmbedder, SparseVector, VectorSize
 from ragbits.core.embeddings.dense import NoopEmbedder
+from ragbits.core.options import Options
 from ragbits.core.sources.local import LocalFileSource
-from ragbits.core.vector_stores.base import EmbeddingType, VectorStoreOptions
+from ragbits.core.vector_stores.base import EmbeddingType, VectorStoreEntry, VectorStoreOptions
 from ragbits.core.vector_stores.in_memory import InMemoryVectorStore
 from ragbits.document_search.documents.document import DocumentMeta, DocumentType
 from ragbits.document_search.documents.element import Element
@@ -45,6 +49,23 @@ class AnimalElement(Element):
         return self.photo
 
 
+class WordCountEmbedder(SparseEmbedder[Options]):
+    """
+    A test sparse embedder counting occurrences of single-letter words.
+    """
+
+    options_cls = Options
+
+    async def get_vector_size(self) -> VectorSize:  # noqa: PLR6301
+        return VectorSize(size=26, is_sparse=True)
+
+    async def embed_text(self, texts: list[str], options: Options | None = None) -> list[SparseVector]:  # noqa: PLR6301
+        return [
+            SparseVector(indices=[ord(word) - ord("a") for word in text.split()], values=[1.0] * len(text.split()))
+            for text in texts
+        ]
+
+
 async def text_store_fixture() -> InMemoryVectorStore:
     def meta(name: str) -> DocumentMeta:
         return DocumentMeta(document_type=DocumentType.TXT, source=LocalFileSource(path=Path(f"{name}.txt")))
@@ -270,3 +291,207 @@ async def test_where_limit(store: InMemoryVectorStore) -> None:
 
     assert len(results) == 1
     assert results[0].metadata["name"] == "hairy"
+
+
+async def test_store_overwrites_existing_entry(store: InMemoryVectorStore) -> None:
+    entry = (await store.list())[0]
+    store._embedder = NoopEmbedder(return_values=[[[0.4, 0.4]], [[0.4, 0.4]]], image_return_values=[[[0.4, 0.4]]])
+
+    await store.store([entry])
+    results = await store.retrieve("query", options=VectorStoreOptions(k=1))
+
+    assert len(await store.list()) == 6
+    assert results[0].entry.id == entry.id
+    assert results[0].score == pytest.approx(0.0, abs=1e-6)
+
+
+async def test_retrieve_after_remove(store: InMemoryVectorStore) -> None:
+    entries = await store.list()
+    await store.remove([entries[0].id])
+
+    results = await store.retrieve("query", options=VectorStoreOptions(k=2))
+
+    assert [result.entry.metadata["name"] for result in results] == ["fluffy", "slimy"]
+
+
+async def test_retrieve_top_k_from_large_store() -> None:
+    vectors = [[float(i), float(i)] for i in range(3000)]
+    entries = [VectorStoreEntry(id=uuid4(), text=str(i)) for i in range(3000)]
+    store = InMemoryVectorStore(embedder=NoopEmbedder(return_values=[vectors, [[1599.2, 1599.2]]]))
+    await store.store(entries)
+    await store.remove([entry.id for entry in entries[:1600]])
+
+    results = await store.retrieve("query", options=VectorStoreOptions(k=3))
+
+    assert [result.entry.text for result in results] == ["1600", "1601", "1602"]
+    assert results[0].vector == [1600.0, 1600.0]
+    assert len(await store.list()) == 1400
+
+
+async def test_retrieve_l2_large_norm_vectors() -> None:
+    vectors = [[1000.0 + 0.01 * i] * 8 for i in range(5)]
+    entries = [VectorStoreEntry(id=uuid4(), text=str(i)) for i in range(5)]
+    store = InMemoryVectorStore(embedder=NoopEmbedder(return_values=[vectors, [[1000.0] * 8]]))
+    await store.store(entries)
+
+    results = await store.retrieve("query", options=VectorStoreOptions(k=5))
+
+    assert [result.entry.text for result in results] == ["0", "1", "2", "3", "4"]
+    assert results[1].score == pytest.approx(-(8**0.5) * 0.01, rel=1e-2)
+
+
+@pytest.mark.parametrize(
+    ("distance_method", "results", "scores"),
+    [
+        ("l2", ["0", "2", "1"], [-1.0, -1.0, -(5**0.5)]),
+        ("ip", ["0", "1", "2"], [2.0, 0.0, 0.0]),
+        ("cosine", ["0", "1", "2"], [1.0, 0.0, 0.0]),
+    ],
+)
+async def test_retrieve_distance_method(distance_method: str, results: list[str], scores: list[float]) -> None:
+    vectors = [[2.0, 0.0], [0.0, 2.0], [0.0, 0.0]]
+    entries = [VectorStoreEntry(id=uuid4(), text=str(i)) for i in range(3)]
+    store = InMemoryVectorStore(
+        embedder=NoopEmbedder(return_values=[vectors, [[1.0, 0.0]]]),
+        distance_method=distance_method,  # type: ignore[arg-type]
+    )
+    await store.store(entries)
+
+    query_results = await store.retrieve("query", options=VectorStoreOptions(k=3))
+
+    assert [result.entry.text for result in query_results] == results
+    assert [result.score for result in query_results] == pytest.approx(scores)
+
+
+@pytest.mark.parametrize("distance_method", ["l2", "ip", "cosine"])
+async def test_retrieve_many_matches_retrieve(distance_method: str) -> None:
+    vectors = [[2.0, 0.0], [0.0, 2.0], [1.0, 1.0], [3.0, 1.0]]
+    queries = [[1.0, 0.0], [0.0, 1.0], [0.0, 0.0]]
+    entries = [VectorStoreEntry(id=uuid4(), text=str(i), metadata={"i": i % 2}) for i in range(4)]
+    store = InMemoryVectorStore(
+        embedder=NoopEmbedder(return_values=[vectors, queries, *([query] for query in queries)]),
+        distance_method=distance_method,  # type: ignore[arg-type]
+    )
+    await store.store(entries)
+    options = VectorStoreOptions(k=2, where={"i": 0})
+
+    many_results = await store.retrieve_many(["q0", "q1", "q2"], options=options)
+    single_results = [await store.retrieve(f"q{i}", options=options) for i in range(3)]
+
+    assert many_results == single_results
+    assert await store.retrieve_many([]) == []
+
+
+async def test_retrieve_many_sparse() -> None:
+    entries = [VectorStoreEntry(id=uuid4(), text=text) for text in ["a b", "b c", "d"]]
+    store = InMemoryVectorStore(embedder=WordCountEmbedder())
+    await store.store(entries)
+
+    results = await store.retrieve_many(["a", "c d"], options=VectorStoreOptions(k=10))
+
+    assert [[result.entry.text for result in query_results] for query_results in results] == [
+        ["a b"],
+        ["b c", "d"],
+    ]
+
+
+async def test_retrieve_sparse_scores_only_matching_entries() -> None:
+    texts = ["a b", "b b c", "d", "a a a"]
+    entries = [VectorStoreEntry(id=uuid4(), text=text, metadata={"i": i}) for i, text in enumerate(texts)]
+    store = InMemoryVectorStore(embedder=WordCountEmbedder())
+    await store.store(entries)
+
+    results = await store.retrieve("a b", options=VectorStoreOptions(k=10))
+    filtered = await store.retrieve("a b", options=VectorStoreOptions(k=10, where={"i": 1}))
+    await store.remove([entries[3].id])
+    after_remove = await store.retrieve("a b", options=VectorStoreOptions(k=10))
+
+    assert [(result.entry.text, result.score) for result in results] == [("a a a", 3.0), ("a b", 2.0), ("b b c", 2.0)]
+    assert results[0].vector == SparseVector(indices=[0], values=[3.0])
+    assert [result.entry.text for result in filtered] == ["b b c"]
+    assert [result.entry.text for result in after_remove] == ["a b", "b b c"]
+
+
+async def test_retrieve_sparse_bm25() -> None:
+    texts = ["a b", "a a a a a a c", "c"]
+    entries = [VectorStoreEntry(id=uuid4(), text=text) for text in texts]
+    store = InMemoryVectorStore(embedder=WordCountEmbedder(), sparse_weighting="bm25")
+    await store.store(entries)
+
+    results = await store.retrieve("a b", options=VectorStoreOptions(k=10))
+
+    assert [result.entry.text for result in results] == ["a b", "a a a a a a c"]
+    assert all(result.score > 0 for result in results)
+
+
+async def test_where_nested_metadata() -> None:
+    tenants = ["a", "b", "a", None]
+    entries = [
+        VectorStoreEntry(id=uuid4(), text=str(i), metadata={"tenant": {"id": tenant}} if tenant else {})
+        for i, tenant in enumerate(tenants)
+    ]
+    store = InMemoryVectorStore(
+        embedder=NoopEmbedder(return_values=[[[float(i), 0.0] for i in range(4)], [[0.0, 0.0]]]),
+        metadata_index_paths=["tenant.id"],
+    )
+    await store.store(entries)
+
+    nested = await store.list(where={"tenant": {"id": "a"}})
+    dotted = await store.retrieve("query", options=VectorStoreOptions(k=10, where={"tenant.id": "a"}))
+
+    assert [entry.text for entry in nested] == ["0", "2"]
+    assert [result.entry.text for result in dotted] == ["0", "2"]
+    assert [entry.text for entry in await store.list(where={"tenant.id": None})] == ["3"]
+
+
+async def test_where_index_follows_overwrite_and_remove() -> None:
+    entries = [VectorStoreEntry(id=uuid4(), text=str(i), metadata={"tenant": "a"}) for i in range(3)]
+    store = InMemoryVectorStore(embedder=NoopEmbedder())
+    await store.store(entries)
+    assert len(await store.list(where={"tenant": "a"})) == 3
+
+    await store.store([entries[0].model_copy(update={"metadata": {"tenant": "b"}})])
+    await store.remove([entries[1].id])
+
+    assert [entry.text for entry in await store.list(where={"tenant": "a"})] == ["2"]
+    assert [entry.text for entry in await store.list(where={"tenant": "b"})] == ["0"]
+
+
+async def test_where_indexes_of_all_paths_follow_overwrite_and_remove() -> None:
+    entries = [VectorStoreEntry(id=uuid4(), text=str(i), metadata={"tenant": "a", "lang": "en"}) for i in range(3)]
+    store = InMemoryVectorStore(embedder=NoopEmbedder(), metadata_index_paths=["tenant", "lang"])
+    await store.store(entries)
+
+    await store.remove([entries[1].id])
+    await store.store([entries[0].model_copy(update={"metadata": {"tenant": "a", "lang": "pl"}})])
+
+    assert [entry.text for entry in await store.list(where={"lang": "en"})] == ["2"]
+    assert [entry.text for entry in await store.list(where={"lang": "pl"})] == ["0"]
+    assert [entry.text for entry in await store.list(where={"tenant": "a"})] == ["0", "2"]
+
+
+async def test_remove_where() -> None:
+    tenants = ["a", "b", "a"]
+    entries = [
+        VectorStoreEntry(id=uuid4(), text=str(i), metadata={"tenant": {"id": tenant}})
+        for i, tenant in enumerate(tenants)
+    ]
+    store = InMemoryVectorStore(embedder=NoopEmbedder())
+    await store.store(entries)
+
+    await store.remove_where({"tenant": {"id": "a"}})
+
+    assert [entry.text for entry in await store.list()] == ["1"]
+    assert await store.list(where={"tenant": {"id": "a"}}) == []
+
+
+async def test_change_listeners_awaited_on_store_and_remove() -> None:
+    listener = AsyncMock()
+    store = InMemoryVectorStore(embedder=NoopEmbedder())
+    store.add_change_listener(listener)
+    entry = VectorStoreEntry(id=uuid4(), text="0")
+
+    await store.store([entry])
+    await store.remove([entry.id])
+
+    assert listener.await_count == 2
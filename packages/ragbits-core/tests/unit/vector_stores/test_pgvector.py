@@ -1,4 +1,5 @@
 import json
+import struct
 from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID
@@ -6,6 +7,7 @@ from uuid import UUID
 import asyncpg
 import pytest
 
+from ragbits.core.embeddings import SparseVector
 from ragbits.core.embeddings.dense import NoopEmbedder
 from ragbits.core.vector_stores import WhereQuery
 from ragbits.core.vector_stores.base import VectorStoreEntry, VectorStoreOptions, VectorStoreResult
@@ -38,6 +40,7 @@ def mock_db_pool() -> tuple[MagicMock, AsyncMock]:
     """Fixture to mock the asyncpg connection pool."""
     mock_pool = MagicMock()
     mock_conn = AsyncMock()
+    mock_conn.transaction = MagicMock()
     mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
     return mock_pool, mock_conn
 
@@ -116,6 +119,24 @@ def test_create_retrieve_query_with_options_for_ip_distance(mock_pgvector_store:
     assert values == expected_values
 
 
+def test_create_retrieve_many_query(mock_pgvector_store: PgVectorStore) -> None:
+    result, values = mock_pgvector_store._create_retrieve_many_query(
+        [VECTOR_EXAMPLE, [0.4, 0.5, 0.6]],
+        "vector",
+        VectorStoreOptions(score_threshold=0.1, k=10, where={"key1": "value1"}),
+    )
+    expected_query = (
+        "SELECT q.query_index, r.* FROM unnest($1::text[]) WITH ORDINALITY AS q(vector, query_index)"  # noqa: S608
+        " CROSS JOIN LATERAL (SELECT t.*, t.vector <=> q.vector::vector as distance,"
+        f" 1 - (t.vector <=> q.vector::vector) as score FROM {TEST_TABLE_NAME} t"
+        " WHERE t.metadata @> $2 ORDER BY distance LIMIT $3) r"
+        " WHERE r.score >= $4 ORDER BY q.query_index, r.distance;"
+    )
+    expected_values = [["[0.1, 0.2, 0.3]", "[0.4, 0.5, 0.6]"], '{"key1": "value1"}', 10, 0.1]
+    assert result == expected_query
+    assert values == expected_values
+
+
 def test_create_list_query(mock_pgvector_store: PgVectorStore) -> None:
     where = cast(WhereQuery, {"id": "test_id", "document.title": "test title"})
     result, values = mock_pgvector_store._create_list_query(where, limit=5, offset=2)
@@ -152,9 +173,45 @@ async def test_store(mock_pgvector_store: PgVectorStore, mock_db_pool: tuple[Mag
     _, mock_conn = mock_db_pool
     data = [VectorStoreEntry(id=UUID("64144806-e080-4f9c-b46d-682fe4871497"), text="test_text_1", metadata={})]
     await mock_pgvector_store.store(data)
-    mock_conn.execute.assert_called()
-    calls = mock_conn.execute.mock_calls
-    assert any("INSERT INTO" in str(call) for call in calls)
+    mock_conn.execute.assert_called_once()
+    assert "DELETE FROM" in mock_conn.execute.call_args.args[0]
+    mock_conn.copy_to_table.assert_called_once()
+    assert mock_conn.copy_to_table.call_args.kwargs["format"] == "binary"
+    vector = struct.pack(">HHff", 2, 0, 0.1, 0.1)
+    assert mock_conn.copy_to_table.call_args.kwargs["source"] == (
+        b"PGCOPY\n\xff\r\n\x00"
+        + struct.pack(">ii", 0, 0)
+        + struct.pack(">hi", 5, 16)
+        + data[0].id.bytes
+        + struct.pack(">i", 11)
+        + b"test_text_1"
+        + struct.pack(">ii", -1, len(vector))
+        + vector
+        + struct.pack(">i", 3)
+        + b"\x01{}"
+        + struct.pack(">h", -1)
+    )
+    mock_conn.set_type_codec.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_store_checks_table_once(
+    mock_pgvector_store: PgVectorStore, mock_db_pool: tuple[MagicMock, AsyncMock]
+) -> None:
+    data = [VectorStoreEntry(id=UUID("64144806-e080-4f9c-b46d-682fe4871497"), text="test_text_1", metadata={})]
+
+    with patch.object(mock_pgvector_store, "_check_table_exists", new=AsyncMock(return_value=True)) as mock_check:
+        await mock_pgvector_store.store(data)
+        await mock_pgvector_store.store(data)
+        mock_check.assert_called_once()
+
+
+def test_vector_to_binary_sparse() -> None:
+    vector = SparseVector(indices=[3, 1], values=[0.5, 2.0])
+
+    result = PgVectorStore._vector_to_binary(vector, "sparsevec", 10)
+
+    assert result == struct.pack(">iiiiiff", 10, 2, 0, 0, 2, 2.0, 0.5)
 
 
 @pytest.mark.asyncio
@@ -210,6 +267,18 @@ async def test_remove_no_table(mock_pgvector_store: PgVectorStore, mock_db_pool:
         mock_print.assert_called_once_with(f"Table {TEST_TABLE_NAME} does not exist.")
 
 
+@pytest.mark.asyncio
+async def test_remove_where(mock_pgvector_store: PgVectorStore, mock_db_pool: tuple[MagicMock, AsyncMock]) -> None:
+    _, mock_conn = mock_db_pool
+    where = {"document_meta": {"source": {"id": "local_file:/test/path"}}}
+    await mock_pgvector_store.remove_where(where)
+    mock_conn.execute.assert_called_once()
+    query, params = mock_conn.execute.call_args.args
+    assert "DELETE FROM" in query
+    assert "metadata @> $1" in query
+    assert params == json.dumps(where)
+
+
 @pytest.mark.asyncio
 async def test_retrieve_no_table(mock_pgvector_store: PgVectorStore, mock_db_pool: tuple[MagicMock, AsyncMock]) -> None:
     _, mock_conn = mock_db_pool
@@ -243,6 +312,24 @@ async def test_retrieve(mock_pgvector_store: PgVectorStore, mock_db_pool: tuple[
         assert results[1].entry.id == UUID("9c7d6b27-4ef1-537c-ad7c-676edb8bc8a8")
 
 
+@pytest.mark.asyncio
+async def test_retrieve_many(mock_pgvector_store: PgVectorStore, mock_db_pool: tuple[MagicMock, AsyncMock]) -> None:
+    _, mock_conn = mock_db_pool
+    mock_conn.fetch = AsyncMock(
+        return_value=[{**DATA_JSON_EXAMPLE[0], "query_index": 1}, {**DATA_JSON_EXAMPLE[1], "query_index": 3}]
+    )
+
+    results = await mock_pgvector_store.retrieve_many(["text_1", "text_2", "text_3"])
+
+    mock_conn.fetch.assert_called_once()
+    assert len(mock_conn.fetch.call_args.args[1]) == 3
+    assert [[result.entry.text for result in query_results] for query_results in results] == [
+        ["test_text_1"],
+        [],
+        ["test_text_2"],
+    ]
+
+
 @pytest.mark.asyncio
 async def test_list_no_table(mock_pgvector_store: PgVectorStore, mock_db_pool: tuple[MagicMock, AsyncMock]) -> None:
     _, mock_conn = mock_db_pool
@@ -165,6 +165,34 @@ async def test_retrieve(mock_qdrant_store: QdrantVectorStore) -> None:
         assert query_result.score == result["score"]
 
 
+async def test_retrieve_many(mock_qdrant_euclid_store: QdrantVectorStore) -> None:
+    mock_qdrant_euclid_store._embedder = NoopEmbedder(return_values=[[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]])
+    mock_qdrant_euclid_store._client.query_batch_points.return_value = [  # type: ignore
+        models.QueryResponse(
+            points=[
+                models.ScoredPoint(
+                    version=1,
+                    id="1f908deb-bc9f-4b5a-8b73-2e72d8b44dc5",
+                    vector=[0.12, 0.25, 0.29],
+                    score=0.9,
+                    payload={"id": "1f908deb-bc9f-4b5a-8b73-2e72d8b44dc5", "text": "test_key 1", "metadata": {}},
+                )
+            ]
+        ),
+        models.QueryResponse(points=[]),
+    ]
+
+    query_results = await mock_qdrant_euclid_store.retrieve_many(
+        ["query 1", "query 2"], options=VectorStoreOptions(k=3, score_threshold=-1.0)
+    )
+
+    requests = mock_qdrant_euclid_store._client.query_batch_points.call_args.kwargs["requests"]  # type: ignore
+    assert [request.query for request in requests] == [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+    assert all(request.limit == 3 and request.score_threshold == 1.0 for request in requests)
+    assert [[result.entry.text for result in results] for results in query_results] == [["test_key 1"], []]
+    assert query_results[0][0].score == -0.9
+
+
 async def test_retrieve_euclid(mock_qdrant_euclid_store: QdrantVectorStore) -> None:
     mock_qdrant_euclid_store._client.query_points.return_value = models.QueryResponse(  # type: ignore
         points=[
@@ -240,6 +268,26 @@ async def test_remove(mock_qdrant_store: QdrantVectorStore) -> None:
     )
 
 
+async def test_remove_where(mock_qdrant_store: QdrantVectorStore) -> None:
+    mock_qdrant_store._client.collection_exists.return_value = True  # type: ignore
+
+    await mock_qdrant_store.remove_where({"document_meta": {"source": {"id": "local_file:/test/path"}}})
+
+    mock_qdrant_store._client.delete.assert_called_once_with(  # type: ignore
+        collection_name="test_collection",
+        points_selector=models.FilterSelector(
+            filter=models.Filter(
+                must=[
+                    models.FieldCondition(
+                        key="metadata.document_meta.source.id",
+                        match=models.MatchValue(value="local_file:/test/path"),
+                    )
+                ]
+            )
+        ),
+    )
+
+
 async def test_list(mock_qdrant_store: QdrantVectorStore) -> None:
     mock_qdrant_store._client.collection_exists.return_value = True  # type: ignore
     mock_qdrant_store._client.count.return_value = models.CountResult(count=2)  # type: ignore
@@ -1,4 +1,5 @@
-from collections.abc import Iterable, Sequence
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Sequence
 from pathlib import Path
 from types import ModuleType
 from typing import ClassVar, Generic
@@ -14,22 +15,29 @@ from ragbits.core.sources.base import Source, SourceResolver
 from ragbits.core.types import NOT_GIVEN, NotGiven
 from ragbits.core.utils._pyproject import get_config_from_yaml
 from ragbits.core.utils.config_handling import ConfigurableComponent, NoPreferredConfigError, ObjectConstructionConfig
+from ragbits.core.utils.helpers import abatched
 from ragbits.core.vector_stores.base import VectorStore, VectorStoreOptionsT
 from ragbits.document_search.documents.document import Document, DocumentMeta
 from ragbits.document_search.documents.element import Element
 from ragbits.document_search.ingestion.enrichers.router import ElementEnricherRouter
+from ragbits.document_search.ingestion.manifest import IngestManifest, document_fingerprint, ingest_config_fingerprint
 from ragbits.document_search.ingestion.parsers.router import DocumentParserRouter
 from ragbits.document_search.ingestion.strategies.base import (
+    IngestDocumentResult,
     IngestExecutionError,
     IngestExecutionResult,
     IngestStrategy,
 )
 from ragbits.document_search.ingestion.strategies.sequential import SequentialIngestStrategy
+from ragbits.document_search.retrieval.cache import SearchResultCache
 from ragbits.document_search.retrieval.rephrasers.base import QueryRephraser, QueryRephraserOptionsT
 from ragbits.document_search.retrieval.rephrasers.noop import NoopQueryRephraser
 from ragbits.document_search.retrieval.rerankers.base import Reranker, RerankerOptionsT
 from ragbits.document_search.retrieval.rerankers.noop import NoopReranker
 
+# The number of documents looked up in the ingest manifest at once.
+_MANIFEST_BATCH_SIZE = 100
+
 
 class DocumentSearchOptions(Options, Generic[QueryRephraserOptionsT, VectorStoreOptionsT, RerankerOptionsT]):
     """
@@ -95,6 +103,8 @@ class DocumentSearch(
         ingest_strategy: IngestStrategy | None = None,
         parser_router: DocumentParserRouter | None = None,
         enricher_router: ElementEnricherRouter | None = None,
+        cache: SearchResultCache | None = None,
+        manifest: IngestManifest | None = None,
     ) -> None:
         """
         Initialize the DocumentSearch instance.
@@ -107,6 +117,10 @@ class DocumentSearch(
             ingest_strategy: The ingestion strategy to use for ingestion.
             parser_router: The document parser router to use for ingestion.
             enricher_router: The element enricher router to use for ingestion.
+            cache: The cache of search results, invalidated whenever the vector store changes. Disabled by default.
+            manifest: The manifest of the ingested documents fingerprints. If set, ingest is incremental and skips
+                the documents unchanged since their last ingest with the same parsers, enrichers and embedders.
+                Disabled by default.
         """
         super().__init__(default_options=default_options)
         self.vector_store = vector_store
@@ -115,6 +129,10 @@ class DocumentSearch(
         self.ingest_strategy = ingest_strategy or SequentialIngestStrategy()
         self.parser_router = parser_router or DocumentParserRouter()
         self.enricher_router = enricher_router or ElementEnricherRouter()
+        self.manifest = manifest
+        self.cache = cache
+        if self.cache is not None:
+            self.vector_store.add_change_listener(self.cache.invalidate)
 
     @classmethod
     def from_config(cls, config: dict) -> Self:
@@ -219,26 +237,32 @@ class DocumentSearch(
         reranker_options = merged_options.reranker_options or None
 
         with trace(query=query, options=merged_options) as outputs:
-            queries = await self.query_rephraser.rephrase(query, query_rephraser_options)
+            if self.cache is not None:
+                cache_key = self.cache.key(query, merged_options)
+                cache_generation = self.cache.generation
+                if (cached_results := await self.cache.get(cache_key)) is not None:
+                    outputs.results = cached_results
+                    return outputs.results
+
+            queries = list(await self.query_rephraser.rephrase(query, query_rephraser_options))
             elements = [
-                [
-                    Element.from_vector_db_entry(result.entry, result.score)
-                    for result in await self.vector_store.retrieve(query, vector_store_options)
-                ]
-                for query in queries
+                [Element.from_vector_db_entry(result.entry, result.score) for result in results]
+                for results in await self.vector_store.retrieve_many(queries, vector_store_options)
             ]
             outputs.results = await self.reranker.rerank(
                 elements=elements,
                 query=query,
                 options=reranker_options,
             )
+            if self.cache is not None:
+                await self.cache.set(cache_key, outputs.results, generation=cache_generation)
 
         return outputs.results
 
     @traceable
     async def ingest(
         self,
-        documents: str | Iterable[DocumentMeta | Document | Source],
+        documents: str | Iterable[DocumentMeta | Document | Source] | AsyncIterable[DocumentMeta | Document | Source],
         fail_on_error: bool = True,
     ) -> IngestExecutionResult:
         """
@@ -250,6 +274,10 @@ class DocumentSearch(
                        - "file:///path/to/files/*.txt"
                        - "gcs://bucket/folder/*"
                        - "huggingface://dataset/split/row"
+                       The sources matching a URI, and asynchronous iterables such as `Source.iter_sources`,
+                       are consumed lazily by the strategies accepting asynchronous documents, so that
+                       the ingestion starts before the listing is complete, and the errors of the listing are
+                       raised during the ingestion. Other strategies get the documents collected in a list.
             fail_on_error: If True, raises IngestExecutionError when any errors are encountered during ingestion.
                            If False, returns all errors encountered in the IngestExecutionResult.
 
@@ -259,15 +287,89 @@ class DocumentSearch(
         Raises:
             IngestExecutionError: If fail_on_error is True and any errors are encountered during ingestion.
         """
-        resolved_documents = await SourceResolver.resolve(documents) if isinstance(documents, str) else documents
+        resolved_documents = SourceResolver.iter_resolve(documents) if isinstance(documents, str) else documents
+
+        fingerprints: dict[str, str] = {}
+        skipped: list[IngestDocumentResult] = []
+        if self.manifest is not None:
+            resolved_documents = self._skip_unchanged_documents(
+                resolved_documents, self.manifest, fingerprints, skipped
+            )
+
+        if isinstance(resolved_documents, AsyncIterable) and not self.ingest_strategy.accepts_async_documents:
+            resolved_documents = [document async for document in resolved_documents]
+
         results = await self.ingest_strategy(
             documents=resolved_documents,
             vector_store=self.vector_store,
             parser_router=self.parser_router,
             enricher_router=self.enricher_router,
         )
+        results.skipped.extend(skipped)
+
+        if self.manifest is not None:
+            await self.manifest.set(
+                {
+                    result.document_uri: fingerprints[result.document_uri]
+                    for result in results.successful
+                    if result.document_uri in fingerprints
+                }
+            )
+
+        # Ingestion strategies running in other processes change the index without notifying this vector store.
+        if self.cache is not None:
+            await self.cache.invalidate()
 
         if fail_on_error and results.failed:
             raise IngestExecutionError(results.failed)
 
         return results
+
+    async def _skip_unchanged_documents(
+        self,
+        documents: Iterable[DocumentMeta | Document | Source] | AsyncIterable[DocumentMeta | Document | Source],
+        manifest: IngestManifest,
+        fingerprints: dict[str, str],
+        skipped: list[IngestDocumentResult],
+    ) -> AsyncIterator[DocumentMeta | Document | Source]:
+        """
+        Filter out the documents unchanged since their last ingest, according to the manifest.
+        The documents are checked in batches, as they are consumed.
+
+        Args:
+            documents: The documents to ingest.
+            manifest: The manifest of the ingested documents fingerprints.
+            fingerprints: The fingerprints of the documents to record once ingested, filled in while filtering.
+            skipped: The results of the skipped documents, filled in while filtering.
+
+        Yields:
+            The documents to ingest.
+        """
+        config_fingerprint = ingest_config_fingerprint(self.parser_router, self.enricher_router, self.vector_store)
+        async for batch in abatched(documents, _MANIFEST_BATCH_SIZE):
+            document_ids = [
+                document.metadata.id if isinstance(document, Document) else document.id for document in batch
+            ]
+            content_fingerprints = await asyncio.gather(
+                *[document_fingerprint(document) for document in batch],
+                return_exceptions=True,
+            )
+            ingested_fingerprints = await manifest.get(document_ids)
+
+            for document, document_id, content_fingerprint in zip(
+                batch, document_ids, content_fingerprints, strict=True
+            ):
+                if isinstance(content_fingerprint, BaseException) and not isinstance(content_fingerprint, Exception):
+                    raise content_fingerprint
+                # Documents that can't be fingerprinted are ingested, so that the strategy reports their errors,
+                # and the documents of sources without fingerprints are considered changed.
+                if content_fingerprint is None or isinstance(content_fingerprint, Exception):
+                    yield document
+                    continue
+
+                fingerprint = f"{config_fingerprint}:{content_fingerprint}"
+                if ingested_fingerprints.get(document_id) == fingerprint:
+                    skipped.append(IngestDocumentResult(document_uri=document_id))
+                else:
+                    fingerprints[document_id] = fingerprint
+                    yield document
@@ -1,12 +1,29 @@
+import asyncio
+import hashlib
+import io
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import suppress
+from pathlib import Path
+
 from pydantic import BaseModel
 
 from ragbits.core.llms.base import LLM, LLMType
 from ragbits.core.llms.factory import get_preferred_llm
 from ragbits.core.prompt import Attachment, Prompt
 from ragbits.core.utils.config_handling import ObjectConstructionConfig, import_by_path
+from ragbits.core.utils.decorators import requires_dependencies
 from ragbits.document_search.documents.element import ImageElement
 from ragbits.document_search.ingestion.enrichers.base import ElementEnricher
 
+with suppress(ImportError):
+    from PIL import Image
+
+# SQLite limits the number of host parameters in a single statement.
+_SQLITE_BATCH_SIZE = 500
+
 
 class ImageDescriberInput(BaseModel):
     """
@@ -41,6 +58,10 @@ class ImageElementEnricher(ElementEnricher[ImageElement]):
         self,
         llm: LLM | None = None,
         prompt: type[Prompt[ImageDescriberInput, ImageDescriberOutput]] | None = None,
+        max_concurrency: int = 8,
+        max_image_size: int | None = None,
+        max_cached_descriptions: int = 1024,
+        cache_path: str | Path | None = None,
     ) -> None:
         """
         Initialize the ImageElementEnricher instance.
@@ -48,14 +69,43 @@ class ImageElementEnricher(ElementEnricher[ImageElement]):
         Args:
             llm: The language model to use for describing images.
             prompt: The prompt class to use.
+            max_concurrency: The maximum number of images described by the LLM at once.
+            max_image_size: The maximum width and height of the images sent to the LLM, in pixels. Larger images
+                are downscaled and re-encoded before upload, to reduce the vision tokens and the transfer time.
+                If None, the images are sent as they are.
+            max_cached_descriptions: The maximum number of descriptions kept in the in-process LRU cache, so that
+                identical images, such as logos or repeated headers, are described once by the enricher.
+            cache_path: The path of the SQLite database persisting the descriptions, so that identical images
+                are described once across ingest runs and processes. If not provided, descriptions are cached
+                in memory only.
         """
         self._llm = llm or get_preferred_llm(llm_type=LLMType.VISION)
         self._prompt = prompt or ImageDescriberPrompt
+        self.max_concurrency = max_concurrency
+        self.max_image_size = max_image_size
+        self.max_cached_descriptions = max_cached_descriptions
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._descriptions: OrderedDict[str, str] = OrderedDict()
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     async def enrich(self, elements: list[ImageElement]) -> list[ImageElement]:
         """
         Enrich image elements with additional description of the image.
 
+        Identical images are described once, and the images not described before are sent to the LLM concurrently,
+        with up to `max_concurrency` prompts in flight.
+
         Args:
             elements: The elements to be enriched.
 
@@ -66,23 +116,169 @@ class ImageElementEnricher(ElementEnricher[ImageElement]):
             EnricherElementNotSupportedError: If the element type is not supported.
             LLMError: If LLM generation fails.
         """
-        responses: list[ImageDescriberOutput] = []
+        images: dict[str, bytes] = {}
         for element in elements:
             self.validate_element_type(type(element))
-            image = Attachment(data=element.image_bytes)
-            prompt = self._prompt(ImageDescriberInput(image=image))
-            responses.append(await self._llm.generate(prompt))
+            images.setdefault(self._get_cache_key(element.get_id_components()["image_hash"]), element.image_bytes)
+
+        descriptions = await self._get_cached_descriptions(list(images))
+        new_descriptions: dict[str, str] = {}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def describe(key: str) -> None:
+            async with semaphore:
+                image = Attachment(data=await self._prepare_image(images[key]))
+                response: ImageDescriberOutput = await self._llm.generate(
+                    self._prompt(ImageDescriberInput(image=image))
+                )
+            new_descriptions[key] = response.description
+
+        await asyncio.gather(*(describe(key) for key in images if key not in descriptions))
+        await self._cache_descriptions(new_descriptions)
+        descriptions.update(new_descriptions)
 
         return [
             ImageElement(
                 document_meta=element.document_meta,
-                description=response.description,
+                description=descriptions[self._get_cache_key(element.get_id_components()["image_hash"])],
                 image_bytes=element.image_bytes,
                 ocr_extracted_text=element.ocr_extracted_text,
             )
-            for element, response in zip(elements, responses, strict=True)
+            for element in elements
         ]
 
+    def _get_cache_key(self, image_hash: str) -> str:
+        """
+        Get the cache key of the description of the image, changing with the model, the prompt
+        and the maximum image size.
+
+        Args:
+            image_hash: The hash of the image.
+
+        Returns:
+            The cache key.
+        """
+        parts = [
+            f"{type(self._llm).__module__}.{type(self._llm).__qualname__}",
+            getattr(self._llm, "model_name", None),
+            f"{self._prompt.__module__}.{self._prompt.__qualname__}",
+            self.max_image_size,
+            image_hash,
+        ]
+        return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+    async def _get_cached_descriptions(self, keys: list[str]) -> dict[str, str]:
+        """
+        Get the cached descriptions of the images, from memory or from disk.
+
+        Args:
+            keys: The cache keys of the images.
+
+        Returns:
+            The cached descriptions by the cache keys.
+        """
+        found = {}
+        for key in keys:
+            if (description := self._descriptions.get(key)) is not None:
+                self._descriptions.move_to_end(key)
+                found[key] = description
+
+        missing = [key for key in keys if key not in found]
+        if missing and self.cache_path:
+            stored = await asyncio.to_thread(self._get_from_disk, missing)
+            self._put_in_memory(stored)
+            found.update(stored)
+        return found
+
+    async def _cache_descriptions(self, descriptions: dict[str, str]) -> None:
+        """
+        Cache the descriptions of the images in memory and on disk.
+
+        Args:
+            descriptions: The descriptions by the cache keys.
+        """
+        if self.cache_path and descriptions:
+            await asyncio.to_thread(self._put_on_disk, descriptions)
+        self._put_in_memory(descriptions)
+
+    def _put_in_memory(self, descriptions: dict[str, str]) -> None:
+        if self.max_cached_descriptions <= 0:
+            return
+        for key, description in descriptions.items():
+            self._descriptions[key] = description
+            self._descriptions.move_to_end(key)
+        while len(self._descriptions) > self.max_cached_descriptions:
+            self._descriptions.popitem(last=False)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)  # type: ignore[union-attr]
+            self._connection = sqlite3.connect(self.cache_path, check_same_thread=False)  # type: ignore[arg-type]
+            self._connection.execute("CREATE TABLE IF NOT EXISTS descriptions (key TEXT PRIMARY KEY, description TEXT)")
+        return self._connection
+
+    def _get_from_disk(self, keys: list[str]) -> dict[str, str]:
+        found = {}
+        with self._lock:
+            connection = self._get_connection()
+            for i in range(0, len(keys), _SQLITE_BATCH_SIZE):
+                batch = keys[i : i + _SQLITE_BATCH_SIZE]
+                rows = connection.execute(
+                    f"SELECT key, description FROM descriptions WHERE key IN ({', '.join('?' * len(batch))})",  # noqa: S608
+                    batch,
+                )
+                found.update(dict(rows))
+        return found
+
+    def _put_on_disk(self, descriptions: dict[str, str]) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO descriptions (key, description) VALUES (?, ?)",
+                    list(descriptions.items()),
+                )
+
+    async def _prepare_image(self, image_bytes: bytes) -> bytes:
+        """
+        Downscale the image to the maximum image size, if it is set and the image is larger.
+
+        Args:
+            image_bytes: The image to prepare.
+
+        Returns:
+            The image to send to the LLM.
+        """
+        if self.max_image_size is None:
+            return image_bytes
+        return await asyncio.to_thread(self._downscale_image, image_bytes, self.max_image_size)
+
+    @staticmethod
+    @requires_dependencies(["PIL"])
+    def _downscale_image(image_bytes: bytes, max_size: int) -> bytes:
+        """
+        Downscale the image to fit the maximum size and re-encode it, as PNG if it has transparency
+        or as JPEG otherwise.
+
+        Args:
+            image_bytes: The image to downscale.
+            max_size: The maximum width and height of the image, in pixels.
+
+        Returns:
+            The downscaled image, or the original one if it already fits the maximum size.
+        """
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            if max(image.size) <= max_size:
+                return image_bytes
+
+            image.thumbnail((max_size, max_size))
+            output = io.BytesIO()
+            if image.mode in {"RGBA", "LA", "P"}:
+                image.save(output, format="PNG", optimize=True)
+            else:
+                image.convert("RGB").save(output, format="JPEG", quality=85)
+            return output.getvalue()
+
     @classmethod
     def from_config(cls, config: dict) -> "ImageElementEnricher":
         """
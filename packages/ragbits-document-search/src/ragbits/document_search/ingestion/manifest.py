@@ -0,0 +1,294 @@
+import asyncio
+import hashlib
+import inspect
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from enum import Enum
+from pathlib import Path, PurePath
+from typing import Any
+
+from pydantic import BaseModel
+
+from ragbits.core.sources.base import Source
+from ragbits.core.utils.config_handling import WithConstructionConfig
+from ragbits.core.vector_stores.base import VectorStore
+from ragbits.document_search.documents.document import Document, DocumentMeta
+from ragbits.document_search.ingestion.enrichers.router import ElementEnricherRouter
+from ragbits.document_search.ingestion.parsers.router import DocumentParserRouter
+
+# The maximum depth of the components described by the ingest config fingerprint.
+_MAX_DESCRIBE_DEPTH = 8
+
+# The constructor parameters left out of the ingest config fingerprint, so that rotating credentials
+# doesn't ingest all the documents again.
+_CREDENTIAL_PARAMETERS = frozenset({"api_key", "credentials", "password", "token"})
+
+# The number of bytes read at once when hashing the document content.
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# The maximum number of document ids looked up in the SQLite manifest at once.
+_SQLITE_BATCH_SIZE = 500
+
+
+class IngestManifest(ABC):
+    """
+    Storage of the fingerprints of the ingested documents, used to skip the documents unchanged since their last ingest.
+    """
+
+    @abstractmethod
+    async def get(self, document_ids: Sequence[str]) -> dict[str, str]:
+        """
+        Get the fingerprints of the documents.
+
+        Args:
+            document_ids: The ids of the documents.
+
+        Returns:
+            The fingerprints of the ingested documents, by their ids. Documents never ingested are missing.
+        """
+
+    @abstractmethod
+    async def set(self, fingerprints: Mapping[str, str]) -> None:
+        """
+        Record the fingerprints of the ingested documents.
+
+        Args:
+            fingerprints: The fingerprints of the documents, by their ids.
+        """
+
+
+class InMemoryIngestManifest(IngestManifest):
+    """
+    Ingest manifest kept in memory, suitable for in-memory vector stores.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructs a new InMemoryIngestManifest instance.
+        """
+        self._fingerprints: dict[str, str] = {}
+
+    async def get(self, document_ids: Sequence[str]) -> dict[str, str]:
+        """
+        Get the fingerprints of the documents.
+
+        Args:
+            document_ids: The ids of the documents.
+
+        Returns:
+            The fingerprints of the ingested documents, by their ids. Documents never ingested are missing.
+        """
+        return {
+            document_id: self._fingerprints[document_id]
+            for document_id in document_ids
+            if document_id in self._fingerprints
+        }
+
+    async def set(self, fingerprints: Mapping[str, str]) -> None:
+        """
+        Record the fingerprints of the ingested documents.
+
+        Args:
+            fingerprints: The fingerprints of the documents, by their ids.
+        """
+        self._fingerprints.update(fingerprints)
+
+
+class SQLiteIngestManifest(IngestManifest):
+    """
+    Ingest manifest stored in a local SQLite database, kept alongside the persisted vector store.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Constructs a new SQLiteIngestManifest instance.
+
+        Args:
+            path: The path of the SQLite database.
+        """
+        self.path = Path(path)
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    async def get(self, document_ids: Sequence[str]) -> dict[str, str]:
+        """
+        Get the fingerprints of the documents.
+
+        Args:
+            document_ids: The ids of the documents.
+
+        Returns:
+            The fingerprints of the ingested documents, by their ids. Documents never ingested are missing.
+        """
+        return await asyncio.to_thread(self._get, document_ids)
+
+    async def set(self, fingerprints: Mapping[str, str]) -> None:
+        """
+        Record the fingerprints of the ingested documents.
+
+        Args:
+            fingerprints: The fingerprints of the documents, by their ids.
+        """
+        await asyncio.to_thread(self._set, fingerprints)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS ingested_documents (document_id TEXT PRIMARY KEY, fingerprint TEXT)"
+            )
+        return self._connection
+
+    def _get(self, document_ids: Sequence[str]) -> dict[str, str]:
+        fingerprints: dict[str, str] = {}
+        with self._lock:
+            connection = self._get_connection()
+            for i in range(0, len(document_ids), _SQLITE_BATCH_SIZE):
+                batch = document_ids[i : i + _SQLITE_BATCH_SIZE]
+                rows = connection.execute(
+                    "SELECT document_id, fingerprint FROM ingested_documents "  # noqa: S608
+                    f"WHERE document_id IN ({', '.join('?' * len(batch))})",
+                    batch,
+                ).fetchall()
+                fingerprints.update(rows)
+        return fingerprints
+
+    def _set(self, fingerprints: Mapping[str, str]) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO ingested_documents (document_id, fingerprint) VALUES (?, ?)",
+                    fingerprints.items(),
+                )
+
+
+def ingest_config_fingerprint(
+    parser_router: DocumentParserRouter,
+    enricher_router: ElementEnricherRouter,
+    vector_store: VectorStore,
+) -> str:
+    """
+    Get the fingerprint of the ingest configuration, changing whenever the parsers, enrichers or embedders change,
+    so that documents ingested with a different configuration are ingested again.
+
+    Args:
+        parser_router: The document parser router.
+        enricher_router: The element enricher router.
+        vector_store: The vector store.
+
+    Returns:
+        The fingerprint of the ingest configuration.
+    """
+    vector_stores = getattr(vector_store, "vector_stores", [vector_store])
+    config = {
+        "parsers": _describe(parser_router._parsers),
+        "enrichers": _describe(enricher_router._enrichers),
+        "vector_stores": [
+            {"type": _describe(type(store)), "embedder": _describe(getattr(store, "_embedder", None))}
+            for store in vector_stores
+        ],
+    }
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+
+async def document_fingerprint(document: DocumentMeta | Document | Source) -> str | None:
+    """
+    Get the fingerprint of the document content. The content of fetched documents is hashed, otherwise
+    the fingerprint of the source is used. Sources are never fetched just to be fingerprinted.
+
+    Args:
+        document: The document.
+
+    Returns:
+        The fingerprint of the document content, or None if the source can't be fingerprinted without fetching it,
+        in which case the document is considered changed.
+    """
+    if isinstance(document, Document):
+        return await asyncio.to_thread(_hash_file, document.local_path)
+
+    source = document if isinstance(document, Source) else document.source
+    return await source.fingerprint()
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _describe(value: Any, depth: int = 0) -> Any:  # noqa: ANN401, PLR0911
+    """
+    Describe the value in a JSON-serializable way. Components are described with their type and the values
+    of their constructor parameters, leaving out credentials and the runtime state, such as clients or counters.
+    Other objects are described with their type only.
+
+    Args:
+        value: The value to describe.
+        depth: The depth of the value in the described component.
+
+    Returns:
+        The JSON-serializable description of the value.
+    """
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, PurePath):
+        return str(value)
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    if depth >= _MAX_DESCRIBE_DEPTH:
+        return _describe(type(value))
+    if isinstance(value, Mapping):
+        return {json.dumps(_describe(key, depth + 1)): _describe(item, depth + 1) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_describe(item, depth + 1) for item in value]
+    if isinstance(value, set | frozenset):
+        return sorted((_describe(item, depth + 1) for item in value), key=json.dumps)
+    if isinstance(value, BaseModel):
+        return {"type": _describe(type(value)), "fields": _describe(value.model_dump(), depth + 1)}
+    if isinstance(value, WithConstructionConfig):
+        return {
+            "type": _describe(type(value)),
+            "config": {name: _describe(item, depth + 1) for name, item in _get_declared_config(value).items()},
+        }
+    return _describe(type(value))
+
+
+def _get_declared_config(component: WithConstructionConfig) -> dict[str, Any]:
+    """
+    Get the values of the constructor parameters of the component, kept in its public or private attributes.
+
+    Args:
+        component: The component.
+
+    Returns:
+        The values of the parameters, by their names. Parameters not kept in the attributes are missing.
+    """
+    attributes = vars(component)
+    config = {}
+    for name, parameter in inspect.signature(type(component)).parameters.items():
+        if parameter.kind in {parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD} or name in _CREDENTIAL_PARAMETERS:
+            continue
+        for attribute in (name, f"_{name}"):
+            if attribute in attributes:
+                config[name] = attributes[attribute]
+                break
+    return config
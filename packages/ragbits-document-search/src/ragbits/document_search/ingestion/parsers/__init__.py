@@ -1,9 +1,11 @@
 from ragbits.document_search.ingestion.parsers.base import DocumentParser, ImageDocumentParser, TextDocumentParser
+from ragbits.document_search.ingestion.parsers.process_pool import ProcessPoolDocumentParser
 from ragbits.document_search.ingestion.parsers.router import DocumentParserRouter
 
 __all__ = [
     "DocumentParser",
     "DocumentParserRouter",
     "ImageDocumentParser",
+    "ProcessPoolDocumentParser",
     "TextDocumentParser",
 ]
@@ -1,5 +1,7 @@
+import threading
+
 from docling.chunking import HierarchicalChunker
-from docling.datamodel.base_models import InputFormat
+from docling.datamodel.base_models import ConversionStatus, InputFormat
 from docling.datamodel.pipeline_options import (
     AcceleratorOptions,
     EasyOcrOptions,
@@ -21,9 +23,11 @@ from docling.document_converter import (
     PowerpointFormatOption,
     WordFormatOption,
 )
+from docling.exceptions import ConversionError
 from docling_core.transforms.chunker.base import BaseChunker
 from docling_core.types.doc import DocItem, DoclingDocument
 
+from ragbits.core.utils.batching import MicroBatcher
 from ragbits.document_search.documents.document import Document, DocumentType
 from ragbits.document_search.documents.element import Element, ElementLocation, ImageElement, TextElement
 from ragbits.document_search.ingestion.parsers import DocumentParser
@@ -52,6 +56,8 @@ class DoclingDocumentParser(DocumentParser):
         num_threads: int = 1,
         chunker: BaseChunker | None = None,
         format_options: dict[InputFormat, FormatOption] | None = None,
+        batch_window: float | None = None,
+        warm_up: bool = False,
     ) -> None:
         """
         Initialize the DoclingDocumentParser instance.
@@ -62,11 +68,41 @@ class DoclingDocumentParser(DocumentParser):
             chunker: Custom chunker instance. If None, HierarchicalChunker will be used.
             format_options: Full format options configuration for DocumentConverter.
                 If None, default format options will be used.
+            batch_window: The number of seconds to wait for concurrent parse calls, so that their documents are
+                converted in a single `convert_all` call. Disabled by default.
+            warm_up: If True, the converter and the pipelines of all its formats are initialized on construction,
+                instead of on the first parsed document of each format.
         """
         self.ignore_images = ignore_images
         self.num_threads = num_threads
         self.chunker = chunker
         self.format_options = format_options
+        self.batch_window = batch_window
+        self._converter: DocumentConverter | None = None
+        self._converter_lock = threading.Lock()
+        self._batcher = MicroBatcher(self._convert_batch, batch_window) if batch_window is not None else None
+
+        if warm_up:
+            self.warm_up()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_converter"] = None
+        state["_converter_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._converter_lock = threading.Lock()
+
+    def warm_up(self) -> None:
+        """
+        Initialize the converter and the pipelines of all its formats, loading the layout and OCR models.
+        """
+        converter = self._get_converter()
+        with self._converter_lock:
+            for input_format in converter.format_to_options:
+                converter.initialize_pipeline(input_format)
 
     async def parse(self, document: Document) -> list[Element]:
         """
@@ -95,44 +131,123 @@ class DoclingDocumentParser(DocumentParser):
         Raises:
             ConversionError: If converting the document to the Docling format fails.
         """
-        # Use provided format_options or create default ones
-        if self.format_options is not None:
-            converter = DocumentConverter(format_options=self.format_options)
+        if self._batcher is not None:
+            (result,) = await self._batcher.submit([document], None)
         else:
-            # Build default format options
-            accelerator_options = AcceleratorOptions(num_threads=self.num_threads)
-            pipeline_options = ConvertPipelineOptions(accelerator_options=accelerator_options)
-            pdf_pipeline_options = PdfPipelineOptions(
-                images_scale=2,
-                generate_page_images=True,
-                accelerator_options=accelerator_options,
-                ocr_options=EasyOcrOptions(),
-            )
+            (result,) = self._convert([document])
 
-            converter = DocumentConverter(
-                format_options={
-                    InputFormat.XLSX: ExcelFormatOption(pipeline_options=pipeline_options),
-                    InputFormat.DOCX: WordFormatOption(pipeline_options=pipeline_options),
-                    InputFormat.PPTX: PowerpointFormatOption(pipeline_options=pipeline_options),
-                    InputFormat.HTML: HTMLFormatOption(pipeline_options=pipeline_options),
-                    InputFormat.MD: MarkdownFormatOption(pipeline_options=pipeline_options),
-                    InputFormat.IMAGE: PdfFormatOption(pipeline_options=pdf_pipeline_options),
-                    InputFormat.PDF: PdfFormatOption(pipeline_options=pdf_pipeline_options),
-                },
-            )
+        if isinstance(result, ConversionError):
+            raise result
+
+        return result
+
+    async def _convert_batch(self, documents: list[Document], _: None) -> list[DoclingDocument | ConversionError]:
+        """
+        Convert the documents of concurrent parse calls.
+
+        Args:
+            documents: The documents to convert.
+
+        Returns:
+            The docling document or the conversion error of each document.
+        """
+        return self._convert(documents)
+
+    def _convert(self, documents: list[Document]) -> list[DoclingDocument | ConversionError]:
+        """
+        Convert the documents to the Docling format in a single `convert_all` call of the shared converter.
+
+        Args:
+            documents: The documents to convert.
 
+        Returns:
+            The docling document or the conversion error of each document.
+        """
         # For txt files, temporarily rename to .md extension. Docling doesn't support text files natively.
-        if document.metadata.document_type == DocumentType.TXT:
-            original_suffix = document.local_path.suffix
-            document.local_path = document.local_path.rename(document.local_path.with_suffix(".md"))
+        original_suffixes = {}
+        for document in documents:
+            if document.metadata.document_type == DocumentType.TXT:
+                original_suffixes[id(document)] = document.local_path.suffix
+                document.local_path = document.local_path.rename(document.local_path.with_suffix(".md"))
+
+        sources = [document.local_path for document in documents]
+        try:
+            converter = self._get_converter()
+            with self._converter_lock:
+                conversion_results = {
+                    str(conversion_result.input.file): conversion_result
+                    for conversion_result in converter.convert_all(sources, raises_on_error=False)
+                }
+        finally:
+            # Convert back to the original files.
+            for document in documents:
+                if id(document) in original_suffixes:
+                    document.local_path = document.local_path.rename(
+                        document.local_path.with_suffix(original_suffixes[id(document)])
+                    )
+
+        results: list[DoclingDocument | ConversionError] = []
+        for document, source in zip(documents, sources, strict=True):
+            conversion_result = conversion_results.get(str(source))
+            if conversion_result is None:
+                results.append(
+                    ConversionError(f"Conversion failed for: {document.local_path}, the format is not recognized.")
+                )
+            elif conversion_result.status not in {ConversionStatus.SUCCESS, ConversionStatus.PARTIAL_SUCCESS}:
+                error_details = "; ".join(error.error_message for error in conversion_result.errors)
+                results.append(
+                    ConversionError(
+                        f"Conversion failed for: {document.local_path} with status: {conversion_result.status}."
+                        + (f" Errors: {error_details}" if error_details else "")
+                    )
+                )
+            else:
+                results.append(conversion_result.document)
+
+        return results
+
+    def _get_converter(self) -> DocumentConverter:
+        """
+        Get the converter shared by all the documents, created on first use. Docling caches the initialized
+        pipeline of each format and pipeline options in the converter, so the models are loaded only once.
+
+        Returns:
+            The document converter.
+        """
+        if self._converter is not None:
+            return self._converter
+
+        with self._converter_lock:
+            if self._converter is not None:
+                return self._converter
 
-        partitioned_document = converter.convert(document.local_path).document
+            # Use provided format_options or create default ones
+            if self.format_options is not None:
+                self._converter = DocumentConverter(format_options=self.format_options)
+            else:
+                # Build default format options
+                accelerator_options = AcceleratorOptions(num_threads=self.num_threads)
+                pipeline_options = ConvertPipelineOptions(accelerator_options=accelerator_options)
+                pdf_pipeline_options = PdfPipelineOptions(
+                    images_scale=2,
+                    generate_page_images=True,
+                    accelerator_options=accelerator_options,
+                    ocr_options=EasyOcrOptions(),
+                )
 
-        # Convert back to the original file.
-        if document.metadata.document_type == DocumentType.TXT:
-            document.local_path = document.local_path.rename(document.local_path.with_suffix(original_suffix))
+                self._converter = DocumentConverter(
+                    format_options={
+                        InputFormat.XLSX: ExcelFormatOption(pipeline_options=pipeline_options),
+                        InputFormat.DOCX: WordFormatOption(pipeline_options=pipeline_options),
+                        InputFormat.PPTX: PowerpointFormatOption(pipeline_options=pipeline_options),
+                        InputFormat.HTML: HTMLFormatOption(pipeline_options=pipeline_options),
+                        InputFormat.MD: MarkdownFormatOption(pipeline_options=pipeline_options),
+                        InputFormat.IMAGE: PdfFormatOption(pipeline_options=pdf_pipeline_options),
+                        InputFormat.PDF: PdfFormatOption(pipeline_options=pdf_pipeline_options),
+                    },
+                )
 
-        return partitioned_document
+        return self._converter
 
     def _chunk(self, partitioned_document: DoclingDocument, document: Document) -> list[Element]:
         """
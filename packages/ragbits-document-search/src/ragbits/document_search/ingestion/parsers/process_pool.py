@@ -0,0 +1,139 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from typing_extensions import Self
+
+from ragbits.core.utils.config_handling import ObjectConstructionConfig
+from ragbits.document_search.documents.document import Document, DocumentType
+from ragbits.document_search.documents.element import Element
+from ragbits.document_search.ingestion.parsers.base import DocumentParser
+
+# The parser unpickled once by the initializer of a process pool worker.
+_worker_parser: DocumentParser | None = None
+
+
+def _init_worker(parser: DocumentParser) -> None:
+    """
+    Stores the parser in a process pool worker, so that it is reused by all the documents parsed by the worker.
+
+    Args:
+        parser: The parser to use in the worker.
+    """
+    global _worker_parser  # noqa: PLW0603
+    _worker_parser = parser
+
+
+def _parse_in_worker(document: Document) -> list[Element]:
+    """
+    Parses the document with the parser of the process pool worker.
+
+    Args:
+        document: The document to parse.
+
+    Returns:
+        The list of elements extracted from the document.
+    """
+    if _worker_parser is None:
+        raise RuntimeError("The process pool worker was not initialized with a parser")
+    return asyncio.run(_worker_parser.parse(document))
+
+
+class ProcessPoolDocumentParser(DocumentParser):
+    """
+    Parser that runs the wrapped parser in a pool of processes, so that CPU-bound parsing, such as partitioning
+    with Docling or the local Unstructured library, runs on multiple cores without blocking the event loop.
+    """
+
+    def __init__(self, parser: DocumentParser, max_workers: int | None = None) -> None:
+        """
+        Initialize the ProcessPoolDocumentParser instance.
+
+        Args:
+            parser: The picklable parser to run in the pool. Each worker gets its own copy of the parser,
+                reused for all the documents parsed by the worker.
+            max_workers: The number of worker processes. If None, as many workers as there are CPUs are used.
+        """
+        self.parser = parser
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    @classmethod
+    def from_config(cls, config: dict) -> Self:
+        """
+        Initialize the class with the provided configuration.
+
+        Args:
+            config: A dictionary containing configuration details for the class.
+
+        Returns:
+            The initialized instance of ProcessPoolDocumentParser.
+
+        Raises:
+            ValidationError: If the configuration doesn't follow the expected format.
+            InvalidConfigError: If the wrapped parser can't be found or is not the correct type.
+        """
+        config["parser"] = DocumentParser.subclass_from_config(
+            ObjectConstructionConfig.model_validate(config["parser"])
+        )
+        return super().from_config(config)
+
+    def validate_document_type(self, document_type: DocumentType) -> None:  # type: ignore[override]
+        """
+        Check if the wrapped parser supports the document type.
+
+        Args:
+            document_type: The document type to validate against the parser.
+
+        Raises:
+            ParserDocumentNotSupportedError: If the document type is not supported.
+        """
+        self.parser.validate_document_type(document_type)
+
+    async def parse(self, document: Document) -> list[Element]:
+        """
+        Parse the document with the wrapped parser in a worker process.
+
+        Args:
+            document: The document to parse.
+
+        Returns:
+            The list of elements extracted from the document.
+
+        Raises:
+            ParserDocumentNotSupportedError: If the document type is not supported by the wrapped parser.
+            ParserError: If the parsing of the document failed.
+        """
+        self.validate_document_type(document.metadata.document_type)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), _parse_in_worker, document)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the process pool, if it was created. A new pool is created if the parser is used again.
+
+        Args:
+            wait: Whether to wait for the running parsing to finish.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Returns the process pool, created on first use.
+
+        Returns:
+            The executor running the wrapped parser.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.parser,),
+            )
+        return self._executor
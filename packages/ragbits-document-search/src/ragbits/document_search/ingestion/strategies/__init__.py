@@ -1,6 +1,13 @@
 from ragbits.document_search.ingestion.strategies.base import IngestStrategy
 from ragbits.document_search.ingestion.strategies.batched import BatchedIngestStrategy
+from ragbits.document_search.ingestion.strategies.pipelined import PipelinedIngestStrategy
 from ragbits.document_search.ingestion.strategies.ray import RayDistributedIngestStrategy
 from ragbits.document_search.ingestion.strategies.sequential import SequentialIngestStrategy
 
-__all__ = ["BatchedIngestStrategy", "IngestStrategy", "RayDistributedIngestStrategy", "SequentialIngestStrategy"]
+__all__ = [
+    "BatchedIngestStrategy",
+    "IngestStrategy",
+    "PipelinedIngestStrategy",
+    "RayDistributedIngestStrategy",
+    "SequentialIngestStrategy",
+]
@@ -4,7 +4,7 @@ import random
 import traceback
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from collections.abc import Awaitable, Callable, Iterable
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
 from dataclasses import dataclass, field
 from types import ModuleType
 from typing import ClassVar, ParamSpec, TypeVar
@@ -68,6 +68,7 @@ class IngestExecutionResult:
 
     successful: list[IngestDocumentResult] = field(default_factory=list)
     failed: list[IngestDocumentResult] = field(default_factory=list)
+    skipped: list[IngestDocumentResult] = field(default_factory=list)
 
 
 class IngestExecutionError(Exception):
@@ -86,6 +87,9 @@ class IngestStrategy(WithConstructionConfig, ABC):
 
     default_module: ClassVar[ModuleType | None] = strategies
     configuration_key: ClassVar[str] = "ingest_strategy"
+    # Whether the strategy consumes an asynchronous iterable of documents. Other strategies get the documents
+    # collected in a list.
+    accepts_async_documents: ClassVar[bool] = False
 
     def __init__(self, num_retries: int = 3, backoff_multiplier: int = 1, backoff_max: int = 60) -> None:
         """
@@ -103,7 +107,7 @@ class IngestStrategy(WithConstructionConfig, ABC):
     @abstractmethod
     async def __call__(
         self,
-        documents: Iterable[DocumentMeta | Document | Source],
+        documents: Iterable[DocumentMeta | Document | Source] | AsyncIterable[DocumentMeta | Document | Source],
         vector_store: VectorStore,
         parser_router: DocumentParserRouter,
         enricher_router: ElementEnricherRouter,
@@ -112,7 +116,9 @@ class IngestStrategy(WithConstructionConfig, ABC):
         Ingest documents.
 
         Args:
-            documents: The documents to ingest.
+            documents: The documents to ingest. An asynchronous iterable is passed only if `accepts_async_documents`
+                is set, and is consumed lazily, so that documents are ingested while the next ones are still being
+                listed. Errors of the listing are raised while it is consumed.
             vector_store: The vector store to store document chunks.
             parser_router: The document parser router to use.
             enricher_router: The intermediate element enricher router to use.
@@ -250,14 +256,12 @@ class IngestStrategy(WithConstructionConfig, ABC):
             document_ids: The list of document ids to remove from the vector store.
             vector_store: The vector store to remove document elements from.
         """
-        # TODO: Pass 'where' argument to the list method to filter results and optimize search
-        ids_to_delete = [
-            entry.id
-            for entry in await vector_store.list()
-            if entry.metadata.get("document_meta", {}).get("source", {}).get("id") in document_ids
-        ]
-        if ids_to_delete:
-            await vector_store.remove(ids_to_delete)
+        await asyncio.gather(
+            *[
+                vector_store.remove_where({"document_meta": {"source": {"id": document_id}}})
+                for document_id in document_ids
+            ]
+        )
 
     @staticmethod
     async def _insert_elements(elements: Iterable[Element], vector_store: VectorStore) -> None:
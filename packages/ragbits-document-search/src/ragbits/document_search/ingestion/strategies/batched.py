@@ -1,9 +1,10 @@
 import asyncio
-from collections.abc import Iterable
+from collections.abc import AsyncIterable, Iterable
 from dataclasses import dataclass
+from typing import ClassVar
 
 from ragbits.core.sources.base import Source
-from ragbits.core.utils.helpers import batched
+from ragbits.core.utils.helpers import abatched, batched
 from ragbits.core.vector_stores.base import VectorStore
 from ragbits.document_search.documents.document import Document, DocumentMeta
 from ragbits.document_search.documents.element import Element
@@ -32,6 +33,8 @@ class BatchedIngestStrategy(IngestStrategy):
     Ingest strategy that processes documents in batches.
     """
 
+    accepts_async_documents: ClassVar[bool] = True
+
     def __init__(
         self,
         batch_size: int | None = None,
@@ -64,7 +67,7 @@ class BatchedIngestStrategy(IngestStrategy):
 
     async def __call__(
         self,
-        documents: Iterable[DocumentMeta | Document | Source],
+        documents: Iterable[DocumentMeta | Document | Source] | AsyncIterable[DocumentMeta | Document | Source],
         vector_store: VectorStore,
         parser_router: DocumentParserRouter,
         enricher_router: ElementEnricherRouter,
@@ -83,7 +86,7 @@ class BatchedIngestStrategy(IngestStrategy):
         """
         results = IngestExecutionResult()
 
-        for documents_batch in batched(documents, self.batch_size):
+        async for documents_batch in abatched(documents, self.batch_size):
             # Parse documents
             parse_results = await self._parse_batch(documents_batch, parser_router)
 
@@ -0,0 +1,171 @@
+import asyncio
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
+from typing import Any, ClassVar
+
+from ragbits.core.sources.base import Source
+from ragbits.core.utils.helpers import aiterate
+from ragbits.core.vector_stores.base import VectorStore
+from ragbits.document_search.documents.document import Document, DocumentMeta
+from ragbits.document_search.ingestion.enrichers.router import ElementEnricherRouter
+from ragbits.document_search.ingestion.parsers.router import DocumentParserRouter
+from ragbits.document_search.ingestion.strategies.base import IngestDocumentResult, IngestExecutionResult
+from ragbits.document_search.ingestion.strategies.batched import BatchedIngestStrategy, IngestTaskResult
+
+# Marks the end of the items put on a stage queue.
+_STOP = object()
+
+
+class PipelinedIngestStrategy(BatchedIngestStrategy):
+    """
+    Ingest strategy that streams documents through the parse, enrich and index stages connected by bounded queues,
+    so that parsing of the next documents overlaps with enrichment and indexing of the previous ones.
+    """
+
+    accepts_async_documents: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        parse_concurrency: int = 4,
+        enrich_concurrency: int = 4,
+        index_concurrency: int = 4,
+        queue_size: int = 8,
+        enrich_batch_size: int | None = None,
+        index_batch_size: int | None = None,
+        num_retries: int = 3,
+        backoff_multiplier: int = 1,
+        backoff_max: int = 60,
+    ) -> None:
+        """
+        Initialize the PipelinedIngestStrategy instance.
+
+        Args:
+            parse_concurrency: The maximum number of documents fetched and parsed at once.
+            enrich_concurrency: The maximum number of documents enriched at once.
+            index_concurrency: The maximum number of documents indexed at once.
+            queue_size: The maximum number of documents waiting for each stage. When the queue of a stage is full,
+                the previous stage waits for it, so that the memory used by in-flight documents stays bounded.
+            enrich_batch_size: The batch size for enriching elements.
+                Describes the maximum number of document elements to enrich at once.
+                If None, all elements are enriched at once.
+            index_batch_size: The batch size for indexing elements.
+                Describes the maximum number of document elements to index at once.
+                If None, all elements are indexed at once.
+            num_retries: The number of retries per document ingest task error.
+            backoff_multiplier: The base delay multiplier for exponential backoff (in seconds).
+            backoff_max: The maximum allowed delay (in seconds) between retries.
+        """
+        super().__init__(
+            batch_size=1,
+            enrich_batch_size=enrich_batch_size,
+            index_batch_size=index_batch_size,
+            num_retries=num_retries,
+            backoff_multiplier=backoff_multiplier,
+            backoff_max=backoff_max,
+        )
+        self.parse_concurrency = parse_concurrency
+        self.enrich_concurrency = enrich_concurrency
+        self.index_concurrency = index_concurrency
+        self.queue_size = queue_size
+
+    async def __call__(
+        self,
+        documents: Iterable[DocumentMeta | Document | Source] | AsyncIterable[DocumentMeta | Document | Source],
+        vector_store: VectorStore,
+        parser_router: DocumentParserRouter,
+        enricher_router: ElementEnricherRouter,
+    ) -> IngestExecutionResult:
+        """
+        Ingest documents in a pipeline of concurrent stages.
+
+        Args:
+            documents: The documents to ingest.
+            vector_store: The vector store to store document chunks.
+            parser_router: The document parser router to use.
+            enricher_router: The intermediate element enricher router to use.
+
+        Returns:
+            The ingest execution result.
+        """
+        results = IngestExecutionResult()
+        parse_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        enrich_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        index_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+
+        def _collect(result: IngestDocumentResult) -> None:
+            if result.error:
+                results.failed.append(result)
+            else:
+                results.successful.append(result)
+
+        async def _produce() -> None:
+            async for document in aiterate(documents):
+                await parse_queue.put(document)
+            for _ in range(self.parse_concurrency):
+                await parse_queue.put(_STOP)
+
+        async def _parse(document: DocumentMeta | Document | Source) -> None:
+            (result,) = await self._parse_batch([document], parser_router)
+            if isinstance(result, IngestDocumentResult):
+                _collect(result)
+            elif any(type(element) in enricher_router for element in result.elements):
+                await enrich_queue.put(result)
+            else:
+                await index_queue.put(result)
+
+        async def _enrich(result: IngestTaskResult) -> None:
+            (enriched,) = await self._enrich_batch([result], enricher_router)
+            if isinstance(enriched, IngestDocumentResult):
+                _collect(enriched)
+            else:
+                await index_queue.put(enriched)
+
+        async def _index(result: IngestTaskResult) -> None:
+            (indexed,) = await self._index_batch([result], vector_store)
+            _collect(indexed)
+
+        tasks = [
+            asyncio.create_task(_produce()),
+            asyncio.create_task(
+                self._run_stage(parse_queue, _parse, self.parse_concurrency, enrich_queue, self.enrich_concurrency)
+            ),
+            asyncio.create_task(
+                self._run_stage(enrich_queue, _enrich, self.enrich_concurrency, index_queue, self.index_concurrency)
+            ),
+            asyncio.create_task(self._run_stage(index_queue, _index, self.index_concurrency)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return results
+
+    @staticmethod
+    async def _run_stage(
+        queue: asyncio.Queue,
+        process: Callable[[Any], Awaitable[None]],
+        concurrency: int,
+        next_queue: asyncio.Queue | None = None,
+        next_concurrency: int = 0,
+    ) -> None:
+        """
+        Process the items of the stage queue with concurrent workers, until each of them gets the end marker.
+        Then pass the end marker to the workers of the next stage, since no more items can be put on its queue.
+
+        Args:
+            queue: The queue of items to process.
+            process: The function processing an item, putting its result on the following queues.
+            concurrency: The number of workers processing the items.
+            next_queue: The queue of the next stage.
+            next_concurrency: The number of workers of the next stage.
+        """
+
+        async def _work() -> None:
+            while (item := await queue.get()) is not _STOP:
+                await process(item)
+
+        await asyncio.gather(*[_work() for _ in range(concurrency)])
+        if next_queue is not None:
+            for _ in range(next_concurrency):
+                await next_queue.put(_STOP)
@@ -1,8 +1,10 @@
 import asyncio
-from collections.abc import Iterable
+from collections.abc import AsyncIterable, Iterable
+from typing import ClassVar
 
 from ragbits.core.sources.base import Source
 from ragbits.core.utils.decorators import requires_dependencies
+from ragbits.core.utils.helpers import aiterate
 from ragbits.core.vector_stores.base import VectorStore
 from ragbits.document_search.documents.document import Document, DocumentMeta
 from ragbits.document_search.ingestion.enrichers.router import ElementEnricherRouter
@@ -19,6 +21,8 @@ class RayDistributedIngestStrategy(BatchedIngestStrategy):
     Ingest strategy that processes documents on a cluster, using Ray.
     """
 
+    accepts_async_documents: ClassVar[bool] = True
+
     def __init__(
         self,
         batch_size: int = 1,
@@ -61,7 +65,7 @@ class RayDistributedIngestStrategy(BatchedIngestStrategy):
     @requires_dependencies(["ray.data"], "ray")
     async def __call__(
         self,
-        documents: Iterable[DocumentMeta | Document | Source],
+        documents: Iterable[DocumentMeta | Document | Source] | AsyncIterable[DocumentMeta | Document | Source],
         vector_store: VectorStore,
         parser_router: DocumentParserRouter,
         enricher_router: ElementEnricherRouter,
@@ -80,8 +84,11 @@ class RayDistributedIngestStrategy(BatchedIngestStrategy):
         """
         import ray
 
+        # Ray datasets are created from a list, so the documents are collected before the parsing starts
+        items = [document async for document in aiterate(documents)]
+
         # Parse documents
-        parse_results = ray.data.from_items(list(documents)).map_batches(
+        parse_results = ray.data.from_items(items).map_batches(
             fn=lambda batch: {"results": asyncio.run(self._parse_batch(batch["item"], parser_router))},
             batch_size=self.batch_size,
             num_cpus=1,
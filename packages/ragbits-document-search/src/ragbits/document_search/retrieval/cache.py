@@ -0,0 +1,309 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
+from enum import Enum, auto
+from pathlib import Path
+
+from ragbits.core.audit.metrics import record_metric, register_metric
+from ragbits.core.audit.metrics.base import Metric, MetricType
+from ragbits.core.options import Options
+from ragbits.core.vector_stores.base import VectorStoreEntry
+from ragbits.document_search.documents.element import Element
+
+
+class SearchCacheMetric(Enum):
+    """
+    Search cache metrics that can be recorded.
+    """
+
+    HITS = auto()
+    MISSES = auto()
+
+
+register_metric(
+    SearchCacheMetric.HITS,
+    Metric(
+        name="search_cache_hits",
+        description="Counts the searches served from the search result cache",
+        unit="searches",
+        type=MetricType.COUNTER,
+    ),
+)
+register_metric(
+    SearchCacheMetric.MISSES,
+    Metric(
+        name="search_cache_misses",
+        description="Counts the searches missing from the search result cache",
+        unit="searches",
+        type=MetricType.COUNTER,
+    ),
+)
+
+
+class SearchCacheBackend(ABC):
+    """
+    Storage of cached search results shared between processes.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """
+        Get the cached value of the key.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None if the key is missing or expired.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """
+        Cache the value of the key.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+            ttl: The number of seconds after which the value expires. If not provided, the value never expires.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Remove all the cached values.
+        """
+
+
+class SQLiteSearchCacheBackend(SearchCacheBackend):
+    """
+    Search cache backend storing the results in a local SQLite database, shared by processes on the same machine.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Constructs a new SQLiteSearchCacheBackend instance.
+
+        Args:
+            path: The path of the SQLite database.
+        """
+        self.path = Path(path)
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> bytes | None:
+        """
+        Get the cached value of the key.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None if the key is missing or expired.
+        """
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """
+        Cache the value of the key.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+            ttl: The number of seconds after which the value expires. If not provided, the value never expires.
+        """
+        await asyncio.to_thread(self._set, key, value, None if ttl is None else time.time() + ttl)
+
+    async def clear(self) -> None:
+        """
+        Remove all the cached values.
+        """
+        await asyncio.to_thread(self._clear)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS search_results (key TEXT PRIMARY KEY, value BLOB, expires_at REAL)"
+            )
+        return self._connection
+
+    def _get(self, key: str) -> bytes | None:
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute(
+                    "SELECT value FROM search_results WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                    (key, time.time()),
+                )
+                .fetchone()
+            )
+        return row[0] if row else None
+
+    def _set(self, key: str, value: bytes, expires_at: float | None) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO search_results (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, expires_at),
+                )
+                connection.execute("DELETE FROM search_results WHERE expires_at <= ?", (time.time(),))
+
+    def _clear(self) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute("DELETE FROM search_results")
+
+
+class SearchResultCache:
+    """
+    Cache of search results, keyed on the normalized query and the merged search options.
+
+    Results are kept in an in-process LRU cache with a TTL, backed by an optional shared backend.
+    The cache is cleared whenever the searched vector store changes, and the results of the searches
+    started before the change are not cached.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float | None = 300.0,
+        backend: SearchCacheBackend | None = None,
+        namespace: str = "document_search",
+    ) -> None:
+        """
+        Constructs a new SearchResultCache instance.
+
+        Args:
+            max_entries: The maximum number of searches kept in the in-process cache.
+            ttl: The number of seconds after which cached results expire. If not provided, results expire only
+                when the vector store changes.
+            backend: The backend sharing the cached results between processes. If not provided, results are cached
+                in memory only.
+            namespace: The name identifying the searched index in cache keys.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.backend = backend
+        self.namespace = namespace
+        self.generation = 0
+        self._memory: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+
+    def key(self, query: str, options: Options) -> str:
+        """
+        Build the cache key of a search.
+
+        Args:
+            query: The query to search for.
+            options: The merged search options.
+
+        Returns:
+            The cache key.
+        """
+        normalized_query = " ".join(query.casefold().split())
+        digest = hashlib.sha256()
+        digest.update(self.namespace.encode())
+        digest.update(normalized_query.encode())
+        digest.update(json.dumps(options.model_dump(), sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    async def get(self, key: str) -> list[Element] | None:
+        """
+        Get the cached results of a search.
+
+        Args:
+            key: The cache key of the search.
+
+        Returns:
+            The cached elements, or None if the search is not cached.
+        """
+        value = self._get_from_memory(key)
+        if value is None and self.backend is not None:
+            value = await self.backend.get(key)
+            if value is not None:
+                self._put_in_memory(key, value)
+
+        record_metric(
+            SearchCacheMetric.MISSES if value is None else SearchCacheMetric.HITS,
+            value=1,
+            metric_type=MetricType.COUNTER,
+            namespace=self.namespace,
+        )
+        return None if value is None else self._deserialize(value)
+
+    async def set(self, key: str, elements: Sequence[Element], generation: int | None = None) -> None:
+        """
+        Cache the results of a search.
+
+        Args:
+            key: The cache key of the search.
+            elements: The elements found.
+            generation: The generation of the cache when the search started. If the cache was invalidated since,
+                the results may be stale and are not cached.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        value = self._serialize(elements)
+        self._put_in_memory(key, value)
+        if self.backend is not None:
+            await self.backend.set(key, value, self.ttl)
+
+    async def invalidate(self) -> None:
+        """
+        Remove all the cached results, and start a new generation of the cache.
+        """
+        self.generation += 1
+        self._memory.clear()
+        if self.backend is not None:
+            await self.backend.clear()
+
+    def _get_from_memory(self, key: str) -> bytes | None:
+        if (cached := self._memory.get(key)) is None:
+            return None
+        expires_at, value = cached
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return value
+
+    def _put_in_memory(self, key: str, value: bytes) -> None:
+        self._memory[key] = (None if self.ttl is None else time.monotonic() + self.ttl, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    @staticmethod
+    def _serialize(elements: Sequence[Element]) -> bytes:
+        return json.dumps(
+            [
+                {"entry": element.to_vector_db_entry().model_dump(mode="json"), "score": element.score}
+                for element in elements
+            ]
+        ).encode()
+
+    @staticmethod
+    def _deserialize(value: bytes) -> list[Element]:
+        return [
+            Element.from_vector_db_entry(VectorStoreEntry.model_validate(item["entry"]), item["score"])
+            for item in json.loads(value)
+        ]
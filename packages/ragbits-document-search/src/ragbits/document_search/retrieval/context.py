@@ -0,0 +1,213 @@
+import re
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from ragbits.core.audit.traces import traceable
+from ragbits.core.llms.base import LLM
+from ragbits.core.prompt.base import SimplePrompt
+from ragbits.document_search.documents.element import Element, ElementLocation, TextElement
+
+
+class ContextPacker:
+    """
+    Assembles the retrieved elements into the context of a prompt, within the token budget of the target LLM.
+
+    Packing:
+        1. Drops the elements without text and the near-identical duplicates of higher ranked elements.
+        2. Greedily takes the elements in the ranking order, skipping the ones which don't fit the remaining budget.
+        3. Merges the taken text elements from the same document page into a single element, in reading order,
+           unless the merged element doesn't fit the budget, in which case they are kept separate.
+    """
+
+    def __init__(
+        self,
+        llm: LLM,
+        max_tokens: int = 4000,
+        *,
+        similarity_threshold: float | None = 0.9,
+        merge_pages: bool = True,
+        max_cached_token_counts: int = 10_000,
+    ) -> None:
+        """
+        Initialize the ContextPacker instance.
+
+        Args:
+            llm: The LLM the context is built for, counting the tokens of the elements.
+            max_tokens: The token budget of the context.
+            similarity_threshold: The minimum similarity of the word trigrams of two elements, from 0 to 1, for the
+                lower ranked one to be dropped as a duplicate. If None, only the elements with identical text
+                are dropped.
+            merge_pages: Whether to merge the text elements from the same document page.
+            max_cached_token_counts: The maximum number of token counts kept by the element id, so that elements
+                retrieved again in the next turns of a conversation are not tokenized again.
+        """
+        self.llm = llm
+        self.max_tokens = max_tokens
+        self.similarity_threshold = similarity_threshold
+        self.merge_pages = merge_pages
+        self.max_cached_token_counts = max_cached_token_counts
+        self._token_counts: OrderedDict[str, int] = OrderedDict()
+
+    @traceable
+    def pack(self, elements: Sequence[Element], max_tokens: int | None = None) -> list[Element]:
+        """
+        Pack the reranked elements into the token budget.
+
+        Args:
+            elements: The elements ordered from the most relevant, as returned by `DocumentSearch.search`.
+            max_tokens: The token budget of the context. If not set, the budget of the packer is used.
+
+        Returns:
+            The elements fitting the budget, ordered from the most relevant.
+        """
+        budget = self.max_tokens if max_tokens is None else max_tokens
+        elements = self._deduplicate([element for element in elements if element.text_representation])
+
+        packed = []
+        for element in elements:
+            if (tokens := self.count_tokens(element)) <= budget:
+                packed.append(element)
+                budget -= tokens
+
+        if self.merge_pages:
+            packed = self._merge_pages(packed, budget)
+        return packed
+
+    def count_tokens(self, element: Element) -> int:
+        """
+        Count the tokens of the text representation of the element with the LLM, reusing the counts by element id.
+
+        Args:
+            element: The element to count the tokens of.
+
+        Returns:
+            The number of tokens of the element.
+        """
+        if (tokens := self._token_counts.get(element.id)) is not None:
+            self._token_counts.move_to_end(element.id)
+            return tokens
+
+        tokens = self.llm.count_tokens(SimplePrompt(element.text_representation or ""))
+        if self.max_cached_token_counts > 0:
+            self._token_counts[element.id] = tokens
+            while len(self._token_counts) > self.max_cached_token_counts:
+                self._token_counts.popitem(last=False)
+        return tokens
+
+    def _deduplicate(self, elements: list[Element]) -> list[Element]:
+        """
+        Drop the elements with text identical or similar to the text of a higher ranked element.
+
+        Args:
+            elements: The elements ordered from the most relevant.
+
+        Returns:
+            The elements without duplicates.
+        """
+        kept: list[Element] = []
+        kept_texts: set[str] = set()
+        kept_shingles: list[set[tuple[str, ...]]] = []
+        for element in elements:
+            words = re.findall(r"\w+", (element.text_representation or "").lower())
+            text = " ".join(words)
+            if text in kept_texts:
+                continue
+            shingles = {tuple(words[i : i + 3]) for i in range(max(len(words) - 2, 1))}
+            if self.similarity_threshold is not None and any(
+                len(shingles & other) / len(shingles | other) >= self.similarity_threshold for other in kept_shingles
+            ):
+                continue
+            kept.append(element)
+            kept_texts.add(text)
+            kept_shingles.append(shingles)
+        return kept
+
+    def _merge_pages(self, elements: list[Element], budget: int) -> list[Element]:
+        """
+        Merge the text elements from the same document page into a single element, placed at the rank
+        of the most relevant of them.
+
+        Args:
+            elements: The packed elements ordered from the most relevant.
+            budget: The tokens left in the budget after packing the elements.
+
+        Returns:
+            The elements with the text elements from the same page merged. The elements of a page are kept separate
+            if the merged element doesn't fit the tokens they take and the tokens left in the budget.
+        """
+        pages: dict[tuple[str, int], list[TextElement]] = {}
+        for element in elements:
+            if page := _get_text_page(element):
+                pages.setdefault(page, []).append(element)  # type: ignore[arg-type]
+
+        merged_pages: dict[tuple[str, int], TextElement] = {}
+        for page, chunks in pages.items():
+            if len(chunks) == 1:
+                continue
+            merged_page = self._merge_chunks(chunks, page[1])
+            extra_tokens = self.count_tokens(merged_page) - sum(self.count_tokens(chunk) for chunk in chunks)
+            if extra_tokens <= budget:
+                merged_pages[page] = merged_page
+                budget -= extra_tokens
+
+        merged: list[Element] = []
+        for element in elements:
+            if (page := _get_text_page(element)) not in merged_pages:
+                merged.append(element)
+            elif element is pages[page][0]:  # type: ignore[index]
+                merged.append(merged_pages[page])  # type: ignore[index]
+        return merged
+
+    @staticmethod
+    def _merge_chunks(chunks: list[TextElement], page_number: int) -> TextElement:
+        """
+        Merge the text elements from the same document page into a single element, in reading order.
+
+        Args:
+            chunks: The text elements ordered from the most relevant.
+            page_number: The number of the page.
+
+        Returns:
+            The merged element, with the score of the most relevant of them.
+        """
+        if all(_get_top_left(chunk.location) is not None for chunk in chunks):
+            chunks = sorted(chunks, key=lambda chunk: _get_top_left(chunk.location))  # type: ignore
+        scores = [chunk.score for chunk in chunks if chunk.score is not None]
+        return TextElement(
+            document_meta=chunks[0].document_meta,
+            location=ElementLocation(page_number=page_number),
+            content="\n".join(chunk.content for chunk in chunks),
+            score=max(scores) if scores else None,
+        )
+
+
+def _get_text_page(element: Element) -> tuple[str, int] | None:
+    """
+    Get the document page of the text element from its location.
+
+    Args:
+        element: The element.
+
+    Returns:
+        The id of the document and the number of the page, or None if the element is not a text element
+        or the page number is missing.
+    """
+    if not isinstance(element, TextElement) or element.location is None or element.location.page_number is None:
+        return None
+    return element.document_meta.id, element.location.page_number
+
+
+def _get_top_left(location: ElementLocation | None) -> tuple[float, float] | None:
+    """
+    Get the top left corner of the element on the page from the coordinates of its location, if they have points.
+
+    Args:
+        location: The location of the element.
+
+    Returns:
+        The vertical and horizontal position of the top left corner, or None if the coordinates are missing.
+    """
+    if location is None or not location.coordinates or not location.coordinates.get("points"):
+        return None
+    points = location.coordinates["points"]
+    return min(point[1] for point in points), min(point[0] for point in points)
@@ -1,3 +1,4 @@
+import asyncio
 import math
 from collections.abc import Sequence
 from itertools import chain
@@ -49,9 +50,16 @@ class LLMRerankerOptions(RerankerOptions):
         score_threshold: The minimum relevance score for an entry to be returned.
         override_score: If True reranking will override element score.
         llm_options: The options for the LLM.
+        max_concurrency: The maximum number of elements scored concurrently. If not set, all the elements
+            are scored concurrently.
+        early_stop_score: The score above which an element is considered relevant with confidence. Once `top_n`
+            elements score above it, the elements not sent to the LLM yet are not scored. If not set, all the elements
+            are scored.
     """
 
     llm_options: LiteLLMOptions | None | NotGiven = NOT_GIVEN
+    max_concurrency: int | None | NotGiven = NOT_GIVEN
+    early_stop_score: float | None | NotGiven = NOT_GIVEN
 
 
 class LLMReranker(Reranker[LLMRerankerOptions]):
@@ -132,7 +140,7 @@ class LLMReranker(Reranker[LLMRerankerOptions]):
         )
 
         flat_elements = list(chain.from_iterable(elements))
-        scores = await self._score_elements(flat_elements, query, llm_options)
+        scores = await self._score_elements(flat_elements, query, llm_options, merged_options)
 
         scored_elements = list(zip(flat_elements, scores, strict=True))
         scored_elements.sort(key=lambda x: x[1], reverse=True)
@@ -150,28 +158,43 @@ class LLMReranker(Reranker[LLMRerankerOptions]):
         elements: Sequence[Element],
         query: str,
         llm_options: LiteLLMOptions,
+        options: LLMRerankerOptions,
     ) -> Sequence[float]:
         """
         Score the elements according to their relevance to the query using LLM.
 
+        Elements with identical texts are scored once. The texts are sent to the LLM in the order of the elements,
+        with up to `max_concurrency` requests in flight, the next one sent as soon as any of them completes.
+
         Args:
             elements: The elements to rerank.
             query: The query to rerank the elements against.
             llm_options: The LLM options to use for scoring.
+            options: The options for reranking.
 
         Returns:
-            The elements scores.
+            The elements scores. Elements left unscored after an early stop get a score of 0.
         """
-        scores = []
-        for element in elements:
-            if element.text_representation:
-                prompt = self._prompt(RerankerInput(query=query, document=element.text_representation))
+        texts = list(dict.fromkeys(element.text_representation for element in elements if element.text_representation))
+        semaphore = asyncio.Semaphore(options.max_concurrency or len(texts) or 1)
+        text_scores: dict[str, float] = {}
+
+        def should_stop() -> bool:
+            early_stop_score = options.early_stop_score
+            return (
+                bool(options.top_n)
+                and isinstance(early_stop_score, float)
+                and sum(score >= early_stop_score for score in text_scores.values()) >= options.top_n
+            )
+
+        async def score(text: str) -> None:
+            async with semaphore:
+                if should_stop():
+                    return
+                prompt = self._prompt(RerankerInput(query=query, document=text))
                 response = await self._llm.generate_with_metadata(prompt=prompt, options=llm_options)
                 prob = math.exp(response.metadata["logprobs"][0]["logprob"])
-                score = prob if response.content == "Yes" else 1 - prob
-            else:
-                score = 0.0
-
-            scores.append(score)
+                text_scores[text] = prob if response.content == "Yes" else 1 - prob
 
-        return scores
+        await asyncio.gather(*(score(text) for text in texts))
+        return [text_scores.get(element.text_representation or "", 0.0) for element in elements]
@@ -1,4 +1,6 @@
+import asyncio
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
@@ -42,3 +44,32 @@ async def test_docling_parser(document_metadata: DocumentMeta, expected_num_elem
     elements = await parser.parse(document)
 
     assert len(elements) == expected_num_elements
+
+
+async def test_docling_parser_reuses_converter() -> None:
+    parser = DoclingDocumentParser()
+
+    await parser.parse(await DocumentMeta.from_literal("Name of Peppa's brother is George.").fetch())
+    converter = parser._converter
+    await parser.parse(await DocumentMeta.from_literal("Name of Peppa's sister is Suzy.").fetch())
+
+    assert converter is not None
+    assert parser._converter is converter
+
+
+async def test_docling_parser_converts_concurrent_documents_in_batch() -> None:
+    documents = [
+        await DocumentMeta.from_literal("Name of Peppa's brother is George.").fetch(),
+        await DocumentMeta.from_local_path(Path(__file__).parent.parent / "assets" / "md" / "test_file.md").fetch(),
+    ]
+    local_paths = [document.local_path for document in documents]
+    parser = DoclingDocumentParser(batch_window=0.01)
+    parser._convert = Mock(wraps=parser._convert)  # type: ignore[method-assign]
+
+    results = await asyncio.gather(*[parser.parse(document) for document in documents])
+
+    parser._convert.assert_called_once_with(documents)
+    assert [len(elements) for elements in results] == [1, 1]
+    assert results[0][0].text_representation == "Name of Peppa's brother is George."
+    assert [document.local_path for document in documents] == local_paths
+    assert all(local_path.exists() for local_path in local_paths)
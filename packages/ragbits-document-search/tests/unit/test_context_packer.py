@@ -0,0 +1,115 @@
+from unittest.mock import patch
+
+from ragbits.core.llms.mock import MockLLM
+from ragbits.document_search.documents.document import DocumentMeta
+from ragbits.document_search.documents.element import ElementLocation, ImageElement, TextElement
+from ragbits.document_search.retrieval.context import ContextPacker
+
+
+def _text_element(
+    content: str,
+    document: str | DocumentMeta = "doc",
+    page: int | None = None,
+    top: float | None = None,
+    score: float = 0.5,
+) -> TextElement:
+    coordinates = {"points": [(0, top), (0, top + 10), (10, top + 10), (10, top)]} if top is not None else None
+    return TextElement(
+        document_meta=DocumentMeta.from_literal(document) if isinstance(document, str) else document,
+        location=ElementLocation(page_number=page, coordinates=coordinates) if page is not None else None,
+        content=content,
+        score=score,
+    )
+
+
+def test_context_packer_fits_token_budget() -> None:
+    elements = [_text_element("a" * 40, "first"), _text_element("b" * 80, "second"), _text_element("c" * 30, "third")]
+    packer = ContextPacker(MockLLM(), max_tokens=100)
+
+    packed = packer.pack(elements)
+
+    # MockLLM counts characters as tokens, so the second element doesn't fit the budget left by the first one
+    assert [element.text_representation for element in packed] == ["a" * 40, "c" * 30]
+    assert packer.pack(elements, max_tokens=200) == elements
+
+
+def test_context_packer_drops_near_identical_elements() -> None:
+    text = "Name of Peppa's brother is George and he likes dinosaurs very much"
+    elements = [
+        _text_element(text, "first"),
+        _text_element(text.upper() + "!", "second"),
+        _text_element(text + " too", "third"),
+        _text_element("Name of Peppa's sister is Suzy", "fourth"),
+    ]
+
+    packed = ContextPacker(MockLLM(), similarity_threshold=0.8).pack(elements)
+
+    assert [element.document_meta.id for element in packed] == [
+        elements[0].document_meta.id,
+        elements[3].document_meta.id,
+    ]
+
+
+def test_context_packer_merges_elements_from_same_page() -> None:
+    document = DocumentMeta.from_literal("Peppa Pig")
+    image = ImageElement(
+        document_meta=document,
+        location=ElementLocation(page_number=1),
+        image_bytes=b"image",
+        description="A pig",
+    )
+    elements = [
+        _text_element("Second paragraph", document, page=1, top=50, score=0.9),
+        _text_element("Other page", document, page=2, score=0.8),
+        image,
+        _text_element("First paragraph", document, page=1, top=10, score=0.7),
+    ]
+
+    packed = ContextPacker(MockLLM()).pack(elements)
+
+    assert [element.text_representation for element in packed] == [
+        "First paragraph\nSecond paragraph",
+        "Other page",
+        image.text_representation,
+    ]
+    assert packed[0].score == 0.9
+    assert packed[0].location == ElementLocation(page_number=1)
+
+
+def test_context_packer_fits_top_elements_before_merging_pages() -> None:
+    document = DocumentMeta.from_literal("Peppa Pig")
+    elements = [
+        _text_element("a" * 60, document, page=1, top=10, score=0.9),
+        _text_element("b" * 30, "second", score=0.8),
+        _text_element("c" * 60, document, page=1, top=50, score=0.7),
+    ]
+
+    packed = ContextPacker(MockLLM(), max_tokens=100).pack(elements)
+
+    assert packed == elements[:2]
+
+
+def test_context_packer_keeps_page_elements_separate_when_merged_exceeds_budget() -> None:
+    document = DocumentMeta.from_literal("Peppa Pig")
+    elements = [
+        _text_element("a" * 50, document, page=1, top=10, score=0.9),
+        _text_element("b" * 50, document, page=1, top=50, score=0.7),
+    ]
+
+    # The merged element takes an extra token for the line break between the elements
+    assert ContextPacker(MockLLM(), max_tokens=100).pack(elements) == elements
+    assert [element.text_representation for element in ContextPacker(MockLLM(), max_tokens=101).pack(elements)] == [
+        "a" * 50 + "\n" + "b" * 50
+    ]
+
+
+def test_context_packer_caches_token_counts() -> None:
+    llm = MockLLM()
+    elements = [_text_element("Name of Peppa's brother is George")]
+    packer = ContextPacker(llm)
+
+    with patch.object(llm, "count_tokens", wraps=llm.count_tokens) as count_tokens:
+        packer.pack(elements)
+        packer.pack(elements)
+
+    count_tokens.assert_called_once()
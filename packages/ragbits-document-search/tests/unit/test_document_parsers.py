@@ -7,6 +7,7 @@ from ragbits.document_search.documents.document import DocumentMeta, DocumentTyp
 from ragbits.document_search.documents.element import ImageElement, TextElement
 from ragbits.document_search.ingestion.parsers.base import DocumentParser, ImageDocumentParser, TextDocumentParser
 from ragbits.document_search.ingestion.parsers.exceptions import ParserDocumentNotSupportedError
+from ragbits.document_search.ingestion.parsers.process_pool import ProcessPoolDocumentParser
 from ragbits.document_search.ingestion.parsers.unstructured import UnstructuredDocumentParser
 
 
@@ -88,3 +89,44 @@ async def test_parser_call_fail(parser_type: type[DocumentParser]) -> None:
     assert exc.value.message == f"Document type {DocumentType.PDF.value} is not supported by the {parser_type.__name__}"
     assert exc.value.document_type == DocumentType.PDF
     assert exc.value.parser_name == parser_type.__name__
+
+
+def test_process_pool_parser_from_config() -> None:
+    config = ObjectConstructionConfig.model_validate(
+        {
+            "type": "ProcessPoolDocumentParser",
+            "config": {"parser": {"type": "TextDocumentParser"}, "max_workers": 2},
+        }
+    )
+    parser = DocumentParser.subclass_from_config(config)
+
+    assert isinstance(parser, ProcessPoolDocumentParser)
+    assert isinstance(parser.parser, TextDocumentParser)
+    assert parser.max_workers == 2
+
+
+async def test_process_pool_parser_call() -> None:
+    document_meta = DocumentMeta.from_local_path(Path(__file__).parent.parent / "assets" / "md" / "test_file.md")
+    document = await document_meta.fetch()
+    parser = ProcessPoolDocumentParser(TextDocumentParser(), max_workers=1)
+
+    try:
+        elements = await parser.parse(document)
+    finally:
+        parser.shutdown()
+
+    assert elements == await TextDocumentParser().parse(document)
+
+
+async def test_process_pool_parser_call_fail() -> None:
+    document_meta = DocumentMeta.from_local_path(
+        Path(__file__).parent.parent / "assets" / "pdf" / "transformers_paper_page.pdf"
+    )
+    document = await document_meta.fetch()
+    parser = ProcessPoolDocumentParser(TextDocumentParser())
+
+    with pytest.raises(ParserDocumentNotSupportedError) as exc:
+        await parser.parse(document)
+
+    assert exc.value.parser_name == TextDocumentParser.__name__
+    assert parser._executor is None
@@ -1,6 +1,6 @@
 import os
 import tempfile
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Mapping
 from pathlib import Path
 from typing import cast
 from unittest import mock
@@ -24,6 +24,7 @@ from ragbits.document_search.ingestion.parsers import DocumentParser
 from ragbits.document_search.ingestion.parsers.base import TextDocumentParser
 from ragbits.document_search.ingestion.parsers.router import DocumentParserRouter
 from ragbits.document_search.ingestion.strategies.batched import BatchedIngestStrategy
+from ragbits.document_search.ingestion.strategies.sequential import SequentialIngestStrategy
 
 CONFIG = {
     "vector_store": {
@@ -143,15 +144,16 @@ async def test_document_search_scores():
 
     # Create a mock vector store that returns results with scores
     class MockVectorStore(InMemoryVectorStore):
-        async def retrieve(
+        async def retrieve_many(
             self,
-            text: str,
+            texts: list[str],
             options: VectorStoreOptions | None = None,
-        ) -> list[VectorStoreResult]:
-            results = await super().retrieve(text, options)
+        ) -> list[list[VectorStoreResult]]:
+            results = await super().retrieve_many(texts, options)
             # Add scores to the results
-            for i, result in enumerate(results):
-                result.score = 0.9 - (i * 0.1)  # Decreasing scores: 0.9, 0.8, 0.7, etc.
+            for text_results in results:
+                for i, result in enumerate(text_results):
+                    result.score = 0.9 - (i * 0.1)  # Decreasing scores: 0.9, 0.8, 0.7, etc.
             return results
 
     document_search: DocumentSearch = DocumentSearch(
@@ -181,6 +183,64 @@ async def test_document_search_scores():
     assert scores[2] == 0.7
 
 
+async def test_document_search_ingest_async_iterable_lazily():
+    vector_store = InMemoryVectorStore(embedder=NoopEmbedder())
+    document_search = DocumentSearch(
+        vector_store=vector_store,
+        parser_router=DocumentParserRouter({DocumentType.TXT: TextDocumentParser()}),
+        ingest_strategy=BatchedIngestStrategy(batch_size=1),
+    )
+    indexed_while_listing = []
+
+    async def _list_documents() -> AsyncIterator[DocumentMeta]:
+        for content in ["Name of Peppa's brother is George", "Name of Peppa's sister is Suzy"]:
+            indexed_while_listing.append(len(await vector_store.list()))
+            yield DocumentMeta.from_literal(content)
+
+    results = await document_search.ingest(_list_documents())
+
+    assert len(results.successful) == 2
+    assert indexed_while_listing == [0, 1]
+
+
+async def test_document_search_ingest_collects_documents_for_sync_strategy():
+    class SyncIngestStrategy(SequentialIngestStrategy):
+        accepts_async_documents = False
+
+        async def __call__(self, documents, *args, **kwargs):  # noqa: ANN001, ANN002, ANN003, ANN204
+            assert isinstance(documents, list)
+            return await super().__call__(documents, *args, **kwargs)
+
+    document_search = DocumentSearch(
+        vector_store=InMemoryVectorStore(embedder=NoopEmbedder()),
+        parser_router=DocumentParserRouter({DocumentType.TXT: TextDocumentParser()}),
+        ingest_strategy=SyncIngestStrategy(),
+    )
+
+    async def _list_documents() -> AsyncIterator[DocumentMeta]:
+        yield DocumentMeta.from_literal("Name of Peppa's brother is George")
+
+    results = await document_search.ingest(_list_documents())
+
+    assert len(results.successful) == 1
+
+
+async def test_document_search_ingest_invalid_uri_raises_before_ingest():
+    document_search = DocumentSearch(vector_store=InMemoryVectorStore(embedder=NoopEmbedder()))
+
+    with pytest.raises(ValueError, match="Unsupported protocol"):
+        await document_search.ingest("unknown://documents/*")
+
+
+async def test_document_search_ingest_from_iter_sources():
+    document_search: DocumentSearch = DocumentSearch.from_config(CONFIG)
+    examples_files = Path(__file__).parent.parent / "assets" / "md"
+
+    await document_search.ingest(LocalFileSource.iter_sources(examples_files, file_pattern="*.md"))
+
+    assert len(await document_search.search("foo")) == 3
+
+
 async def test_document_search_ingest_multiple_from_sources():
     document_search: DocumentSearch = DocumentSearch.from_config(CONFIG)
     examples_files = Path(__file__).parent.parent / "assets" / "md"
@@ -304,9 +364,9 @@ async def test_document_search_ingest_from_uri_with_wildcard(
         results = await document_search.search(search_query)
 
         # Check that we have the expected number of results
-        assert len(results) == len(
-            expected_contents
-        ), f"Expected {len(expected_contents)} result(s) but got {len(results)}"
+        assert len(results) == len(expected_contents), (
+            f"Expected {len(expected_contents)} result(s) but got {len(results)}"
+        )
 
         # Verify each result is a TextElement
         assert all(isinstance(result, TextElement) for result in results)
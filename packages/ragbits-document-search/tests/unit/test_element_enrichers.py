@@ -1,6 +1,11 @@
+import asyncio
+import io
+from collections.abc import Sequence
 from pathlib import Path
+from unittest.mock import AsyncMock
 
 import pytest
+from PIL import Image
 
 from ragbits.core.llms.litellm import LiteLLM, LiteLLMOptions
 from ragbits.core.utils.config_handling import ObjectConstructionConfig
@@ -8,7 +13,11 @@ from ragbits.document_search.documents.document import DocumentMeta
 from ragbits.document_search.documents.element import Element, ImageElement, TextElement
 from ragbits.document_search.ingestion.enrichers.base import ElementEnricher
 from ragbits.document_search.ingestion.enrichers.exceptions import EnricherElementNotSupportedError
-from ragbits.document_search.ingestion.enrichers.image import ImageDescriberPrompt, ImageElementEnricher
+from ragbits.document_search.ingestion.enrichers.image import (
+    ImageDescriberOutput,
+    ImageDescriberPrompt,
+    ImageElementEnricher,
+)
 
 
 def test_enricher_validates_supported_element_types() -> None:
@@ -106,3 +115,88 @@ async def test_image_enricher_call_fail() -> None:
     assert exc.value.message == f"Element type {TextElement} is not supported by the {ImageElementEnricher.__name__}"
     assert exc.value.element_type == TextElement
     assert exc.value.enricher_name == ImageElementEnricher.__name__
+
+
+def _create_image(color: str, size: tuple[int, int] = (8, 8)) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", size, color).save(output, format="PNG")
+    return output.getvalue()
+
+
+def _create_enricher(**kwargs: int | Path) -> tuple[ImageElementEnricher, AsyncMock]:
+    async def describe(prompt: ImageDescriberPrompt) -> ImageDescriberOutput:
+        await asyncio.sleep(0.01)
+        return ImageDescriberOutput(description=f"image {len(prompt.attachments[0].data)}")
+
+    generate = AsyncMock(side_effect=describe)
+    llm = LiteLLM(model_name="gpt-4o")
+    llm.generate = generate  # type: ignore[method-assign]
+    return ImageElementEnricher(llm=llm, **kwargs), generate  # type: ignore[arg-type]
+
+
+def _create_elements(images: Sequence[bytes]) -> list[ImageElement]:
+    return [
+        ImageElement(document_meta=DocumentMeta.from_literal("doc"), image_bytes=image_bytes) for image_bytes in images
+    ]
+
+
+async def test_image_enricher_describes_identical_images_once() -> None:
+    red, blue = _create_image("red"), _create_image("blue")
+    enricher, generate = _create_enricher()
+
+    enriched_elements = await enricher.enrich(_create_elements([red, blue, red]))
+    await enricher.enrich(_create_elements([blue, red]))
+
+    assert generate.await_count == 2
+    assert {call.args[0].attachments[0].data for call in generate.await_args_list} == {red, blue}
+    assert enriched_elements[0].description == enriched_elements[2].description == f"image {len(red)}"
+
+
+async def test_image_enricher_persists_descriptions(tmp_path: Path) -> None:
+    red, blue = _create_image("red"), _create_image("blue")
+    first_enricher, _ = _create_enricher(cache_path=tmp_path / "descriptions.db")
+    await first_enricher.enrich(_create_elements([red]))
+
+    second_enricher, generate = _create_enricher(cache_path=tmp_path / "descriptions.db")
+    enriched_elements = await second_enricher.enrich(_create_elements([red, blue]))
+
+    assert [call.args[0].attachments[0].data for call in generate.await_args_list] == [blue]
+    assert enriched_elements[0].description == f"image {len(red)}"
+
+
+async def test_image_enricher_limits_prompts_in_flight() -> None:
+    colors = ["red", "green", "blue", "white", "black"]
+    enricher, generate = _create_enricher(max_concurrency=2)
+    describe = generate.side_effect
+    in_flight = peak = 0
+
+    async def track(prompt: ImageDescriberPrompt) -> ImageDescriberOutput:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            return await describe(prompt)
+        finally:
+            in_flight -= 1
+
+    generate.side_effect = track
+    enriched_elements = await enricher.enrich(_create_elements([_create_image(color) for color in colors]))
+
+    assert peak == 2
+    assert generate.await_count == 5
+    assert all(element.description for element in enriched_elements)
+
+
+async def test_image_enricher_downscales_large_images() -> None:
+    large, small = _create_image("red", (200, 100)), _create_image("blue")
+    enricher, generate = _create_enricher(max_image_size=64)
+
+    enriched_elements = await enricher.enrich(_create_elements([large, small]))
+
+    uploads = {call.args[0].attachments[0].data for call in generate.await_args_list}
+    (uploaded_large,) = uploads - {small}
+    with Image.open(io.BytesIO(uploaded_large)) as image:
+        assert image.size == (64, 32)
+        assert image.format == "JPEG"
+    assert small in uploads
+    assert enriched_elements[0].image_bytes == large
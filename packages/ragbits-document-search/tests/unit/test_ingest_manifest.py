@@ -0,0 +1,135 @@
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from ragbits.core.embeddings.dense import CachedEmbedder, NoopEmbedder
+from ragbits.core.sources.local import LocalFileSource
+from ragbits.core.vector_stores.in_memory import InMemoryVectorStore
+from ragbits.document_search._main import DocumentSearch
+from ragbits.document_search.documents.document import DocumentMeta, DocumentType
+from ragbits.document_search.ingestion.manifest import (
+    IngestManifest,
+    InMemoryIngestManifest,
+    SQLiteIngestManifest,
+    document_fingerprint,
+)
+from ragbits.document_search.ingestion.parsers.base import TextDocumentParser
+from ragbits.document_search.ingestion.parsers.router import DocumentParserRouter
+
+
+class CustomTextDocumentParser(TextDocumentParser):
+    """
+    Text parser of a different type than the default one.
+    """
+
+
+def create_document_search(
+    manifest: IngestManifest, parser: TextDocumentParser | None = None, vector_store: InMemoryVectorStore | None = None
+) -> DocumentSearch:
+    return DocumentSearch(
+        vector_store=vector_store or InMemoryVectorStore(embedder=NoopEmbedder()),
+        parser_router=DocumentParserRouter({DocumentType.TXT: parser or TextDocumentParser()}),
+        manifest=manifest,
+    )
+
+
+def create_files(tmp_path: Path) -> list[Path]:
+    paths = [tmp_path / "brother.txt", tmp_path / "sister.txt"]
+    paths[0].write_text("Name of Peppa's brother is George")
+    paths[1].write_text("Name of Peppa's sister is Suzy")
+    return paths
+
+
+async def test_ingest_skips_unchanged_documents(tmp_path: Path) -> None:
+    paths = create_files(tmp_path)
+    document_search = create_document_search(InMemoryIngestManifest())
+
+    first = await document_search.ingest([LocalFileSource(path=path) for path in paths])
+    second = await document_search.ingest([LocalFileSource(path=path) for path in paths])
+
+    assert len(first.successful) == 2
+    assert len(first.skipped) == 0
+    assert len(second.successful) == 0
+    assert [result.document_uri for result in second.skipped] == [LocalFileSource(path=path).id for path in paths]
+    assert len(await document_search.vector_store.list()) == 2
+
+
+async def test_ingest_reingests_changed_documents(tmp_path: Path) -> None:
+    paths = create_files(tmp_path)
+    document_search = create_document_search(InMemoryIngestManifest())
+    await document_search.ingest([LocalFileSource(path=path) for path in paths])
+
+    paths[1].write_text("Name of Peppa's sister is Suzy Sheep")
+    results = await document_search.ingest([LocalFileSource(path=path) for path in paths])
+
+    assert [result.document_uri for result in results.successful] == [LocalFileSource(path=paths[1]).id]
+    assert [result.document_uri for result in results.skipped] == [LocalFileSource(path=paths[0]).id]
+    assert {entry.text for entry in await document_search.vector_store.list()} == {
+        "Name of Peppa's brother is George",
+        "Name of Peppa's sister is Suzy Sheep",
+    }
+
+
+async def test_ingest_reingests_documents_on_config_change(tmp_path: Path) -> None:
+    paths = create_files(tmp_path)
+    manifest = InMemoryIngestManifest()
+    vector_store = InMemoryVectorStore(embedder=NoopEmbedder())
+    await create_document_search(manifest, vector_store=vector_store).ingest(
+        [LocalFileSource(path=path) for path in paths]
+    )
+
+    results = await create_document_search(manifest, CustomTextDocumentParser(), vector_store).ingest(
+        [LocalFileSource(path=path) for path in paths]
+    )
+
+    assert len(results.successful) == 2
+    assert len(results.skipped) == 0
+
+
+async def test_ingest_manifest_shared_sqlite(tmp_path: Path) -> None:
+    paths = create_files(tmp_path)
+    vector_store = InMemoryVectorStore(embedder=NoopEmbedder())
+    await create_document_search(SQLiteIngestManifest(tmp_path / "manifest.db"), vector_store=vector_store).ingest(
+        [LocalFileSource(path=path) for path in paths]
+    )
+
+    results = await create_document_search(
+        SQLiteIngestManifest(tmp_path / "manifest.db"), vector_store=vector_store
+    ).ingest([DocumentMeta.from_local_path(path) for path in paths])
+
+    assert len(results.successful) == 0
+    assert len(results.skipped) == 2
+
+
+async def test_document_fingerprint_without_fetch(tmp_path: Path) -> None:
+    (path,) = create_files(tmp_path)[:1]
+    source = LocalFileSource(path=path)
+
+    with patch.object(LocalFileSource, "fetch", AsyncMock()) as fetch:
+        assert await document_fingerprint(source) == await source.fingerprint()
+
+    fetch.assert_not_called()
+
+
+async def test_document_fingerprint_of_source_without_fingerprint(tmp_path: Path) -> None:
+    (path,) = create_files(tmp_path)[:1]
+
+    with (
+        patch.object(LocalFileSource, "fingerprint", AsyncMock(return_value=None)),
+        patch.object(LocalFileSource, "fetch", AsyncMock()) as fetch,
+    ):
+        assert await document_fingerprint(LocalFileSource(path=path)) is None
+
+    fetch.assert_not_called()
+
+
+async def test_ingest_skips_unchanged_documents_with_cached_embedder(tmp_path: Path) -> None:
+    paths = create_files(tmp_path)
+    document_search = create_document_search(
+        InMemoryIngestManifest(), vector_store=InMemoryVectorStore(embedder=CachedEmbedder(NoopEmbedder()))
+    )
+
+    await document_search.ingest([LocalFileSource(path=path) for path in paths])
+    results = await document_search.ingest([LocalFileSource(path=path) for path in paths])
+
+    assert len(results.successful) == 0
+    assert len(results.skipped) == 2
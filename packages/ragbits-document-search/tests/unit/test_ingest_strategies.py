@@ -1,16 +1,20 @@
+import asyncio
 from pathlib import Path
 
 import pytest
 
 from ragbits.core.embeddings.dense import NoopEmbedder
+from ragbits.core.vector_stores.base import VectorStoreEntry
 from ragbits.core.vector_stores.in_memory import InMemoryVectorStore
-from ragbits.document_search.documents.document import DocumentMeta, DocumentType
+from ragbits.document_search.documents.document import Document, DocumentMeta, DocumentType
+from ragbits.document_search.documents.element import Element
 from ragbits.document_search.ingestion.enrichers.router import ElementEnricherRouter
 from ragbits.document_search.ingestion.parsers.base import TextDocumentParser
 from ragbits.document_search.ingestion.parsers.exceptions import ParserNotFoundError
 from ragbits.document_search.ingestion.parsers.router import DocumentParserRouter
 from ragbits.document_search.ingestion.strategies.base import IngestStrategy
 from ragbits.document_search.ingestion.strategies.batched import BatchedIngestStrategy
+from ragbits.document_search.ingestion.strategies.pipelined import PipelinedIngestStrategy
 from ragbits.document_search.ingestion.strategies.ray import RayDistributedIngestStrategy
 from ragbits.document_search.ingestion.strategies.sequential import SequentialIngestStrategy
 
@@ -20,9 +24,15 @@ from ragbits.document_search.ingestion.strategies.sequential import SequentialIn
     params=[
         SequentialIngestStrategy(num_retries=0),
         BatchedIngestStrategy(batch_size=2, num_retries=0),
+        PipelinedIngestStrategy(parse_concurrency=2, queue_size=1, num_retries=0),
         RayDistributedIngestStrategy(batch_size=1, enrich_batch_size=2, index_batch_size=2, num_retries=0),
     ],
-    ids=["SequentialIngestStrategy", "BatchedIngestStrategy", "RayDistributedIngestStrategy"],
+    ids=[
+        "SequentialIngestStrategy",
+        "BatchedIngestStrategy",
+        "PipelinedIngestStrategy",
+        "RayDistributedIngestStrategy",
+    ],
 )
 def ingest_strategy_fixture(request: pytest.FixtureRequest) -> IngestStrategy:
     return request.param
@@ -85,3 +95,29 @@ async def test_ingest_strategy_call_fail(ingest_strategy: IngestStrategy) -> Non
         assert result.error.stacktrace.startswith("Traceback")
         assert "No parser found for the document type" in result.error.stacktrace
         assert "No parser found for the document type" in result.error.message
+
+
+async def test_pipelined_ingest_strategy_overlaps_stages() -> None:
+    events: list[str] = []
+
+    class RecordingVectorStore(InMemoryVectorStore):
+        async def store(self, entries: list[VectorStoreEntry]) -> None:
+            events.append("index")
+            await asyncio.sleep(0.01)
+            await super().store(entries)
+
+    class RecordingParser(TextDocumentParser):
+        async def parse(self, document: Document) -> list[Element]:
+            events.append("parse")
+            return await super().parse(document)
+
+    documents = [DocumentMeta.from_literal(f"Document {i}") for i in range(4)]
+    results = await PipelinedIngestStrategy(parse_concurrency=1, index_concurrency=1, queue_size=1, num_retries=0)(
+        documents=documents,
+        vector_store=RecordingVectorStore(embedder=NoopEmbedder()),
+        parser_router=DocumentParserRouter({DocumentType.TXT: RecordingParser()}),
+        enricher_router=ElementEnricherRouter(),
+    )
+
+    assert len(results.successful) == 4
+    assert events.index("index") < len(events) - 1 - events[::-1].index("parse")
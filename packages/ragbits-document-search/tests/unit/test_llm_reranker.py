@@ -1,3 +1,4 @@
+import asyncio
 import math
 from collections.abc import Sequence
 from unittest.mock import AsyncMock, Mock
@@ -18,11 +19,16 @@ def mock_llm() -> AsyncMock:
     mock = AsyncMock(spec=LiteLLM)
     mock.model_name = "gpt-3.5-turbo"
     mock.default_options = LiteLLMOptions()
-    mock.generate_with_metadata.side_effect = [
+    responses = [
         LLMResponseWithMetadata(content="Yes", metadata={"logprobs": [{"logprob": math.log(0.9)}]}),  # High relevance
         LLMResponseWithMetadata(content="No", metadata={"logprobs": [{"logprob": math.log(0.6)}]}),  # Low relevance
         LLMResponseWithMetadata(content="Yes", metadata={"logprobs": [{"logprob": math.log(0.6)}]}),  # Medium relevance
     ]
+
+    async def generate_with_metadata(prompt: RerankerPrompt, options: LiteLLMOptions) -> LLMResponseWithMetadata:
+        return responses.pop(0)
+
+    mock.generate_with_metadata.side_effect = generate_with_metadata
     return mock
 
 
@@ -107,3 +113,56 @@ async def test_llm_reranker_rerank(mock_llm: AsyncMock, sample_elements: Sequenc
     flat_elements = [element for item in sample_elements for element in item]
     assert result[0] == flat_elements[0]  # First element had the highest score
     assert result[1] == flat_elements[2]  # Third element had the second-highest score
+
+
+async def test_llm_reranker_limits_concurrency(
+    mock_llm: AsyncMock, sample_elements: Sequence[Sequence[TextElement]]
+) -> None:
+    generate_with_metadata = mock_llm.generate_with_metadata.side_effect
+    in_flight = peak = 0
+
+    async def slow_generate_with_metadata(prompt: RerankerPrompt, options: LiteLLMOptions) -> LLMResponseWithMetadata:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        response = await generate_with_metadata(prompt, options)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return response
+
+    mock_llm.generate_with_metadata.side_effect = slow_generate_with_metadata
+    reranker = LLMReranker(llm=mock_llm)
+    result = await reranker.rerank(
+        elements=sample_elements,
+        query="Python programming",
+        options=LLMRerankerOptions(max_concurrency=2),
+    )
+
+    assert peak == 2
+    assert mock_llm.generate_with_metadata.call_count == 3
+    flat_elements = [element for item in sample_elements for element in item]
+    assert result == [flat_elements[0], flat_elements[2], flat_elements[1]]
+
+
+async def test_llm_reranker_scores_duplicates_once(mock_llm: AsyncMock) -> None:
+    elements = [
+        [TextElement(content="Python programming", document_meta=Mock(spec=DocumentMeta))],
+        [TextElement(content="Python programming", document_meta=Mock(spec=DocumentMeta))],
+    ]
+    reranker = LLMReranker(llm=mock_llm)
+    result = await reranker.rerank(elements=elements, query="Python")
+
+    mock_llm.generate_with_metadata.assert_called_once()
+    assert [element.score for element in result] == pytest.approx([0.9, 0.9])
+
+
+async def test_llm_reranker_stops_early(mock_llm: AsyncMock, sample_elements: Sequence[Sequence[TextElement]]) -> None:
+    reranker = LLMReranker(llm=mock_llm)
+    result = await reranker.rerank(
+        elements=sample_elements,
+        query="Python programming",
+        options=LLMRerankerOptions(top_n=1, max_concurrency=1, early_stop_score=0.8),
+    )
+
+    mock_llm.generate_with_metadata.assert_called_once()
+    assert result == [sample_elements[0][0]]
@@ -0,0 +1,151 @@
+import asyncio
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ragbits.core.audit.metrics import clear_metric_handlers, set_metric_handlers
+from ragbits.core.audit.metrics.base import MetricHandler, MetricType
+from ragbits.core.embeddings.dense import NoopEmbedder
+from ragbits.core.vector_stores.base import VectorStoreOptions
+from ragbits.core.vector_stores.in_memory import InMemoryVectorStore
+from ragbits.document_search._main import DocumentSearch, DocumentSearchOptions
+from ragbits.document_search.documents.document import DocumentMeta, DocumentType
+from ragbits.document_search.documents.element import TextElement
+from ragbits.document_search.ingestion.parsers.base import TextDocumentParser
+from ragbits.document_search.ingestion.parsers.router import DocumentParserRouter
+from ragbits.document_search.retrieval.cache import SearchResultCache, SQLiteSearchCacheBackend
+
+
+class RecordingMetricHandler(MetricHandler):
+    """
+    A metric handler recording the names and values of the metrics.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[tuple[str, int | float]] = []
+
+    def create_metric(  # noqa: PLR6301
+        self, name: str, unit: str = "", description: str = "", metric_type: MetricType = MetricType.HISTOGRAM
+    ) -> str:
+        return name
+
+    def _record(self, metric: str, value: int | float, attributes: dict | None = None) -> None:
+        self.records.append((metric, value))
+
+
+@pytest.fixture(name="metric_handler")
+def metric_handler_fixture() -> Iterator[RecordingMetricHandler]:
+    handler = RecordingMetricHandler()
+    set_metric_handlers(handler)
+    yield handler
+    clear_metric_handlers()
+
+
+async def create_document_search(cache: SearchResultCache) -> DocumentSearch:
+    document_search: DocumentSearch = DocumentSearch(
+        vector_store=InMemoryVectorStore(embedder=NoopEmbedder()),
+        parser_router=DocumentParserRouter({DocumentType.TXT: TextDocumentParser()}),
+        cache=cache,
+    )
+    await document_search.ingest([DocumentMeta.from_literal("Name of Peppa's brother is George")])
+    return document_search
+
+
+async def test_search_served_from_cache(metric_handler: RecordingMetricHandler) -> None:
+    document_search = await create_document_search(SearchResultCache())
+    document_search.vector_store.retrieve_many = AsyncMock(wraps=document_search.vector_store.retrieve_many)  # type: ignore
+
+    first = await document_search.search("Peppa's  brother")
+    second = await document_search.search("peppa's brother")
+
+    assert document_search.vector_store.retrieve_many.call_count == 1  # type: ignore
+    assert second == first
+    assert isinstance(second[0], TextElement)
+    assert metric_handler.records == [("ragbits_search_cache_misses", 1), ("ragbits_search_cache_hits", 1)]
+
+
+async def test_search_cache_keyed_on_options() -> None:
+    document_search = await create_document_search(SearchResultCache())
+    await document_search.ingest([DocumentMeta.from_literal("Name of Peppa's sister is Suzy")])
+
+    assert len(await document_search.search("Peppa")) == 2
+    one_result = await document_search.search(
+        "Peppa", options=DocumentSearchOptions(vector_store_options=VectorStoreOptions(k=1))
+    )
+
+    assert len(one_result) == 1
+
+
+async def test_search_cache_invalidated_on_vector_store_change() -> None:
+    document_search = await create_document_search(SearchResultCache())
+    assert len(await document_search.search("Peppa")) == 1
+
+    await document_search.ingest([DocumentMeta.from_literal("Name of Peppa's sister is Suzy")])
+    assert len(await document_search.search("Peppa")) == 2
+
+    entries = await document_search.vector_store.list()
+    await document_search.vector_store.remove([entries[0].id])
+    assert len(await document_search.search("Peppa")) == 1
+
+
+async def test_search_cache_skips_results_of_search_started_before_invalidation() -> None:
+    document_search = await create_document_search(SearchResultCache())
+    retrieve_many = document_search.vector_store.retrieve_many
+    searching, resumed = asyncio.Event(), asyncio.Event()
+
+    async def slow_retrieve_many(*args, **kwargs):  # noqa: ANN002, ANN003, ANN202
+        results = await retrieve_many(*args, **kwargs)
+        searching.set()
+        await resumed.wait()
+        return results
+
+    document_search.vector_store.retrieve_many = slow_retrieve_many  # type: ignore
+    search = asyncio.create_task(document_search.search("Peppa"))
+    await searching.wait()
+    document_search.vector_store.retrieve_many = retrieve_many  # type: ignore
+    await document_search.ingest([DocumentMeta.from_literal("Name of Peppa's sister is Suzy")])
+    resumed.set()
+
+    assert len(await search) == 1
+    assert len(await document_search.search("Peppa")) == 2
+
+
+async def test_search_cache_ttl_and_lru() -> None:
+    cache = SearchResultCache(max_entries=1, ttl=0.0)
+    element = TextElement(content="George", document_meta=DocumentMeta.from_literal("George"))
+
+    await cache.set("expired", [element])
+    assert await cache.get("expired") is None
+
+    cache.ttl = None
+    await cache.set("evicted", [element])
+    await cache.set("kept", [element])
+    assert await cache.get("evicted") is None
+    assert await cache.get("kept") == [element]
+
+
+async def test_search_cache_shared_sqlite_backend(tmp_path: Path) -> None:
+    element = TextElement(content="George", document_meta=DocumentMeta.from_literal("George"), score=0.5)
+    writer = SearchResultCache(backend=SQLiteSearchCacheBackend(tmp_path / "cache.db"))
+    reader = SearchResultCache(backend=SQLiteSearchCacheBackend(tmp_path / "cache.db"))
+
+    await writer.set("key", [element])
+    assert await reader.get("key") == [element]
+
+    await writer.invalidate()
+    reader._memory.clear()
+    assert await reader.get("key") is None
+
+
+async def test_search_cache_backend_not_queried_on_memory_hit() -> None:
+    backend = MagicMock(SQLiteSearchCacheBackend)
+    cache = SearchResultCache(backend=backend)
+    element = TextElement(content="George", document_meta=DocumentMeta.from_literal("George"))
+
+    await cache.set("key", [element])
+
+    assert await cache.get("key") == [element]
+    backend.get.assert_not_called()